@@ -35,6 +35,7 @@ __pdoc__ = {
     'models.data_file.DataFileSchema.opts': False,
     'models.data_file.DataFileSelectorSchema': False,
     'models.fields': False,
+    'models.loader': False,
     'models.organisation.OrganisationSchema.Meta': False,
     'models.organisation.OrganisationSchema.opts': False,
     'models.organisation.OrganisationUserSchema': False,
@@ -117,6 +118,10 @@ import logging
 import os
 
 from .session import Session
+from .offload_session import OffloadSession
+from .common.profiler import Profiler
+from .download_manager import DownloadManager
+from .models.model import Model
 from .models.user import User
 
 # Find the package root directory.
@@ -168,6 +173,36 @@ def login(email=None, user_id=None, password=None, api_url=None, session_options
     return User._model_from_api_id(session, id=session.user_id)
 
 
+def profile(output=None, classes=None):
+    """
+    Starts profiling the SDK. The wall time, CPU time and net number of allocated memory blocks are recorded for each call to the public methods of the session,
+    download manager and models, together with the loading of models from API responses. When the process exits, a report sorted by wall time is written to the
+    optional output file or, if its name ends with ".pstats", a cProfile statistics file.
+
+    Profiling can also be enabled by setting the FUSION_PLATFORM_PROFILE environment variable to the output file name.
+
+    Args:
+        output: The optional output file name.
+        classes: The optional list of additional classes whose public methods should also be profiled.
+
+    Returns:
+        The profiler, which can be used to obtain the statistics or to stop profiling.
+    """
+    models = []
+    subclasses = [Model]
+
+    while len(subclasses) > 0:
+        model = subclasses.pop()
+        models.append(model)
+        subclasses.extend(model.__subclasses__())
+
+    profiler = Profiler()
+    profiler.instrument([Session, DownloadManager] + models + (classes or []), names=['_set_model_from_response'])
+    profiler.start(output)
+
+    return profiler
+
+
 def set_log_level(level):
     """
     Sets the logging level for the SDK.
@@ -177,3 +212,8 @@ def set_log_level(level):
     """
     logger = logging.getLogger(FUSION_PLATFORM_LOGGER)
     logger.setLevel(level)
+
+
+# Optionally start profiling as soon as the SDK is imported.
+if os.environ.get(Profiler.ENVIRONMENT_VARIABLE):
+    profile(os.environ.get(Profiler.ENVIRONMENT_VARIABLE))
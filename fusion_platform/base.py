@@ -22,18 +22,33 @@ class Base:
     Base class used by all classes within the SDK to set up common elements.
     """
 
+    # The SDK logger, which is shared by all objects.
+    _logger = logging.getLogger(fusion_platform.FUSION_PLATFORM_LOGGER)
+
+    # Whether the common elements have been set up.
+    __initialised = False
+
     def __init__(self):
         """
-        Initialises the object.
+        Initialises the object. The common elements are only set up when the first object is created, so that creating the many models built from each page of
+        results is cheap.
         """
+        if not Base.__initialised:
+            Base._initialise()
 
+    @classmethod
+    def _initialise(cls):
+        """
+        Sets up the common elements used by all objects. This is performed once, when the first object is created.
+        """
         # Set up localisation.
         Localise.setup()
 
         # Set up logging.
         logging.basicConfig(format='%(asctime)s.%(msecs)03d [%(levelname)s] %(filename)s:%(funcName)s:%(lineno)d - %(message)s')
-        self._logger = logging.getLogger(fusion_platform.FUSION_PLATFORM_LOGGER)
-        self._logger.debug('sdk %s (%s): %s', fusion_platform.__version__, fusion_platform.__version_date__, self.__class__.__name__)
+        Base._logger.debug('sdk %s (%s)', fusion_platform.__version__, fusion_platform.__version_date__)
+
+        Base.__initialised = True
 
     @classmethod
     def main(cls):
@@ -9,6 +9,7 @@ author: Matthew Casey
 import argparse
 from argparse import RawTextHelpFormatter
 from collections import defaultdict
+from concurrent.futures import wait as wait_for_futures
 from copy import deepcopy
 import csv
 from datetime import datetime, timedelta, timezone
@@ -42,7 +43,7 @@ from fusion_platform.base import Base
 from fusion_platform.common.utilities import json_default, string_blank
 from fusion_platform.models.data import Data
 from fusion_platform.models.model import Model
-from fusion_platform.session import RequestError
+from fusion_platform.session import RequestError, Session
 
 
 class CommandError(Exception):
@@ -110,6 +111,9 @@ class Command(Base):
     # Process other field constants.
     _MODEL_FIELDS = ['output_storage_period', 'run_type', 'repeat_count', 'repeat_start', 'repeat_end', 'repeat_gap', 'repeat_offset']
 
+    # Number of upcoming list pages fetched while each page is processed, as listings are often processed with further requests for each item.
+    _LIST_PREFETCH = 2
+
     # Storage constants.
     _STORAGE_NAME = 'storage.tar.gz'  # Must match the engine TaskManager#STORAGE_NAME.
 
@@ -396,7 +400,7 @@ class Command(Base):
                 progress_bar.close()
 
         # Download the files.
-        self.__download_files(downloads)
+        self.__download_files(process._session, downloads)
 
         # Build the definition.
         process_definition = {
@@ -649,11 +653,12 @@ class Command(Base):
 
         return downloads, metrics
 
-    def __download_files(self, downloads):
+    def __download_files(self, session, downloads):
         """
         Downloads the files from the downloads list.
 
         Args:
+            session: The session whose download manager is used for the downloads.
             downloads: A list of tuples with the file model, the download path and file size.
         """
         downloads = [] if downloads is None else downloads
@@ -667,50 +672,32 @@ class Command(Base):
                                 unit_divisor=1024)  # Show progress in bytes.
 
             try:
-                # Do all the downloads in batches. We use small batches so that we do not swamp memory.
-                batch_size = 2 * os.cpu_count()  # Downloads don't swamp CPU.
-
-                for batch in [downloads[i:i + batch_size] for i in range(0, len(downloads), batch_size)]:
-                    download_files = []
-
-                    # Start downloading the batch.
-                    for file, path, size in batch:
-                        file.download(path=path, wait=False)
-                        download_files.append((file, False, 0, size))
-
-                    # Check the status of the batch of downloads so that we know when we have finished, updating the progress bar as we go.
-                    finished = False
-                    last_total_current_size = 0
+                # Submit all the downloads to the session's download manager, which bounds the number of concurrent downloads. The bytes downloaded for each file
+                # are tracked through its own callback, so that other downloads using the same session do not affect the progress.
+                download_sizes = [0] * len(downloads)
 
-                    while not finished:
-                        # Wait a bit before checking progress again.
-                        sleep(0.25)
+                def download_callback(index, url, destination, size):
+                    download_sizes[index] = size
 
-                        # Now work out haw far we've got.
-                        total_current_size = 0
-                        count_complete = 0
+                pending = {session.download_manager.submit(file, path, callback=partial(download_callback, i)): i for i, (file, path, _) in enumerate(downloads)}
+                last_total_current_size = 0
 
-                        for i in range(len(download_files)):
-                            file, complete, current_size, download_size = download_files[i]
+                # Check the status of the downloads so that we know when we have finished, updating the progress bar as we go.
+                while len(pending) > 0:
+                    done, _ = wait_for_futures(list(pending.keys()), timeout=0.25)
 
-                            if not complete:
-                                # Get the current download size.
-                                _, _, current_size = file.download_progress()
+                    # This will raise an exception if any download has failed. A download which finished without any progress, such as one which was already
+                    # complete, is counted in full.
+                    for future in done:
+                        future.result()
+                        i = pending.pop(future)
+                        _, _, size = downloads[i]
+                        download_sizes[i] = size if size is not None else download_sizes[i]
 
-                                # Now check for completion.
-                                complete = file.download_complete()
-                                download_files[i] = (file, complete, current_size, download_size)
-
-                            count_complete += 1 if complete else 0
-                            total_current_size += current_size
-
-                        # Increment the progress bar.
-                        update_current_size = total_current_size - last_total_current_size
-                        last_total_current_size = total_current_size
-                        progress_bar.update(update_current_size)
-
-                        # Check if we have finished.
-                        finished = count_complete == len(download_files)
+                    # Increment the progress bar.
+                    total_current_size = sum(download_sizes)
+                    progress_bar.update(total_current_size - last_total_current_size)
+                    last_total_current_size = total_current_size
 
             finally:
                 # Make sure the progress bar is closed.
@@ -813,7 +800,7 @@ class Command(Base):
 
         # Download the files unless we only want the stac information
         if not stac_only:
-            self.__download_files(downloads)
+            self.__download_files(process._session, downloads)
 
         # Save the metrics to file.
         if save_metrics and (len(metrics) > 0):
@@ -1131,7 +1118,8 @@ class Command(Base):
             password = self.__get_input(i18n.t('command.password'), is_password=True)
 
             try:
-                user = fusion_platform.login(email=email, password=password, api_url=Command.DEPLOYMENTS[deployment]['url'])
+                user = fusion_platform.login(email=email, password=password, api_url=Command.DEPLOYMENTS[deployment]['url'],
+                                             session_options={Session.LIST_PREFETCH: Command._LIST_PREFETCH})
                 break
             except RequestError as e:
                 count += 1
@@ -1174,6 +1162,10 @@ class Command(Base):
         else:
             self.__print_level = logging.INFO
 
+        # Optionally profile the SDK and the command itself.
+        if arguments.profile is not None:
+            fusion_platform.profile(arguments.profile, classes=[Command])
+
         try:
             # Login to the correct deployment and select the organisation.
             organisation, _, _ = self.login(arguments.deployment, arguments.email, arguments.organisation)
@@ -1283,6 +1275,7 @@ class Command(Base):
             subparser.add_argument(i18n.t('command.organisation_short'), i18n.t('command.organisation_long'), help=i18n.t('command.organisation_help'))
             subparser.add_argument(i18n.t('command.debug_short'), i18n.t('command.debug_long'), help=i18n.t('command.debug_help'), default=False,
                                    action="store_true")
+            subparser.add_argument(i18n.t('command.profile_short'), i18n.t('command.profile_long'), help=i18n.t('command.profile_help'))
 
         # Display arguments.
         parser_display.add_argument(i18n.t('command.display.service_or_process_long'), help=i18n.t('command.display.service_or_process_help'), nargs='+')
@@ -0,0 +1,235 @@
+"""
+Metrics class file.
+
+author: Matthew Casey
+
+&copy; [Digital Content Analysis Technology Ltd](https://www.d-cat.co.uk)
+"""
+
+import re
+from threading import Lock
+
+
+class TemplatedPath(str):
+    """
+    A request path which remembers the template from which it was constructed, so that metrics can be recorded against the template rather than each individual
+    path.
+    """
+
+    # Pattern used to replace ids in paths which do not have a template.
+    _ID_PATTERN = re.compile(r'/[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}(?=/|$)')
+
+    def __new__(cls, path, template):
+        """
+        Creates the path.
+
+        Args:
+            path: The constructed path.
+            template: The template from which the path was constructed.
+
+        Returns:
+            The path.
+        """
+        templated_path = super(TemplatedPath, cls).__new__(cls, path)
+        templated_path.template = template
+
+        return templated_path
+
+    @staticmethod
+    def template_of(path):
+        """
+        Gets the template for a path. Paths which do not have a template have any ids replaced with a placeholder.
+
+        Args:
+            path: The path.
+
+        Returns:
+            The template.
+        """
+        template = getattr(path, 'template', None)
+
+        return template if template is not None else TemplatedPath._ID_PATTERN.sub('/{id}', str(path))
+
+
+class Histogram:
+    """
+    Records the distribution of observed values in cumulative buckets, together with their count and sum.
+    """
+
+    def __init__(self, buckets):
+        """
+        Initialises the object.
+
+        Args:
+            buckets: The upper bounds of the buckets.
+        """
+        self.__buckets = sorted(buckets)
+        self.__counts = [0] * len(self.__buckets)
+        self.__count = 0
+        self.__sum = 0.0
+
+    def observe(self, value):
+        """
+        Records an observed value. This is not thread-safe, and so must be called under the lock of the owning registry.
+
+        Args:
+            value: The observed value.
+        """
+        for index, bucket in enumerate(self.__buckets):
+            if value <= bucket:
+                self.__counts[index] += 1
+
+        self.__count += 1
+        self.__sum += value
+
+    def snapshot(self):
+        """
+        Returns:
+            A dictionary of the cumulative bucket counts keyed by their upper bound, the count and the sum.
+        """
+        return {'buckets': dict(zip(self.__buckets, self.__counts)), 'count': self.__count, 'sum': self.__sum}
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of counters and histograms, each of which is keyed by a name and a set of labels. The registry can be shared by several sessions, and
+    its contents obtained as a snapshot or exported in the Prometheus text format.
+    """
+
+    # Prefix given to all exported metric names.
+    PREFIX = 'fusion_platform_'
+
+    # Default histogram bucket upper bounds in seconds.
+    BUCKETS_DEFAULT = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300]
+
+    def __init__(self, buckets=None):
+        """
+        Initialises the object.
+
+        Args:
+            buckets: The optional histogram bucket upper bounds. Defaults to BUCKETS_DEFAULT.
+        """
+        self.__buckets = MetricsRegistry.BUCKETS_DEFAULT if buckets is None else buckets
+        self.__lock = Lock()
+        self.__counters = {}
+        self.__histograms = {}
+
+    @staticmethod
+    def __escape(value):
+        """
+        Escapes a label value for the Prometheus text format.
+
+        Args:
+            value: The label value.
+
+        Returns:
+            The escaped value.
+        """
+        return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+    @staticmethod
+    def __format_labels(labels, extra=None):
+        """
+        Formats labels for the Prometheus text format.
+
+        Args:
+            labels: The labels as a tuple of name and value pairs.
+            extra: The optional extra label as a name and value pair.
+
+        Returns:
+            The formatted labels, which are empty if there are none.
+        """
+        labels = list(labels) + ([extra] if extra is not None else [])
+
+        if len(labels) <= 0:
+            return ''
+
+        formatted = ','.join(['{}="{}"'.format(name, MetricsRegistry.__escape(value)) for name, value in labels])
+
+        return f"{{{formatted}}}"
+
+    def increment(self, name, labels=None, value=1):
+        """
+        Increments a counter.
+
+        Args:
+            name: The counter name.
+            labels: The optional labels as a dictionary.
+            value: The optional amount by which to increment the counter. Default 1.
+        """
+        key = tuple(sorted((labels or {}).items()))
+
+        with self.__lock:
+            counters = self.__counters.setdefault(name, {})
+            counters[key] = counters.get(key, 0) + value
+
+    def observe(self, name, value, labels=None):
+        """
+        Records an observed value in a histogram.
+
+        Args:
+            name: The histogram name.
+            value: The observed value.
+            labels: The optional labels as a dictionary.
+        """
+        key = tuple(sorted((labels or {}).items()))
+
+        with self.__lock:
+            histograms = self.__histograms.setdefault(name, {})
+            histogram = histograms.get(key)
+
+            if histogram is None:
+                histogram = Histogram(self.__buckets)
+                histograms[key] = histogram
+
+            histogram.observe(value)
+
+    def reset(self):
+        """
+        Removes all recorded metrics.
+        """
+        with self.__lock:
+            self.__counters.clear()
+            self.__histograms.clear()
+
+    def snapshot(self):
+        """
+        Takes a consistent copy of all the recorded metrics.
+
+        Returns:
+            A dictionary with the counters and histograms. Each maps a name to a dictionary keyed by the labels as a tuple of name and value pairs.
+        """
+        with self.__lock:
+            counters = {name: dict(values) for name, values in self.__counters.items()}
+            histograms = {name: {labels: histogram.snapshot() for labels, histogram in values.items()} for name, values in self.__histograms.items()}
+
+        return {'counters': counters, 'histograms': histograms}
+
+    def to_prometheus(self):
+        """
+        Exports the recorded metrics in the Prometheus text exposition format.
+
+        Returns:
+            The metrics as text.
+        """
+        snapshot = self.snapshot()
+        lines = []
+
+        for name, values in sorted(snapshot['counters'].items()):
+            lines.append(f"# TYPE {MetricsRegistry.PREFIX}{name} counter")
+
+            for labels, value in sorted(values.items()):
+                lines.append(f"{MetricsRegistry.PREFIX}{name}{MetricsRegistry.__format_labels(labels)} {value}")
+
+        for name, values in sorted(snapshot['histograms'].items()):
+            lines.append(f"# TYPE {MetricsRegistry.PREFIX}{name} histogram")
+
+            for labels, histogram in sorted(values.items()):
+                for bucket, count in histogram['buckets'].items():
+                    lines.append(f"{MetricsRegistry.PREFIX}{name}_bucket{MetricsRegistry.__format_labels(labels, ('le', bucket))} {count}")
+
+                lines.append(f"{MetricsRegistry.PREFIX}{name}_bucket{MetricsRegistry.__format_labels(labels, ('le', '+Inf'))} {histogram['count']}")
+                lines.append(f"{MetricsRegistry.PREFIX}{name}_count{MetricsRegistry.__format_labels(labels)} {histogram['count']}")
+                lines.append(f"{MetricsRegistry.PREFIX}{name}_sum{MetricsRegistry.__format_labels(labels)} {histogram['sum']}")
+
+        return '\n'.join(lines) + '\n' if len(lines) > 0 else ''
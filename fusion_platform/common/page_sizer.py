@@ -0,0 +1,80 @@
+"""
+Page sizer class file.
+
+author: Matthew Casey
+
+&copy; [Digital Content Analysis Technology Ltd](https://www.d-cat.co.uk)
+"""
+
+import math
+
+
+class PageSizer:
+    """
+    Adapts the number of items requested for each page of a list. The page size grows geometrically while each page is obtained within the time and size
+    targets, so that long lists need far fewer requests, and shrinks multiplicatively when a page misses either target. Growth is also capped at the page size
+    expected to reach the size target, based upon the size of the items in the previous page.
+
+    Without a maximum page size, the page size is fixed.
+    """
+
+    def __init__(self, size, maximum=None, time_target=None, bytes_target=None, growth=2.0, decrease=0.5):
+        """
+        Initialises the object.
+
+        Args:
+            size: The number of items requested for the first page.
+            maximum: The optional maximum number of items requested for each page. Default None, which does not adapt the page size.
+            time_target: The optional maximum time in seconds to obtain a page within which the page size can grow. Default None, which does not limit the time.
+            bytes_target: The optional maximum size in bytes of a page within which the page size can grow. Default None, which does not limit the size.
+            growth: The optional factor by which the page size is multiplied when a page is within the targets. Default 2.
+            decrease: The optional factor by which the page size is multiplied when a page misses either target. Default 0.5.
+        """
+        self.__size = max(1, size)
+        self.__maximum = max(self.__size, maximum) if maximum is not None else None
+        self.__time_target = time_target
+        self.__bytes_target = bytes_target
+        self.__growth = growth
+        self.__decrease = decrease
+
+    @property
+    def adaptive(self):
+        """
+        Returns:
+            True if the page size is adapted.
+        """
+        return self.__maximum is not None
+
+    @property
+    def size(self):
+        """
+        Returns:
+            The number of items to request for the next page.
+        """
+        return self.__size
+
+    def update(self, duration, items, length):
+        """
+        Adapts the page size using the outcome of obtaining a page.
+
+        Args:
+            duration: The time in seconds taken to obtain the page.
+            items: The number of items in the page.
+            length: The size of the page in bytes.
+        """
+        if (not self.adaptive) or (items <= 0):
+            return
+
+        within_time = (self.__time_target is None) or (duration <= self.__time_target)
+        within_bytes = (self.__bytes_target is None) or (length <= self.__bytes_target)
+
+        if within_time and within_bytes:
+            size = math.ceil(self.__size * self.__growth)
+
+            # Do not grow beyond the page size which is expected to reach the size target.
+            if (self.__bytes_target is not None) and (length > 0):
+                size = min(size, math.floor(self.__bytes_target * items / length))
+
+            self.__size = max(self.__size, min(self.__maximum, size))
+        else:
+            self.__size = max(1, math.floor(self.__size * self.__decrease))
@@ -0,0 +1,163 @@
+"""
+Prefetcher class file.
+
+author: Matthew Casey
+
+&copy; [Digital Content Analysis Technology Ltd](https://www.d-cat.co.uk)
+"""
+
+import contextvars
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+
+
+class Prefetcher:
+    """
+    Iterates through an iterator on a background thread, so that its upcoming items are obtained while the current item is being consumed. At most the depth number
+    of items are held waiting to be consumed, together with the item being obtained, so that memory is bounded. The iterator is run in a copy of the context from
+    which the prefetcher was created, so that context variables such as the current tracing span are carried over to the thread. Any error raised by the iterator is
+    raised when the corresponding item would have been consumed.
+
+    Several iterators can also be interleaved using #interleave, so that each is iterated concurrently on its own background thread.
+
+    The prefetcher should be closed if it is not iterated to the end. The background threads then stop before obtaining another item, and the iterators are
+    closed.
+    """
+
+    # How long in seconds a background thread waits for space to hold an item before checking whether the prefetcher has been closed.
+    _POLL_PERIOD = 0.1
+
+    # Entry types held in the queue.
+    _ENTRY_ITEM = 'item'
+    _ENTRY_ERROR = 'error'
+    _ENTRY_END = 'end'
+
+    def __init__(self, iterator, depth, thread_name='prefetcher'):
+        """
+        Initialises the object, starting the background thread.
+
+        Args:
+            iterator: The iterator to prefetch.
+            depth: The maximum number of items held waiting to be consumed.
+            thread_name: The optional name of the background thread.
+        """
+        self.__start([iterator], depth, [thread_name], False)
+
+    def close(self):
+        """
+        Closes the prefetcher, stopping the background threads and releasing any items waiting to be consumed.
+        """
+        self.__closed.set()
+        self.__running = 0
+
+        while True:
+            try:
+                self.__queue.get_nowait()
+            except Empty:
+                break
+
+    @classmethod
+    def interleave(cls, iterators, depth, thread_name_prefix='prefetcher'):
+        """
+        Creates a prefetcher which iterates through each of the iterators concurrently on its own background thread. Each item is given together with the index
+        of its iterator, in the order in which the items are obtained. The items from each iterator remain in order.
+
+        Args:
+            iterators: The list of iterators to prefetch.
+            depth: The maximum number of items held waiting to be consumed for each iterator.
+            thread_name_prefix: The optional prefix used to name the background threads.
+
+        Returns:
+            The prefetcher, which gives tuples of the iterator index and item.
+        """
+        prefetcher = cls.__new__(cls)
+        prefetcher.__start(iterators, depth * len(iterators), [f"{thread_name_prefix}_{index + 1}" for index in range(len(iterators))], True)
+
+        return prefetcher
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while self.__running > 0:
+            entry_type, index, value = self.__queue.get()
+
+            if entry_type == Prefetcher._ENTRY_ITEM:
+                return (index, value) if self.__indexed else value
+
+            if entry_type == Prefetcher._ENTRY_ERROR:
+                self.close()
+                raise value
+
+            self.__running -= 1
+
+        self.close()
+        raise StopIteration
+
+    def __put(self, entry_type, index, value=None):
+        """
+        Waits until there is space to hold an entry, unless the prefetcher is closed.
+
+        Args:
+            entry_type: The entry type.
+            index: The index of the iterator.
+            value: The optional entry value.
+
+        Returns:
+            True if the entry is held, otherwise False if the prefetcher has been closed.
+        """
+        while not self.__closed.is_set():
+            try:
+                self.__queue.put((entry_type, index, value), timeout=Prefetcher._POLL_PERIOD)
+                return True
+            except Full:
+                pass
+
+        return False
+
+    def __run(self, index, iterator):
+        """
+        Obtains the items from an iterator until it is exhausted, it raises an error or the prefetcher is closed.
+
+        Args:
+            index: The index of the iterator.
+            iterator: The iterator.
+        """
+        try:
+            while not self.__closed.is_set():
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    self.__put(Prefetcher._ENTRY_END, index)
+                    break
+
+                if not self.__put(Prefetcher._ENTRY_ITEM, index, item):
+                    break
+
+        except Exception as e:
+            self.__put(Prefetcher._ENTRY_ERROR, index, e)
+
+        finally:
+            # Generators can only be closed by the thread which runs them.
+            close = getattr(iterator, 'close', None)
+
+            if close is not None:
+                close()
+
+    def __start(self, iterators, size, thread_names, indexed):
+        """
+        Starts a background thread for each iterator.
+
+        Args:
+            iterators: The list of iterators.
+            size: The maximum number of items held waiting to be consumed.
+            thread_names: The name of each background thread.
+            indexed: Are the items given together with the index of their iterator?
+        """
+        self.__queue = Queue(maxsize=max(1, size))
+        self.__closed = Event()
+        self.__running = len(iterators)
+        self.__indexed = indexed
+
+        for index, iterator in enumerate(iterators):
+            Thread(target=contextvars.copy_context().run, args=(self.__run, index, iterator), name=thread_names[index], daemon=True).start()
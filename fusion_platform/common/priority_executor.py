@@ -0,0 +1,128 @@
+"""
+Priority executor class file.
+
+author: Matthew Casey
+
+&copy; [Digital Content Analysis Technology Ltd](https://www.d-cat.co.uk)
+"""
+
+from concurrent.futures import Future
+import contextvars
+from functools import partial
+from itertools import count
+from queue import Empty, PriorityQueue
+from threading import current_thread, Lock, Thread
+
+
+class PriorityExecutor:
+    """
+    Executor which runs submitted tasks on a bounded number of worker threads, taking the task with the lowest priority value first. Tasks with the same priority
+    are run in the order they were submitted. Workers are started as tasks are submitted and finish as soon as there are no more queued tasks, so an idle executor
+    holds no threads. Each task is run in a copy of the context from which it was submitted, so that context variables such as the current tracing span are
+    carried over to the worker.
+    """
+
+    def __init__(self, max_workers, thread_name_prefix='priority_executor'):
+        """
+        Initialises the object.
+
+        Args:
+            max_workers: The maximum number of tasks which can run concurrently.
+            thread_name_prefix: The optional prefix used to name the worker threads.
+        """
+        self.__max_workers = max(1, max_workers)
+        self.__thread_name_prefix = thread_name_prefix
+        self.__queue = PriorityQueue()
+        self.__sequence = count()
+        self.__lock = Lock()
+        self.__workers = set()
+        self.__shutdown = False
+
+    @property
+    def max_workers(self):
+        """
+        Returns:
+            The maximum number of tasks which can run concurrently.
+        """
+        return self.__max_workers
+
+    def shutdown(self, wait=False, cancel_futures=False):
+        """
+        Prevents any further tasks from being submitted. Tasks which are already queued are still run, unless they are cancelled.
+
+        Args:
+            wait: Optionally wait for the workers to finish running the tasks? Default False.
+            cancel_futures: Optionally cancel all the queued tasks which have not yet started? Default False.
+        """
+        with self.__lock:
+            self.__shutdown = True
+
+        if cancel_futures:
+            while True:
+                try:
+                    _, _, future, _, _, _ = self.__queue.get_nowait()
+                    future.cancel()
+                except Empty:
+                    break
+
+        # No more workers can be started once the executor has been shut down.
+        if wait:
+            with self.__lock:
+                workers = list(self.__workers)
+
+            for worker in workers:
+                worker.join()
+
+    def submit(self, function, *args, priority=0, **kwargs):
+        """
+        Submits a task to be run.
+
+        Args:
+            function: The function to run.
+            args: The positional arguments for the function.
+            priority: The optional priority of the task, where lower values are run first. Default 0.
+            kwargs: The keyword arguments for the function.
+
+        Returns:
+            A future representing the result of the task.
+
+        Raises:
+            RuntimeError: if the executor has been shut down.
+        """
+        future = Future()
+
+        with self.__lock:
+            if self.__shutdown:
+                raise RuntimeError('cannot submit after shutdown')
+
+            self.__queue.put((priority, next(self.__sequence), future, partial(contextvars.copy_context().run, function), args, kwargs))
+
+            # Start another worker if we are below the limit.
+            if len(self.__workers) < self.__max_workers:
+                worker = Thread(target=self.__work, name=f"{self.__thread_name_prefix}_{len(self.__workers) + 1}")
+                self.__workers.add(worker)
+                worker.start()
+
+        return future
+
+    def __work(self):
+        """
+        Runs queued tasks until there are none left.
+        """
+        while True:
+            # Stop as soon as the queue is empty. This is done under the lock so that a task cannot be submitted without a worker to run it.
+            with self.__lock:
+                try:
+                    _, _, future, function, args, kwargs = self.__queue.get_nowait()
+                except Empty:
+                    self.__workers.discard(current_thread())
+                    return
+
+            # Skip any task which has been cancelled.
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                future.set_result(function(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
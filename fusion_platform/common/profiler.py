@@ -0,0 +1,219 @@
+"""
+Profiler class file.
+
+author: Matthew Casey
+
+&copy; [Digital Content Analysis Technology Ltd](https://www.d-cat.co.uk)
+"""
+
+import atexit
+import cProfile
+from functools import wraps
+import inspect
+import sys
+from threading import Lock
+import time
+from types import GeneratorType
+
+
+class Profiler:
+    """
+    Records the wall time, CPU time and net number of allocated memory blocks for each call to the public methods of a set of classes. The methods are only
+    instrumented while profiling, so that there is no overhead otherwise. Generators returned by the methods are also timed as they are iterated.
+
+    The results can be written as a report sorted by wall time or, if the output file name ends with PSTATS_EXTENSION, as a cProfile statistics file which can be
+    read using pstats. Note that cProfile only profiles the thread which started profiling, whereas the per-method statistics cover all threads.
+    """
+
+    # Environment variable which can be set to the output file name to enable profiling.
+    ENVIRONMENT_VARIABLE = 'FUSION_PLATFORM_PROFILE'
+
+    # cProfile statistics file extension.
+    PSTATS_EXTENSION = '.pstats'
+
+    # Statistic fields.
+    STATISTIC_CALLS = 'calls'
+    STATISTIC_WALL_TIME = 'wall_time'
+    STATISTIC_CPU_TIME = 'cpu_time'
+    STATISTIC_ALLOCATED_BLOCKS = 'allocated_blocks'
+
+    def __init__(self):
+        """
+        Initialises the object.
+        """
+        self.__lock = Lock()
+        self.__statistics = {}
+        self.__instrumented = []
+        self.__profile = None
+
+    def instrument(self, classes, names=None):
+        """
+        Instruments the public methods of each class which are defined by the class itself, together with any other named methods.
+
+        Args:
+            classes: The classes to instrument.
+            names: The optional list of additional method names, such as protected methods, to instrument where they are defined.
+        """
+        names = [] if names is None else names
+
+        for cls in classes:
+            for name, attribute in list(vars(cls).items()):
+                if (name.startswith('_') and (name not in names)) or isinstance(attribute, property):
+                    continue
+
+                wrapped = self.__wrap(f"{cls.__name__}.{name}", attribute)
+
+                if wrapped is not None:
+                    self.__instrumented.append((cls, name, attribute))
+                    setattr(cls, name, wrapped)
+
+    def __record(self, name, wall_time, cpu_time, allocated_blocks, calls=1):
+        """
+        Records the statistics for a call.
+
+        Args:
+            name: The method name.
+            wall_time: The wall time in seconds.
+            cpu_time: The CPU time of the calling thread in seconds.
+            allocated_blocks: The net number of allocated memory blocks.
+            calls: The optional number of calls. Default 1.
+        """
+        with self.__lock:
+            statistics = self.__statistics.setdefault(name, {Profiler.STATISTIC_CALLS: 0, Profiler.STATISTIC_WALL_TIME: 0.0, Profiler.STATISTIC_CPU_TIME: 0.0,
+                                                              Profiler.STATISTIC_ALLOCATED_BLOCKS: 0})
+            statistics[Profiler.STATISTIC_CALLS] += calls
+            statistics[Profiler.STATISTIC_WALL_TIME] += wall_time
+            statistics[Profiler.STATISTIC_CPU_TIME] += cpu_time
+            statistics[Profiler.STATISTIC_ALLOCATED_BLOCKS] += allocated_blocks
+
+    def report(self):
+        """
+        Returns:
+            The report of the statistics for each method, sorted by descending wall time.
+        """
+        statistics = sorted(self.statistics().items(), key=lambda item: item[1][Profiler.STATISTIC_WALL_TIME], reverse=True)
+        width = max([len('method')] + [len(name) for name, _ in statistics])
+        lines = [f"{'method':<{width}} {'calls':>10} {'wall (s)':>12} {'cpu (s)':>12} {'blocks':>12}"]
+
+        for name, values in statistics:
+            lines.append(f"{name:<{width}} {values[Profiler.STATISTIC_CALLS]:>10} {values[Profiler.STATISTIC_WALL_TIME]:>12.4f} "
+                         f"{values[Profiler.STATISTIC_CPU_TIME]:>12.4f} {values[Profiler.STATISTIC_ALLOCATED_BLOCKS]:>12}")
+
+        return '\n'.join(lines) + '\n'
+
+    def start(self, output=None):
+        """
+        Starts profiling, optionally writing the results to the output file when the process exits.
+
+        Args:
+            output: The optional output file name.
+        """
+        if (output is not None) and output.endswith(Profiler.PSTATS_EXTENSION):
+            self.__profile = cProfile.Profile()
+            self.__profile.enable()
+
+        if output is not None:
+            atexit.register(self.stop, output)
+
+    def statistics(self):
+        """
+        Returns:
+            A copy of the statistics, which maps each method name to a dictionary of its statistics.
+        """
+        with self.__lock:
+            return {name: dict(values) for name, values in self.__statistics.items()}
+
+    def stop(self, output=None):
+        """
+        Stops profiling, removing the instrumentation and optionally writing the results to the output file.
+
+        Args:
+            output: The optional output file name.
+        """
+        # Profiling can only be stopped once, so there is nothing more to do on exit.
+        atexit.unregister(self.stop)
+
+        for cls, name, attribute in reversed(self.__instrumented):
+            setattr(cls, name, attribute)
+
+        self.__instrumented = []
+
+        if self.__profile is not None:
+            self.__profile.disable()
+
+        if output is not None:
+            if self.__profile is not None:
+                self.__profile.dump_stats(output)
+            else:
+                with open(output, 'w') as file:
+                    file.write(self.report())
+
+        self.__profile = None
+
+    def __timed_generator(self, name, generator):
+        """
+        Wraps a generator so that the time taken to produce each item is recorded against the method which returned it. Closing the wrapper also closes the
+        generator.
+
+        Args:
+            name: The method name.
+            generator: The generator.
+
+        Returns:
+            The wrapped generator.
+        """
+        try:
+            while True:
+                wall_time, cpu_time, allocated_blocks = time.perf_counter(), time.thread_time(), sys.getallocatedblocks()
+
+                try:
+                    item = next(generator)
+                except StopIteration:
+                    return
+                finally:
+                    self.__record(name, time.perf_counter() - wall_time, time.thread_time() - cpu_time, sys.getallocatedblocks() - allocated_blocks, calls=0)
+
+                yield item
+
+        finally:
+            # Make sure the wrapped generator is closed when the wrapper is closed early, so that its own clean up is run.
+            generator.close()
+
+    def __wrap(self, name, attribute):
+        """
+        Wraps a method so that its calls are recorded.
+
+        Args:
+            name: The method name.
+            attribute: The method, which may be a static or class method.
+
+        Returns:
+            The wrapped method, or None if the attribute cannot be wrapped.
+        """
+        if isinstance(attribute, (staticmethod, classmethod)):
+            wrapped = self.__wrap(name, attribute.__func__)
+            return type(attribute)(wrapped) if wrapped is not None else None
+
+        # Coroutines are excluded, as only the time taken to create them would be recorded.
+        if (not inspect.isfunction(attribute)) or inspect.iscoroutinefunction(attribute):
+            return None
+
+        @wraps(attribute)
+        def wrapper(*args, **kwargs):
+            wall_time, cpu_time, allocated_blocks = time.perf_counter(), time.thread_time(), sys.getallocatedblocks()
+
+            try:
+                result = attribute(*args, **kwargs)
+            finally:
+                self.__record(name, time.perf_counter() - wall_time, time.thread_time() - cpu_time, sys.getallocatedblocks() - allocated_blocks)
+
+            # Time any generators as they are iterated, including those returned with the first item found.
+            if isinstance(result, GeneratorType):
+                return self.__timed_generator(name, result)
+
+            if isinstance(result, tuple) and any(isinstance(item, GeneratorType) for item in result):
+                return tuple(self.__timed_generator(name, item) if isinstance(item, GeneratorType) else item for item in result)
+
+            return result
+
+        return wrapper
@@ -6,6 +6,7 @@ author: Matthew Casey
 &copy; [Digital Content Analysis Technology Ltd](https://www.d-cat.co.uk)
 """
 
+import contextvars
 from threading import Thread
 
 
@@ -27,6 +28,9 @@ class RaiseThread(Thread):
         # Make sure the error field is defined.
         self.__error = None
 
+        # Run the thread in a copy of the creating thread's context, so that context variables such as the current tracing span are carried over.
+        self.__context = contextvars.copy_context()
+
     def join(self, timeout=None):
         """
         Wait until the thread terminates or the timeout occurs.
@@ -45,6 +49,6 @@ class RaiseThread(Thread):
         Runs the thread operation, but catches any error so that it can be re-raised on join.
         """
         try:
-            super(RaiseThread, self).run()
+            self.__context.run(super(RaiseThread, self).run)
         except Exception as e:
             self.__error = e
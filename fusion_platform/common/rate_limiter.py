@@ -0,0 +1,103 @@
+"""
+Rate limiter class file.
+
+author: Matthew Casey
+
+&copy; [Digital Content Analysis Technology Ltd](https://www.d-cat.co.uk)
+"""
+
+import math
+from threading import Condition
+import time
+
+
+class RateLimiter:
+    """
+    Limits the rate and concurrency of requests shared across threads. The rate is limited using a token bucket which is refilled at a fixed number of requests per
+    second, allowing a short burst above the rate. Concurrency is limited by a window of requests which may be in progress at once. The window is adapted using
+    additive increase, multiplicative decrease (AIMD): it shrinks when a request is throttled and slowly grows again on success, so that it settles at the highest
+    sustainable concurrency.
+
+    Custom limiters can be used by overriding #acquire and #release.
+    """
+
+    def __init__(self, rate=None, burst=None, concurrency=None, concurrency_minimum=1, increase=1.0, decrease=0.5):
+        """
+        Initialises the object.
+
+        Args:
+            rate: The optional maximum number of requests per second. Default None, which does not limit the rate.
+            burst: The optional maximum number of requests which can be made at once above the rate. Defaults to the rate, with a minimum of 1.
+            concurrency: The optional maximum number of requests which can be in progress at once. Default None, which does not limit concurrency.
+            concurrency_minimum: The optional minimum number of requests to which the concurrency window can shrink. Default 1.
+            increase: The optional amount by which the concurrency window grows after a full window of successful requests. Default 1.
+            decrease: The optional factor by which the concurrency window is multiplied when a request is throttled. Default 0.5.
+        """
+        self.__rate = rate
+        self.__burst = max(1.0, burst if burst is not None else (rate if rate is not None else 1.0))
+        self.__concurrency = concurrency
+        self.__concurrency_minimum = max(1, concurrency_minimum)
+        self.__increase = increase
+        self.__decrease = decrease
+
+        self.__condition = Condition()
+        self.__tokens = self.__burst
+        self.__updated_at = time.monotonic()
+        self.__window = float(concurrency) if concurrency is not None else None
+        self.__in_progress = 0
+
+    def acquire(self):
+        """
+        Waits until a request can be made.
+        """
+        with self.__condition:
+            while True:
+                timeout = None
+
+                # Refill the token bucket based on the time elapsed.
+                if self.__rate is not None:
+                    now = time.monotonic()
+                    self.__tokens = min(self.__burst, self.__tokens + (now - self.__updated_at) * self.__rate)
+                    self.__updated_at = now
+
+                    if self.__tokens < 1:
+                        timeout = (1 - self.__tokens) / self.__rate
+
+                # Check the concurrency window. If the window is full, we wait until a request is released.
+                window_full = (self.__window is not None) and (self.__in_progress >= math.floor(self.__window))
+
+                if (timeout is None) and (not window_full):
+                    break
+
+                self.__condition.wait(timeout=None if window_full else timeout)
+
+            if self.__rate is not None:
+                self.__tokens -= 1
+
+            self.__in_progress += 1
+
+    def release(self, throttled=False):
+        """
+        Releases a request which has completed, adapting the concurrency window.
+
+        Args:
+            throttled: Was the request throttled by the server? Default False.
+        """
+        with self.__condition:
+            self.__in_progress -= 1
+
+            if self.__window is not None:
+                if throttled:
+                    self.__window = max(self.__concurrency_minimum, self.__window * self.__decrease)
+                else:
+                    self.__window = min(self.__concurrency, self.__window + self.__increase / self.__window)
+
+            self.__condition.notify_all()
+
+    @property
+    def window(self):
+        """
+        Returns:
+            The current concurrency window, or None if concurrency is not limited.
+        """
+        return self.__window
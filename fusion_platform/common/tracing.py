@@ -0,0 +1,189 @@
+"""
+Tracing class file.
+
+author: Matthew Casey
+
+&copy; [Digital Content Analysis Technology Ltd](https://www.d-cat.co.uk)
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from itertools import count
+from threading import current_thread, Lock
+import time
+
+
+class Span:
+    """
+    A span which does nothing. This follows the OpenTelemetry span interface, so that an OpenTelemetry span can be used wherever a span is expected.
+    """
+
+    def __enter__(self):
+        """
+        Returns:
+            The span.
+        """
+        return self
+
+    def __exit__(self, exception_type, exception, traceback):
+        """
+        Ends the span, without suppressing any exception.
+        """
+        return False
+
+    def record_exception(self, exception):
+        """
+        Records an exception raised during the span.
+
+        Args:
+            exception: The exception.
+        """
+        pass
+
+    def set_attribute(self, key, value):
+        """
+        Sets an attribute on the span.
+
+        Args:
+            key: The attribute key.
+            value: The attribute value.
+        """
+        pass
+
+
+class Tracer:
+    """
+    A tracer which does nothing, so that tracing has negligible overhead unless it is enabled. This follows the OpenTelemetry tracer interface, so that an
+    OpenTelemetry tracer can be used wherever a tracer is expected. Custom tracers can be used by overriding #start_as_current_span.
+
+    Spans are made current using context variables. The SDK copies the current context into the worker threads it uses, so that spans started on a worker are
+    children of the span which was current when the work was submitted.
+    """
+
+    # The single span returned by the tracer.
+    _SPAN = Span()
+
+    def start_as_current_span(self, name, attributes=None):
+        """
+        Starts a span which is current until it ends. The span is used as a context manager, and ends when the context is exited.
+
+        Args:
+            name: The span name.
+            attributes: The optional span attributes as a dictionary.
+
+        Returns:
+            The span context manager.
+        """
+        return Tracer._SPAN
+
+
+class InMemorySpan(Span):
+    """
+    A span which is recorded in memory by an InMemoryTracer.
+    """
+
+    def __init__(self, name, span_id, parent, attributes):
+        """
+        Initialises the object.
+
+        Args:
+            name: The span name.
+            span_id: The unique span id.
+            parent: The optional parent span.
+            attributes: The optional span attributes as a dictionary.
+        """
+        self.name = name
+        self.span_id = span_id
+        self.parent = parent
+        self.attributes = dict(attributes or {})
+        self.exceptions = []
+        self.thread_name = current_thread().name
+        self.start_time = time.monotonic()
+        self.end_time = None
+
+    @property
+    def duration(self):
+        """
+        Returns:
+            The duration of the span in seconds, or None if the span has not ended.
+        """
+        return self.end_time - self.start_time if self.end_time is not None else None
+
+    def record_exception(self, exception):
+        """
+        Records an exception raised during the span.
+
+        Args:
+            exception: The exception.
+        """
+        self.exceptions.append(exception)
+
+    def set_attribute(self, key, value):
+        """
+        Sets an attribute on the span.
+
+        Args:
+            key: The attribute key.
+            value: The attribute value.
+        """
+        self.attributes[key] = value
+
+
+class InMemoryTracer(Tracer):
+    """
+    A tracer which records its spans in memory once they have ended, so that traces can be inspected in tests.
+    """
+
+    def __init__(self):
+        """
+        Initialises the object.
+        """
+        self.__current = ContextVar(f"fusion_platform_span_{id(self)}", default=None)
+        self.__span_ids = count(1)
+        self.__lock = Lock()
+        self.__spans = []
+
+    def clear(self):
+        """
+        Removes all the recorded spans.
+        """
+        with self.__lock:
+            self.__spans.clear()
+
+    @property
+    def spans(self):
+        """
+        Returns:
+            The list of spans which have ended, in the order in which they ended.
+        """
+        with self.__lock:
+            return list(self.__spans)
+
+    @contextmanager
+    def start_as_current_span(self, name, attributes=None):
+        """
+        Starts a span which is current until it ends. The span is used as a context manager, and ends when the context is exited.
+
+        Args:
+            name: The span name.
+            attributes: The optional span attributes as a dictionary.
+
+        Returns:
+            The span context manager.
+        """
+        span = InMemorySpan(name, next(self.__span_ids), self.__current.get(), attributes)
+        token = self.__current.set(span)
+
+        try:
+            yield span
+
+        except BaseException as e:
+            span.record_exception(e)
+            raise
+
+        finally:
+            self.__current.reset(token)
+            span.end_time = time.monotonic()
+
+            with self.__lock:
+                self.__spans.append(span)
@@ -6,11 +6,94 @@ author: Matthew Casey
 &copy; [Digital Content Analysis Technology Ltd](https://www.d-cat.co.uk)
 """
 
+from collections.abc import Mapping
 from datetime import date, datetime, time, timezone
 from decimal import Decimal
+import json
 import re
 from types import MappingProxyType
 
+try:
+    import orjson
+except ImportError:  # The optional fast JSON backend is not installed.
+    orjson = None
+
+# JSON backends.
+JSON_BACKEND_ORJSON = 'orjson'
+JSON_BACKEND_STDLIB = 'json'
+
+# The JSON backend in use, which defaults to the fastest one installed.
+_json_backend = JSON_BACKEND_ORJSON if orjson is not None else JSON_BACKEND_STDLIB
+
+# Options used with orjson. Datetimes are passed through to json_default so that naive datetimes are converted to UTC exactly as they are for the standard
+# library, while non-string dictionary keys are allowed as they are by the standard library.
+_ORJSON_OPTIONS = (orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
+
+
+class ReadOnlyDict(Mapping):
+    """
+    A read-only view of a dictionary. The dictionary is not copied, and any nested dictionaries and lists are only made read-only when they are accessed. This
+    behaves like a mapping proxy of a dictionary whose nested values have been made read-only, but without the cost of converting every nested value up front.
+    Note that this is a Mapping, but not a MappingProxyType.
+    """
+
+    __slots__ = ['_value']
+
+    def __init__(self, value):
+        """
+        Initialises the object.
+
+        Args:
+            value: The dictionary, which must not be changed while it is being viewed.
+        """
+        self._value = value
+
+    def __contains__(self, key):
+        return key in self._value
+
+    def __eq__(self, other):
+        if isinstance(other, ReadOnlyDict):
+            return self._value == other._value
+
+        if isinstance(other, Mapping):
+            return (len(self) == len(other)) and all([(key in other) and (self[key] == other[key]) for key in self._value])
+
+        return NotImplemented
+
+    def __getitem__(self, key):
+        return value_to_read_only(self._value[key])
+
+    def __iter__(self):
+        return iter(self._value)
+
+    def __len__(self):
+        return len(self._value)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict(self)!r})"
+
+    # Like a mapping proxy, the view cannot be hashed.
+    __hash__ = None
+
+
+class ReadOnlyList(tuple):
+    """
+    A read-only tuple of a list's values. This is a tuple, so it can be used wherever the tuple it replaces could be used, but only the list's values are made
+    read-only when it is created. Any dictionaries and lists nested within these values are only made read-only when they are accessed, which avoids the cost of
+    converting every nested value up front.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, value):
+        """
+        Creates the object.
+
+        Args:
+            value: The list, whose nested values must not be changed while they are being viewed.
+        """
+        return super(ReadOnlyList, cls).__new__(cls, [value_to_read_only(item) for item in value])
+
 
 def datetime_parse(string_or_blank):
     """
@@ -84,13 +167,85 @@ def json_default(value):
     elif isinstance(value, Decimal):
         # We want to output numbers as either integers (no trailing ".0") or floats. This will also convert decimals.
         return int(value) if float(value).is_integer() else float(value)
-    elif isinstance(value, MappingProxyType):
-        # Read-only dictionaries may be defined using the MappingProxyType. For serialisation, we therefore convert them back to dictionaries.
+    elif isinstance(value, (MappingProxyType, ReadOnlyDict)):
+        # Read-only dictionaries may be defined using the MappingProxyType or viewed using a ReadOnlyDict. For serialisation, we therefore convert them back to
+        # dictionaries.
         return dict(value)
+    elif isinstance(value, ReadOnlyList):
+        # Read-only lists may be viewed using a ReadOnlyList. For serialisation, we therefore convert them back to lists.
+        return list(value)
     else:
         return str(value)
 
 
+def json_backend():
+    """
+    Returns:
+        The name of the JSON backend in use.
+    """
+    return _json_backend
+
+
+def json_backend_set(backend):
+    """
+    Sets the JSON backend used by json_dumps and json_loads.
+
+    Args:
+        backend: The JSON backend, either JSON_BACKEND_ORJSON or JSON_BACKEND_STDLIB.
+
+    Raises:
+        ValueError: if the backend is not recognised or is not installed.
+    """
+    global _json_backend
+
+    if (backend not in [JSON_BACKEND_ORJSON, JSON_BACKEND_STDLIB]) or ((backend == JSON_BACKEND_ORJSON) and (orjson is None)):
+        raise ValueError(f"JSON backend {backend} is not available")
+
+    _json_backend = backend
+
+
+def json_dumps(value, binary=False):
+    """
+    Serialises a value to compact JSON using the JSON backend in use, with json_default used for objects which cannot otherwise be serialised. The output is the
+    same for each backend, without whitespace between items and with non-ASCII characters left unescaped. This is intended for request bodies, whereas files
+    written to disk use the standard json.dumps formatting.
+
+    Args:
+        value: The value to serialise.
+        binary: True if the JSON should be returned as UTF-8 encoded bytes rather than a string. Default False.
+
+    Returns:
+        The JSON as either a string or bytes.
+    """
+    if _json_backend == JSON_BACKEND_ORJSON:
+        try:
+            encoded = orjson.dumps(value, default=json_default, option=_ORJSON_OPTIONS)
+            return encoded if binary else encoded.decode('utf-8')
+        except TypeError:
+            pass  # Fall back to the standard library for values which orjson cannot serialise, such as very large integers.
+
+    # Use the same compact output as orjson, so that the JSON is the same whichever backend is in use.
+    encoded = json.dumps(value, default=json_default, separators=(',', ':'), ensure_ascii=False)
+
+    return encoded.encode('utf-8') if binary else encoded
+
+
+def json_loads(data):
+    """
+    Deserialises JSON using the JSON backend in use.
+
+    Args:
+        data: The JSON as either a string or bytes.
+
+    Returns:
+        The deserialised value.
+    """
+    if _json_backend == JSON_BACKEND_ORJSON:
+        return orjson.loads(data)
+
+    return json.loads(data)
+
+
 def string_blank(string_or_blank):
     """
     Checks if a string is None or blank.
@@ -120,8 +275,8 @@ def string_camel_to_underscore(string):
 
 def value_from_read_only(value):
     """
-    Takes a value and makes it writable. This recursive method will deal with dictionaries and lists. Here, dictionaries are assumed to be mapping proxies, while
-    tuples are assumed to be lists.
+    Takes a value and makes it writable. This recursive method will deal with dictionaries and lists. Here, dictionaries are assumed to be mapping proxies or
+    read-only views, while tuples and read-only list views are assumed to be lists.
 
     Args:
         value: The value to make read-only.
@@ -129,9 +284,9 @@ def value_from_read_only(value):
     Returns:
         The read-only value.
     """
-    if isinstance(value, MappingProxyType):
+    if isinstance(value, (MappingProxyType, ReadOnlyDict)):
         return dict({inner_key: value_from_read_only(inner_value) for inner_key, inner_value in value.items()})  # Creates a mutable mapping.
-    elif isinstance(value, tuple):  # This assumes that tuples are really lists.
+    elif isinstance(value, tuple):  # This assumes that tuples are really lists, including read-only lists.
         return list([value_from_read_only(inner_value) for inner_value in value])  # Creates a mutable list.
     else:
         return value
@@ -139,9 +294,10 @@ def value_from_read_only(value):
 
 def value_to_read_only(value):
     """
-    Takes a value and makes it read-only. This recursive method will deal with dictionaries and lists. This method will not deal with objects that are immutable,
-    such as datetimes, but rather makes sure that the references to objects cannot be changed. For example, dictionary values cannot be replaced or list items
-    removed.
+    Takes a value and makes it read-only. Dictionaries and lists are wrapped in views, which make any nested dictionaries and lists read-only as they are
+    accessed. This method will not deal with objects that are immutable, such as datetimes, but rather makes sure that the references to objects cannot be
+    changed. For example, dictionary values cannot be replaced or list items removed. Note that the value is not copied, and so must not be changed after it has
+    been made read-only. Dictionaries become a ReadOnlyDict, which is a Mapping rather than a MappingProxyType, and lists become a ReadOnlyList, which is a tuple.
 
     Args:
         value: The value to make read-only.
@@ -150,9 +306,9 @@ def value_to_read_only(value):
         The read-only value.
     """
     if isinstance(value, dict):
-        return MappingProxyType({inner_key: value_to_read_only(inner_value) for inner_key, inner_value in value.items()})  # Creates an immutable mapping.
+        return ReadOnlyDict(value)  # Creates an immutable view of the mapping.
     elif isinstance(value, list):
-        return tuple([value_to_read_only(inner_value) for inner_value in value])  # Creates an immutable list, which is just a tuple.
+        return ReadOnlyList(value)  # Creates an immutable view of the list.
     else:
         return value
 
@@ -167,7 +323,7 @@ def value_to_string(value):
     Returns:
         The corresponding (pretty) string value.
     """
-    if isinstance(value, list) or isinstance(value, tuple):
+    if isinstance(value, (list, tuple)):
         return f"[{', '.join([value_to_string(inner) for inner in value])}]"
     elif isinstance(value, dict):
         items = [f"{key}: {value_to_string(inner)}" for key, inner in value.items()]
@@ -0,0 +1,280 @@
+"""
+Download manager class file.
+
+author: Matthew Casey
+
+&copy; [Digital Content Analysis Technology Ltd](https://www.d-cat.co.uk)
+"""
+
+from concurrent.futures import Future
+from functools import partial
+import os
+import shutil
+from threading import Lock
+import time
+
+from fusion_platform.base import Base
+from fusion_platform.common.priority_executor import PriorityExecutor
+
+
+class DownloadManager(Base):
+    """
+    Manages the download of many data files for a session. Downloads are run on a bounded number of workers, with the download with the lowest priority value
+    run first. Requests to download the same file while it is already queued or downloading are combined, so that the file is only downloaded once and then copied
+    to any other requested paths. A combined request with a lower priority value moves a queued download forward. Each request is represented by its own future
+    which resolves to its own path, and the manager reports aggregate progress and throughput across all downloads.
+    """
+
+    # Statistics keys.
+    STATISTIC_FILES_QUEUED = 'files_queued'
+    STATISTIC_FILES_ACTIVE = 'files_active'
+    STATISTIC_FILES_COMPLETED = 'files_completed'
+    STATISTIC_FILES_FAILED = 'files_failed'
+    STATISTIC_BYTES = 'bytes'
+    STATISTIC_ELAPSED = 'elapsed'
+    STATISTIC_THROUGHPUT = 'throughput'
+
+    def __init__(self, session, max_workers):
+        """
+        Initialises the object.
+
+        Args:
+            session: The linked session object used for the downloads.
+            max_workers: The maximum number of files downloaded concurrently.
+        """
+        super(DownloadManager, self).__init__()
+
+        # Initialise the private fields.
+        self.__session = session
+        self.__executor = PriorityExecutor(max_workers, thread_name_prefix='fusion_platform_download')
+        self.__lock = Lock()
+        self.__jobs = {}
+        self.__files_queued = 0
+        self.__files_active = 0
+        self.__files_completed = 0
+        self.__files_failed = 0
+        self.__bytes = 0
+        self.__active_since = None
+        self.__active_time = 0
+
+    def __cancelled(self, key, job, future):
+        """
+        Callback method used when a queued download task is done. If every task for the job has been cancelled before the download started, then the job is
+        removed and each request's future is cancelled.
+
+        Args:
+            key: The job key.
+            job: The job.
+            future: The task's future.
+        """
+        if not future.cancelled():
+            return
+
+        with self.__lock:
+            job['tasks'] -= 1
+
+            if job['started'] or (job['tasks'] > 0):
+                return
+
+            self.__jobs.pop(key, None)
+            self.__files_queued -= 1
+            requests = list(job['requests'])
+
+        for _, _, request_future in requests:
+            request_future.cancel()
+            request_future.set_running_or_notify_cancel()
+
+    def __download(self, key, job):
+        """
+        Downloads a file and copies it to any other paths which were requested while it was queued or downloading. Each request's future is resolved with its own
+        path, or with the error if the download or copy failed.
+
+        Args:
+            key: The job key.
+            job: The job.
+        """
+        # The job may already have been started by a task submitted when it was re-prioritised.
+        with self.__lock:
+            if job['started']:
+                return
+
+            job['started'] = True
+            path = job['requests'][0][0]
+            self.__files_queued -= 1
+            self.__files_active += 1
+
+            if self.__active_since is None:
+                self.__active_since = time.monotonic()
+
+        file = job['file']
+        preview = job['preview']
+        error = None
+
+        try:
+            url = file.download_url(preview=preview) if job['url'] is None else job['url']
+            size = file.size if (not preview) and hasattr(file, 'size') else None
+            self.__session.download_file(url, path, callback=partial(self.__download_callback, key), size=size,
+                                         refresh_url=partial(file.download_url, preview=preview))
+
+        except Exception as e:
+            error = e
+
+        finally:
+            # Once finished, no more paths can be added to the job.
+            with self.__lock:
+                self.__jobs.pop(key, None)
+                requests = list(job['requests'])
+                self.__files_active -= 1
+                self.__files_completed += 1 if error is None else 0
+                self.__files_failed += 0 if error is None else 1
+
+                if (self.__files_active <= 0) and (self.__active_since is not None):
+                    self.__active_time += time.monotonic() - self.__active_since
+                    self.__active_since = None
+
+        # Resolve each request with its own path, copying the downloaded file to any other requested paths.
+        for other_path, _, future in requests:
+            try:
+                if error is not None:
+                    raise error
+
+                if other_path != path:
+                    directory = os.path.dirname(other_path)
+
+                    if len(directory) > 0:
+                        os.makedirs(directory, exist_ok=True)
+
+                    shutil.copyfile(path, other_path)
+
+                DownloadManager.__resolve(future, result=other_path)
+
+            except Exception as e:
+                DownloadManager.__resolve(future, exception=e)
+
+    def __download_callback(self, key, url, destination, size):
+        """
+        Callback method used to receive progress from a download. Updates the aggregate progress and passes the progress on to any callbacks for the job.
+
+        Args:
+            key: The job key.
+            url: The URL being downloaded.
+            destination: The destination file path.
+            size: The total size in bytes so far downloaded.
+        """
+        with self.__lock:
+            job = self.__jobs.get(key)
+
+            if job is None:
+                return
+
+            # The size can go down if the download is restarted, so we keep track of the change.
+            self.__bytes += size - job['size']
+            job['size'] = size
+            callbacks = [(path, callback) for path, callback, _ in job['requests']]
+
+        for path, callback in callbacks:
+            if callback is not None:
+                callback(url, path, size)
+
+    @staticmethod
+    def __resolve(future, result=None, exception=None):
+        """
+        Resolves a request's future with either its result or an exception, unless the future has been cancelled.
+
+        Args:
+            future: The request's future.
+            result: The optional result.
+            exception: The optional exception.
+        """
+        if not future.set_running_or_notify_cancel():
+            return
+
+        if exception is not None:
+            future.set_exception(exception)
+        else:
+            future.set_result(result)
+
+    def shutdown(self, cancel_futures=False):
+        """
+        Prevents any further downloads from being submitted. Queued downloads are still run, unless they are cancelled.
+
+        Args:
+            cancel_futures: Optionally cancel all queued downloads which have not yet started? Default False.
+        """
+        self.__executor.shutdown(cancel_futures=cancel_futures)
+
+    def statistics(self):
+        """
+        Returns the aggregate statistics for all downloads. The elapsed time only includes periods when at least one download was active, and the throughput is
+        the number of bytes downloaded per second during this time.
+
+        Returns:
+            A dictionary of the statistics.
+        """
+        with self.__lock:
+            elapsed = self.__active_time + (time.monotonic() - self.__active_since if self.__active_since is not None else 0)
+
+            return {
+                DownloadManager.STATISTIC_FILES_QUEUED: self.__files_queued,
+                DownloadManager.STATISTIC_FILES_ACTIVE: self.__files_active,
+                DownloadManager.STATISTIC_FILES_COMPLETED: self.__files_completed,
+                DownloadManager.STATISTIC_FILES_FAILED: self.__files_failed,
+                DownloadManager.STATISTIC_BYTES: self.__bytes,
+                DownloadManager.STATISTIC_ELAPSED: elapsed,
+                DownloadManager.STATISTIC_THROUGHPUT: self.__bytes / elapsed if elapsed > 0 else 0,
+            }
+
+    def submit(self, file, path, preview=False, priority=0, url=None, callback=None):
+        """
+        Submits a data file to be downloaded to the specified path. If the same file is already queued or downloading, then the existing download is used and the
+        file is copied to the path once it has been downloaded. If the existing download is still queued and this request has a lower priority value, then the
+        download is moved forward to this priority. The optional callback function receives three arguments which are the URL, destination and the number of bytes
+        downloaded so far.
+
+        Args:
+            file: The data file model to download.
+            path: The local path to download the file to.
+            preview: Optionally download the preview (PNG) of the file instead of the main file? Default False.
+            priority: The optional priority of the download, where lower values are downloaded first. Default 0.
+            url: The optional download URL. If not provided, a URL is obtained from the data file when the download starts.
+            callback: The optional callback method used to receive download progress.
+
+        Returns:
+            A future whose result is the path the file was downloaded or copied to.
+        """
+        key = (str(file.file_id), preview)
+        future = Future()
+
+        with self.__lock:
+            job = self.__jobs.get(key)
+
+            if job is None:
+                job = {'file': file, 'preview': preview, 'url': url, 'priority': priority, 'size': 0, 'requests': [], 'started': False, 'tasks': 0}
+                self.__submit(key, job)
+                self.__jobs[key] = job
+                self.__files_queued += 1
+
+            else:
+                self._logger.debug('combining download of %s -> %s', file.file_id, path)
+
+                # The queued job is submitted again with the lower priority value, and whichever task runs first downloads the file.
+                if (not job['started']) and (priority < job['priority']):
+                    self._logger.debug('re-prioritising download of %s from %s to %s', file.file_id, job['priority'], priority)
+                    job['priority'] = priority
+                    self.__submit(key, job)
+
+            job['requests'].append((path, callback, future))
+
+        return future
+
+    def __submit(self, key, job):
+        """
+        Submits a task to the executor to download the job at its current priority. This must be called with the lock held.
+
+        Args:
+            key: The job key.
+            job: The job.
+        """
+        task = self.__executor.submit(self.__download, key, job, priority=job['priority'])
+        job['tasks'] += 1
+        task.add_done_callback(partial(self.__cancelled, key, job))
@@ -6,12 +6,12 @@ author: Matthew Casey
 &copy; [Digital Content Analysis Technology Ltd](https://www.d-cat.co.uk)
 """
 
+from concurrent.futures import wait as wait_for_futures
 import i18n
 from marshmallow import Schema, EXCLUDE
 import os
 from time import sleep
 
-from fusion_platform.common.raise_thread import RaiseThread
 from fusion_platform.common.utilities import dict_nested_get
 from fusion_platform.models import fields
 from fusion_platform.models.data_file import DataFile
@@ -100,18 +100,21 @@ class Data(Model):
 
         # Initialise the fields.
         self.__upload_progress = {}
-        self.__upload_threads = {}
+        self.__upload_futures = {}
 
-    def __add_file(self, file_type, file):
+    def __add_file(self, file_type, file, upload_priority=0):
         """
-        Attempts to add a file to the data object and then starts its upload. The file is uploaded using a thread.
+        Attempts to add a file to the data object and then queues its upload. The file is uploaded using the session's upload executor, which bounds the number of
+        concurrent uploads across the session.
 
         Args:
             file_type: The type of file to add.
             file: The path to the file to add.
+            upload_priority: The optional priority of the upload, where lower values are uploaded first. Default 0.
 
         Raises:
             RequestError: if the add fails.
+            ModelError: if the file does not exist or the add response does not contain the file id and URL.
         """
         # Make sure the file exists.
         if not os.path.exists(file):
@@ -134,20 +137,19 @@ class Data(Model):
             raise ModelError(i18n.t('models.data.failed_add_file_url'))
 
         # Make sure the file is unique so that we can keep track of it.
-        if file_id in self.__upload_threads:
+        if file_id in self.__upload_futures:
             raise ModelError(i18n.t('models.data.failed_add_file_not_unique'))
 
-        # Create and start a thread for the upload.
+        # Queue the upload.
         self.__upload_progress[file] = (file, 0)  # Indexed by file path, not file id.
-        thread = None
+        future = None
 
         try:
-            thread = RaiseThread(target=self._session.upload_file, args=(url, file, self.__upload_callback))
-            thread.start()
+            future = self._session.upload_executor.submit(self._session.upload_file, url, file, self.__upload_callback, priority=upload_priority)
 
         finally:
-            # Make sure we record the thread so we can monitor it, even if it fails.
-            self.__upload_threads[file_id] = thread
+            # Make sure we record the upload so we can monitor it, even if it fails.
+            self.__upload_futures[file_id] = future
 
     def check_analysis_complete(self, wait=False, extended_analysis=False):
         """
@@ -227,7 +229,7 @@ class Data(Model):
         # Return the copy.
         return self.__class__._model_from_api_id(self._session, organisation_id=self.organisation_id, id=copy_data_id)
 
-    def _create(self, name, file_type, files, wait=False, **kwargs):
+    def _create(self, name, file_type, files, wait=False, upload_priority=0, **kwargs):
         """
         Attempts to create the model object with the given values. This assumes the model template has been loaded first using the _new method, and that the model
         is then created using a POST RESTful request. This assumes that the post body contains key names which include the name of the model class.
@@ -239,6 +241,7 @@ class Data(Model):
             file_type: The type of files that the data object will hold.
             files: The list of file paths to be uploaded.
             wait: Optionally wait for the upload and analysis to complete? Default False.
+            upload_priority: The optional priority of the uploads, where lower values are uploaded first. Default 0.
             kwargs: The model attributes which override those already in the template.
 
         Returns:
@@ -251,15 +254,15 @@ class Data(Model):
         # Use the super method to create the data item with the correct attributes. This will raise an exception if anything fails.
         super(Data, self)._create(name=name, **kwargs)
 
-        # Add each of the files, assuming that each is of the same file type, and start its upload in a thread.
+        # Add each of the files, assuming that each is of the same file type, and queue its upload.
         try:
             for file in files:
-                self.__add_file(file_type, file)
+                self.__add_file(file_type, file, upload_priority=upload_priority)
 
         finally:
             # Optionally wait for completion. We must complete this even if an exception has occurred because there may be multiple files. However, we only do this
-            # if any threads were started.
-            if len(self.__upload_threads) > 0:
+            # if any uploads were queued.
+            if len(self.__upload_futures) > 0:
                 self.create_complete(wait=wait)  # Ignore response.
 
     def create_complete(self, wait=False, extended_analysis=False):
@@ -283,26 +286,30 @@ class Data(Model):
             ModelError: if the upload or analysis failed.
         """
         # Make sure a create is in progress.
-        if len(self.__upload_threads) <= 0:
+        if len(self.__upload_futures) <= 0:
             raise ModelError(i18n.t('models.data.no_create'))
 
-        # Check the upload threads. This will raise an exception if an error has occurred.
+        # Check the uploads. This will raise an exception if an error has occurred.
         first_error = None
 
-        for file_id, thread in self.__upload_threads.items():
-            if thread is not None:
-                thread_finished = False
+        for file_id, future in self.__upload_futures.items():
+            if future is not None:
+                upload_finished = False
 
                 try:
-                    # Join will return immediately because of the timeout, but will raise an exception if something has gone wrong.
-                    thread.join(timeout=None if wait else 0)
+                    # Only block if we are waiting for the upload to complete.
+                    if wait:
+                        wait_for_futures([future])
+
+                    # Check if the upload has finished, which will raise an exception if something has gone wrong.
+                    upload_finished = future.done()
 
-                    # Check if the thread is still running after the join.
-                    thread_finished = not thread.is_alive()
+                    if upload_finished:
+                        future.result()
 
                 except Exception as e:
                     # Something went wrong. Make sure we mark the upload as finished.
-                    thread_finished = True
+                    upload_finished = True
 
                     # If we are waiting for everything to complete, then we must not re-raise the error here so that everything else can be completed first.
                     # Instead, we save the error off and raise it later.
@@ -312,12 +319,12 @@ class Data(Model):
                         raise
 
                 finally:
-                    # Make sure we clear the thread if it has finished.
-                    if thread_finished:
-                        self.__upload_threads[file_id] = None
+                    # Make sure we clear the upload if it has finished.
+                    if upload_finished:
+                        self.__upload_futures[file_id] = None
 
         # Have all the uploads finished?
-        uploads_finished = all([value is None for value in self.__upload_threads.values()])
+        uploads_finished = all([value is None for value in self.__upload_futures.values()])
 
         # Now check whether the analysis has completed. We do this in a loop so that we can wait until completion, but break out if we are not waiting. If an
         # error occurs, then we assume that the analysis is complete to prevent indefinitely waiting.
@@ -336,14 +343,14 @@ class Data(Model):
 
         finally:
             if complete:
-                # Tidy up any finished threads. This will allow us to indicate that everything is complete.
-                self.__upload_threads = {file_id: thread for file_id, thread in self.__upload_threads.items() if thread is not None}
+                # Tidy up any finished uploads. This will allow us to indicate that everything is complete.
+                self.__upload_futures = {file_id: future for file_id, future in self.__upload_futures.items() if future is not None}
 
         # If we encountered an error, make sure we raise it.
         if first_error is not None:
             raise first_error
 
-        return len(self.__upload_threads) <= 0
+        return len(self.__upload_futures) <= 0
 
     @property
     def files(self):
@@ -465,7 +472,7 @@ class Data(Model):
             ModelError: if no upload is in progress.
         """
         # Make sure at least one upload is in progress.
-        if (self.__upload_threads is None) or (len(self.__upload_threads) == 0):
+        if (self.__upload_futures is None) or (len(self.__upload_futures) == 0):
             raise ModelError(i18n.t('models.data.no_upload'))
 
         return list(self.__upload_progress.values())
@@ -6,12 +6,12 @@ author: Matthew Casey
 &copy; [Digital Content Analysis Technology Ltd](https://www.d-cat.co.uk)
 """
 
+from concurrent.futures import wait as wait_for_futures
 import i18n
 from marshmallow import Schema, EXCLUDE
 import os
 
 import fusion_platform
-from fusion_platform.common.raise_thread import RaiseThread
 from fusion_platform.common.utilities import datetime_parse, dict_nested_get
 from fusion_platform.models import fields
 from fusion_platform.models.model import Model, ModelError
@@ -172,31 +172,34 @@ class DataFile(Model):
 
         # Initialise the fields.
         self.__download_progress = None
-        self.__download_thread = None
+        self.__download_future = None
 
-    def download(self, path, preview=False, wait=False):
+    def download(self, path, preview=False, wait=False, priority=0):
         """
-        Downloads the file to the specified path. Optionally waits for the download to complete.
+        Downloads the file to the specified path. Optionally waits for the download to complete. Any partial download left behind by a previous attempt is resumed,
+        with the download URL refreshed if it expires. The downloaded file is verified against the file's size. The download is run by the session's download
+        manager, so that it shares a bounded number of workers with all other downloads.
 
         Args:
             path: The local path to download the file to.
             preview: Optionally specify that the preview (PNG) of the file should be downloaded instead of the main file.
             wait: Optionally wait for the download to complete? Default False.
+            priority: The optional priority of the download, where lower values are downloaded first. Default 0.
 
         Raises:
             RequestError: if the download fails.
         """
         # Make sure no download is currently in progress.
-        if self.__download_thread is not None:
+        if self.__download_future is not None:
             raise ModelError(i18n.t('models.data_file.download_already_in_progress'))
 
         # Obtain the download URL.
         url = self.download_url(preview=preview)
 
-        # Start the download in a separate thread.
+        # Submit the download to the session's download manager.
         self.__download_progress = (url, path, 0)
-        self.__download_thread = RaiseThread(target=self._session.download_file, args=(url, path, self.__download_callback))
-        self.__download_thread.start()
+        self.__download_future = self._session.download_manager.submit(self, path, preview=preview, priority=priority, url=url,
+                                                                       callback=self.__download_callback)
 
         # Optionally wait for completion.
         self.download_complete(wait=wait)  # Ignore response.
@@ -228,18 +231,20 @@ class DataFile(Model):
             ModelError: if no download is in progress.
         """
         # Make sure a download is in progress.
-        if self.__download_thread is None:
+        if self.__download_future is None:
             raise ModelError(i18n.t('models.data_file.no_download'))
 
-        # Check the download thread. This will raise an exception if an error has occurred.
+        # Check the download future. This will raise an exception if an error has occurred.
         finished = False
 
         try:
-            # Join will return immediately because of the timeout, but will raise an exception if something has gone wrong.
-            self.__download_thread.join(timeout=None if wait else 0)
+            if wait:
+                wait_for_futures([self.__download_future])
 
-            # Check if the thread is still running after the join.
-            finished = not self.__download_thread.is_alive()
+            finished = self.__download_future.done()
+
+            if finished:
+                self.__download_future.result()  # Raises any exception from the download.
 
         except:
             # Something went wrong. Make sure we mark the download as finished and re-raise the error.
@@ -247,10 +252,10 @@ class DataFile(Model):
             raise
 
         finally:
-            # Make sure we clear the progress and thread if it has finished.
+            # Make sure we clear the progress and future if it has finished.
             if finished:
                 self.__download_progress = None
-                self.__download_thread = None
+                self.__download_future = None
 
         return finished
 
@@ -265,7 +270,7 @@ class DataFile(Model):
             ModelError: if no download is in progress.
         """
         # Make sure a download is in progress.
-        if self.__download_thread is None:
+        if self.__download_future is None:
             raise ModelError(i18n.t('models.data_file.no_download'))
 
         return self.__download_progress
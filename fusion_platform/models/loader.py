@@ -0,0 +1,284 @@
+"""
+Compiled loader class file.
+
+author: Matthew Casey
+
+&copy; [Digital Content Analysis Technology Ltd](https://www.d-cat.co.uk)
+"""
+
+import decimal
+import math
+from marshmallow import EXCLUDE, RAISE, missing
+from marshmallow.decorators import POST_LOAD, PRE_LOAD, VALIDATES, VALIDATES_SCHEMA
+from threading import Lock
+import uuid
+
+from fusion_platform.models import fields
+
+
+class _Fallback(Exception):
+    """
+    Raised when the compiled loader cannot load a value, so that the schema must be used instead.
+    """
+    pass
+
+
+class CompiledLoader:
+    """
+    Loads data using a schema, but with a compiled fast path which avoids the overhead of a full Marshmallow load for the data typically returned by the Fusion
+    Platform<sup>&reg;</sup>. The fast path is built once for each schema class from its fields, and gives identical results to the schema. Whenever the fast
+    path cannot load the data, such as when the data is invalid, the schema itself is used so that the same errors are raised.
+    """
+
+    # The loaders for each schema class.
+    _LOADERS = {}
+    _LOCK = Lock()
+
+    def __init__(self, schema):
+        """
+        Initialises the object.
+
+        Args:
+            schema: The schema object.
+        """
+        self.__schema = schema
+        self.__load = CompiledLoader.__compile_schema(schema)
+
+    @property
+    def compiled(self):
+        """
+        Returns:
+            True if the schema has a compiled fast path, otherwise False if the schema is always used.
+        """
+        return self.__load is not None
+
+    @classmethod
+    def for_schema(cls, schema):
+        """
+        Gets the loader for a schema. Loaders are cached for each schema class, unless the schema object has been customised.
+
+        Args:
+            schema: The schema object.
+
+        Returns:
+            The loader.
+        """
+        if not CompiledLoader.__is_plain(schema):
+            return CompiledLoader(schema)
+
+        loader = CompiledLoader._LOADERS.get(type(schema))
+
+        if loader is None:
+            loader = CompiledLoader(schema)
+
+            with CompiledLoader._LOCK:
+                loader = CompiledLoader._LOADERS.setdefault(type(schema), loader)
+
+        return loader
+
+    def load(self, data, partial=False):
+        """
+        Loads the data, exactly as if it were loaded by the schema.
+
+        Args:
+            data: The data to load.
+            partial: Skip validation of required fields which are missing? Default False.
+
+        Returns:
+            The loaded data.
+
+        Raises:
+            ValidationError: if the data could not be loaded or validated.
+        """
+        if (self.__load is not None) and ((partial is None) or isinstance(partial, bool)):
+            try:
+                return self.__load(data, bool(partial))
+            except Exception:
+                pass  # Use the schema, which will raise the appropriate error.
+
+        return self.__schema.load(data, partial=partial)
+
+    @staticmethod
+    def __compile_field(field, name):
+        """
+        Compiles a field into a function which converts a value which is present in the data.
+
+        Args:
+            field: The bound field object.
+            name: The field name passed to the field on deserialization, or None if the field is nested within another field.
+
+        Returns:
+            The conversion function, which takes the value, the data and whether the load is partial.
+        """
+
+        def deserialize(value, data, partial):
+            return field.deserialize(value, name, data, partial=partial)
+
+        # Fields with any additional processing are always deserialized by the field itself.
+        if (len(field.validators) > 0) or getattr(field, 'pre_load', None) or getattr(field, 'post_load', None):
+            return deserialize
+
+        convert = CompiledLoader.__compile_value(field)
+
+        if convert is None:
+            return deserialize
+
+        allow_none = field.allow_none
+
+        def convert_field(value, data, partial):
+            if value is None:
+                if allow_none:
+                    return None
+
+                raise _Fallback()
+
+            result = convert(value, partial)
+            return deserialize(value, data, partial) if result is missing else result
+
+        return convert_field
+
+    @staticmethod
+    def __compile_schema(schema):
+        """
+        Compiles a schema into a function which loads data.
+
+        Args:
+            schema: The schema object.
+
+        Returns:
+            The load function, which takes the data and whether the load is partial, or None if the schema cannot be compiled.
+        """
+        if not CompiledLoader.__is_plain(schema):
+            return None
+
+        hooks = getattr(schema, '_hooks', {})
+
+        if any([hooks.get(hook) for hook in [PRE_LOAD, POST_LOAD, VALIDATES, VALIDATES_SCHEMA]]):
+            return None
+
+        dict_class = schema.dict_class
+        entries = []
+
+        for attribute_name, field in schema.load_fields.items():
+            data_key = field.data_key if field.data_key is not None else attribute_name
+            key = field.attribute or attribute_name
+
+            if '.' in key:
+                return None
+
+            entries.append((data_key, key, field.required, field.load_default, CompiledLoader.__compile_field(field, data_key)))
+
+        data_keys = frozenset([entry[0] for entry in entries])
+        check_unknown = schema.unknown == RAISE
+
+        def load(data, partial):
+            if (type(data) is not dict) or (check_unknown and not data_keys.issuperset(data)):
+                raise _Fallback()
+
+            result = dict_class()
+
+            for data_key, key, required, load_default, convert in entries:
+                value = data.get(data_key, missing)
+
+                if value is not missing:
+                    result[key] = convert(value, data, partial)
+
+                elif not partial:
+                    if required:
+                        raise _Fallback()
+
+                    if load_default is not missing:
+                        result[key] = load_default() if callable(load_default) else load_default
+
+            return result
+
+        return load
+
+    @staticmethod
+    def __compile_value(field):
+        """
+        Compiles the conversion of a value which is not None for the field types commonly used by the models. Each conversion handles only the most common input
+        types, returning missing for any other input so that the field itself is used instead.
+
+        Args:
+            field: The bound field object.
+
+        Returns:
+            The conversion function, which takes the value and whether the load is partial, or None if the field type cannot be compiled.
+        """
+        field_type = type(field)
+
+        if field_type is fields.String:
+            allow_none = field.allow_none
+
+            def convert(value, partial):
+                if type(value) is not str:
+                    return missing
+
+                return None if (allow_none and (len(value) <= 0)) else value
+
+            return convert
+
+        if field_type is fields.UUID:
+            return lambda value, partial: uuid.UUID(value) if type(value) is str else missing
+
+        if field_type is fields.DateTime:
+            parse = field.DESERIALIZATION_FUNCS.get(field.format or field.DEFAULT_FORMAT)
+
+            if parse is None:
+                return None
+
+            return lambda value, partial: parse(value) if (type(value) is str) and (len(value) > 0) else missing
+
+        if field_type is fields.Integer:
+            return lambda value, partial: value if type(value) is int else missing
+
+        if field_type is fields.Boolean:
+            if field.truthy and ((True not in field.truthy) or (False in field.truthy) or (False not in field.falsy)):
+                return None
+
+            return lambda value, partial: value if (value is True) or (value is False) else missing
+
+        if (field_type is fields.Float) and not field.allow_nan:
+            return lambda value, partial: value if (type(value) is float) and math.isfinite(value) else missing
+
+        if (field_type is fields.Decimal) and (field.places is None) and not field.allow_nan:
+            def convert(value, partial):
+                if type(value) not in (int, float, str):
+                    return missing
+
+                number = decimal.Decimal(str(value))
+
+                if not number.is_finite():
+                    raise _Fallback()
+
+                return number
+
+            return convert
+
+        if field_type is fields.List:
+            inner = CompiledLoader.__compile_field(field.inner, None)
+            return lambda value, partial: [inner(item, None, partial) for item in value] if type(value) is list else missing
+
+        if (field_type is fields.Nested) and (not field.many) and (field.unknown is None):
+            load = CompiledLoader.for_schema(field.schema).__load
+
+            if load is None:
+                return None
+
+            return lambda value, partial: load(value, partial) if type(value) is dict else missing
+
+        return None
+
+    @staticmethod
+    def __is_plain(schema):
+        """
+        Checks whether a schema object loads in the same way as any other object of its class, so that it can be compiled and cached.
+
+        Args:
+            schema: The schema object.
+
+        Returns:
+            True if the schema object is plain.
+        """
+        return (schema.only is None) and (not schema.exclude) and (not schema.many) and (not schema.partial) and (schema.unknown in [EXCLUDE, RAISE])
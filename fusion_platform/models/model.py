@@ -6,12 +6,23 @@ author: Matthew Casey
 &copy; [Digital Content Analysis Technology Ltd](https://www.d-cat.co.uk)
 """
 
+from concurrent.futures import FIRST_COMPLETED, wait
 import copy
+from functools import partial
 import i18n
+from itertools import islice
+from threading import Event
+import time
 
 from fusion_platform.base import Base
+from fusion_platform.common.metrics import TemplatedPath
+from fusion_platform.common.page_sizer import PageSizer
+from fusion_platform.common.prefetcher import Prefetcher
+from fusion_platform.common.priority_executor import PriorityExecutor
 from fusion_platform.common.utilities import string_camel_to_underscore, value_to_read_only, value_to_string
-from fusion_platform.session import Session
+from fusion_platform.models.loader import CompiledLoader
+from fusion_platform.models.record import Record
+from fusion_platform.session import RequestError, Session
 
 
 class ModelError(Exception):
@@ -54,6 +65,7 @@ class Model(Base):
     _FIELD_CHAIN_INDEX = 'chain_index'
     _FIELD_CONSTRAINED_NAMES = 'constrained_names'
     _FIELD_CONSTRAINED_VALUES = 'constrained_values'
+    _FIELD_CREATED_AT = 'created_at'
     _FIELD_CRS = 'crs'
     _FIELD_DATA_TYPE = 'data_type'
     _FIELD_DISPATCH_INTERMEDIATE = 'dispatch_intermediate'
@@ -167,6 +179,7 @@ class Model(Base):
         # Initialise the fields.
         self.__model = None
         self.__persisted = False
+        self.__loaded_response = None
 
     @classmethod
     def _extract_extras(cls, response, extras=None):
@@ -313,7 +326,7 @@ class Model(Base):
         Returns:
             True if the object's attributes are equal.
         """
-        if isinstance(other, Model):
+        if isinstance(other, (Model, Record)):
             return self.attributes == other.attributes
 
         return False
@@ -321,8 +334,8 @@ class Model(Base):
     @classmethod
     def _first_and_generator(cls, partial_generator):
         """
-        Executes the partial generator to return the first returned model and a generator through all models (including the first). The partial generator is
-        assumed to take an extra keyword argument used to limit the results.
+        Executes the partial generator to return the first returned model and a generator through all models (including the first). The query is only issued
+        once: the first page of results provides the first model, and the generator then continues from the same pages rather than starting again.
 
         Args:
             partial_generator: The partial generator used to obtain the results.
@@ -334,12 +347,49 @@ class Model(Base):
             RequestError: if any get fails.
             ModelError: if a model could not be loaded or validated from the Fusion Platform<sup>&reg;</sup>.
         """
-        # We want to return the first model if available, plus the iterator through the rest. We therefore issue the query first with an items per request of 1 to
-        # obtain the first model in a single request. The partial is then used to return a generator for them all.
-        models = partial_generator(items_per_request=1)
+        models = partial_generator()
         model = next(models, None)
 
-        return model, partial_generator()
+        return model, Model.__first_and_rest(model, models)
+
+    @staticmethod
+    def __first_and_rest(model, models):
+        """
+        Generates the first model which has already been obtained, followed by the remaining models.
+
+        Args:
+            model: The first model, or None if there are no models.
+            models: The generator through the remaining models.
+
+        Returns:
+            A generator through all the models.
+        """
+        try:
+            if model is not None:
+                yield model
+                yield from models
+
+        finally:
+            # Stop getting pages if the generator is closed early.
+            models.close()
+
+    @classmethod
+    def _from_record(cls, session, model):
+        """
+        Builds a persisted model object from the model dictionary held by a record.
+
+        Args:
+            session: The linked session object for interfacing with the Fusion Platform<sup>&reg;</sup>.
+            model: The model dictionary. Its values are shared with the record, and so they must not be changed afterwards.
+
+        Returns:
+            The persisted model object.
+        """
+        model_object = cls(session)
+        model_object.__set_model(model)
+        model_object.__persisted = True
+
+        return model_object
 
     def get(self, **kwargs):
         """
@@ -431,7 +481,7 @@ class Model(Base):
             kwargs: Any explicit ids to be used.
 
         Returns:
-            The constructed path.
+            The constructed path, which remembers its template so that request metrics can be recorded against the template.
 
         Raises:
             NotImplementedError: if the template does not exist.
@@ -439,7 +489,73 @@ class Model(Base):
         if template is None:
             raise NotImplementedError
 
-        return template.format(**self._get_ids(**kwargs))
+        return TemplatedPath(template.format(**self._get_ids(**kwargs)), template)
+
+    @classmethod
+    def __get_pages(cls, session, path, items_per_request=None, reverse=False, filter=None, search=None, load_extras=True):
+        """
+        Gets each page of a list from the API, following the last index returned with each page until there are no more pages. See #_models_from_api_path.
+
+        Args:
+            session: The linked session object for interfacing with the Fusion Platform<sup>&reg;</sup>.
+            path: The path used to retrieve the list of objects.
+            items_per_request: The optional fixed maximum number of items to retrieve at each request. Defaults to the session's list page size. If the
+                session has a maximum list page size, then the limit sent with each request is adapted between these as the pages are obtained.
+            reverse: Whether the list should be reversed or not. Default False.
+            filter: The optional filter to be applied to the results. Default is no filter.
+            search: The optional search term to be applied to the results. Default to no search term.
+            load_extras: Should the model extras be extracted? Default True.
+
+        Returns:
+            A generator of the list of items and the extracted extras for each page.
+
+        Raises:
+            RequestError: if the get fails.
+        """
+        # Modify the filter keys so that they match the API requirement.
+        filter = {} if filter is None else filter
+        filter = {f"{Model._REQUEST_KEY_FILTER}[{key}]": value for key, value in filter.items()}
+
+        # Make sure the search term is lowercase, if provided.
+        search = search.lower() if search is not None else search
+
+        # Unless the items per request are fixed, the page size grows while the pages are within the session's targets.
+        if items_per_request is None:
+            sizer = PageSizer(session.list_page_size, maximum=session.list_page_size_maximum, time_target=session.list_page_time_target,
+                              bytes_target=session.list_page_bytes_target)
+        else:
+            sizer = PageSizer(items_per_request)
+
+        # Loop through all required pages.
+        query_parameters = {Model._REQUEST_KEY_REVERSE: reverse, Model._REQUEST_KEY_SEARCH: search, **filter}
+        finished = False
+        last = {}
+        page = 0
+
+        while not finished:
+            # Send the request. The span only covers getting the page, as it must not remain current while the page is yielded to the caller.
+            with session.tracer.start_as_current_span('Model._models_from_api_path', attributes={'fusion_platform.model': cls.__name__,
+                                                                                                 'fusion_platform.page': page,
+                                                                                                 'fusion_platform.limit': sizer.size}) as span:
+                started_at = time.monotonic()
+                response, length = session.request(path=path, query_parameters={Model._REQUEST_KEY_LIMIT: sizer.size, **query_parameters, **last},
+                                                   include_length=True)
+                items = response.get(Model._RESPONSE_KEY_LIST, [])
+                span.set_attribute('fusion_platform.items', len(items))
+
+                # The size of the page is taken from the length of the response body.
+                sizer.update(time.monotonic() - started_at, len(items), length)
+
+                # Extract the last index so that we know if we need to continue getting pages.
+                last = {f"{Model._REQUEST_KEY_LAST}[{key}]": value for key, value in response.get(Model._RESPONSE_KEY_LAST).items()} if response.get(
+                    Model._RESPONSE_KEY_LAST) is not None else {}
+                finished = len(last) <= 0
+                page += 1
+
+                # Optionally extract the extras.
+                extracted_extras = cls._extract_extras(response, extras=cls._EXTRAS_LIST) if load_extras else {}
+
+            yield items, extracted_extras
 
     def __get_schema(self):
         """
@@ -464,6 +580,32 @@ class Model(Base):
         """
         return value_to_read_only(self.__model)
 
+    @classmethod
+    def __model_from_item(cls, session, item, record_class=None, **kwargs):
+        """
+        Builds a persisted model, or its record, from an item returned in a list. The item is not modified, as it may be cached by the session.
+
+        Args:
+            session: The linked session object for interfacing with the Fusion Platform<sup>&reg;</sup>.
+            item: The item dictionary with any extras added.
+            record_class: The optional record class used to build a record rather than a model.
+            kwargs: Any additional attributes which are to be set on the model which are not provided in the item.
+
+        Returns:
+            The model or record.
+
+        Raises:
+            ModelError: if the model could not be loaded or validated from the Fusion Platform<sup>&reg;</sup>.
+        """
+        if record_class is not None:
+            return Model.__load_response(lambda: cls._SCHEMA, item, lambda model: record_class.from_model(session, model), **kwargs)
+
+        model = cls(session)
+        model._set_model_from_response(item, **kwargs)
+        model.__persisted = True
+
+        return model
+
     @classmethod
     def _model_from_api_id(cls, session, **kwargs):
         """
@@ -489,25 +631,132 @@ class Model(Base):
         return model
 
     @classmethod
-    def _models_from_api_ids(cls, session, ids):
+    def _models_from_api_ids(cls, session, ids, ordered=True, errors=False):
         """
         Generates an iterator through a series of models using their ids. Each model is loaded using an id. Any extras are optionally added.
 
+        Up to the session's fetch maximum workers number of models are obtained concurrently, ahead of those being consumed. Only the first model is obtained
+        before it is given, with the number obtained concurrently doubling each time another model is needed, so that a caller which only needs the first few
+        models does not cause the rest to be obtained. By default, the models are given in the same order as their ids, and an error is raised when the model
+        which failed would have been given. The remaining models are then not obtained.
+
         Args:
             session: The linked session object for interfacing with the Fusion Platform<sup>&reg;</sup>.
             ids: A list of dictionaries containing the ids to iterate through.
+            ordered: Give the models in the same order as their ids? Default True. Otherwise, each model is given as soon as it has been obtained.
+            errors: Give each model together with its ids dictionary, with the error raised in place of the model if it could not be obtained? Default False,
+                which raises the error.
 
         Returns:
-            A generator to iterate through the models retrieved via the model GET.
+            A generator to iterate through the models retrieved via the model GET, or through tuples of the ids dictionary and either the model or the error.
 
         Raises:
             RequestError: if the get fails.
             ModelError: if the model could not be loaded or validated from the Fusion Platform<sup>&reg;</sup>.
         """
-        return (cls._model_from_api_id(session, **id) for id in ids)
+        ids = list(ids)
+        max_workers = min(session.fetch_max_workers, len(ids))
+
+        # There is no need for workers to obtain the models one at a time.
+        if max_workers <= 1:
+            for id in ids:
+                try:
+                    result = cls._model_from_api_id(session, **id)
+                except (RequestError, ModelError) as e:
+                    if not errors:
+                        raise
+
+                    result = e
+
+                yield (id, result) if errors else result
+
+            return
+
+        # Only the models being obtained are submitted, so that the workers do not get too far ahead of the models being consumed. Models which are still being
+        # obtained when the generator is closed are cancelled, so that their requests are not retried.
+        executor = PriorityExecutor(max_workers, thread_name_prefix='fusion_platform_fetch')
+        cancelled = Event()
+        pending = iter(ids)
+        futures = {}
+        window = 1
+
+        def fetch(next_id):
+            with session.cancellable(cancelled):
+                return cls._model_from_api_id(session, **next_id)
+
+        def submit(next_ids):
+            for next_id in next_ids:
+                futures[executor.submit(fetch, next_id)] = next_id
+
+        try:
+            submit(islice(pending, window))
+
+            while len(futures) > 0:
+                # Futures are held in the order of their ids.
+                if ordered:
+                    done = [next(iter(futures))]
+                else:
+                    completed, _ = wait(futures, return_when=FIRST_COMPLETED)
+                    done = [future for future in futures if future in completed]
+
+                for future in done:
+                    id = futures.pop(future)
+
+                    try:
+                        result = future.result()
+                    except (RequestError, ModelError) as e:
+                        if not errors:
+                            raise
+
+                        result = e
+
+                    yield (id, result) if errors else result
+
+                    # Another model is needed, so obtain more of the models concurrently.
+                    window = min(max_workers, window * 2)
+                    submit(islice(pending, max(0, window - len(futures))))
+
+        finally:
+            # Do not obtain any more models if the generator is closed early or an error is raised, and wait for those being obtained to stop.
+            cancelled.set()
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @staticmethod
+    def __load_response(get_schema, response, build, partial=False, **kwargs):
+        """
+        Loads the model from the response using the schema to obtain the corresponding Python representation of it, before building the result from it.
+
+        Args:
+            get_schema: The function which returns the schema used to load and validate the model.
+            response: The response containing the model attributes.
+            build: The function which builds the result from the loaded model dictionary.
+            partial: Skip validation of required fields which are missing? Default False.
+            kwargs: Any additional attributes which are to be set on the model which are not provided in the response.
+
+        Returns:
+            The built result.
+
+        Raises:
+            ModelError: if the model could not be loaded or validated from the Fusion Platform<sup>&reg;</sup>.
+        """
+        try:
+            # If we are loading a partial model, then remove any keys which have None values.
+            if partial:
+                response = {key: value for key, value in response.items() if value is not None}
+
+            model = CompiledLoader.for_schema(get_schema()).load(response, partial=partial)
+            return build({**model, **kwargs})  # The loaded model is not shared, and so does not need to be copied.
+
+        except ModelError:
+            raise
+
+        except Exception as e:
+            message = str(e)
+            raise ModelError(i18n.t('models.model.failed_model_validation', message=message)) from e
 
     @classmethod
-    def _models_from_api_path(cls, session, path, items_per_request=24, reverse=False, filter=None, search=None, load_extras=True, **kwargs):
+    def _models_from_api_path(cls, session, path, items_per_request=None, reverse=False, filter=None, search=None, load_extras=True, compact=False,
+                              prefetch=None, **kwargs):
         """
         Generates an iterator through a series of models using a path which returns a list of objects. Each model is loaded from the list with its expected extras.
         Since API lists are paged, the generator takes into account having to get subsequent pages of results.
@@ -537,62 +786,155 @@ class Model(Base):
 
         All string filtering is case-sensitive.
 
+        Unless the items per request are given, the first page requests the session's list page size. Each later page then requests twice as many items while
+        the pages are obtained within the session's time and size targets, up to the session's maximum page size, and half as many otherwise.
+
         Args:
             session: The linked session object for interfacing with the Fusion Platform<sup>&reg;</sup>.
             path: The path used to retrieve the list of objects.
-            items_per_request: The optional maximum number of items to retrieve at each request. Default 24.
+            items_per_request: The optional fixed maximum number of items to retrieve at each request. Defaults to the session's list page size. If the
+                session has a maximum list page size, then the limit sent with each request is adapted between these as the pages are obtained.
             reverse: Whether the list should be reversed or not. Default False.
             filter: The optional filter to be applied to the results. Default is no filter.
             search: The optional search term to be applied to the results. Default to no search term.
             load_extras: Should the model extras be automatically loaded? Default True.
+            compact: Return compact read-only records rather than model objects, which use far less memory when many are held at once? Default False.
+            prefetch: The optional number of upcoming pages fetched in the background while the current page is consumed. Defaults to the session's list
+                prefetch.
             kwargs: Any additional attributes which are to be set on each model which are not provided in each item from the path.
 
         Returns:
-            A generator to iterate through the models retrieved via the path.
+            A generator to iterate through the models, or their records, retrieved via the path.
 
         Raises:
             RequestError: if the get fails.
             ModelError: if the model could not be loaded or validated from the Fusion Platform<sup>&reg;</sup>.
         """
-        # Modify the filter keys so that they match the API requirement.
+        # Records share a class, and therefore their field table, for each model class.
+        record_class = Record.for_model(cls) if compact else None
+
+        # Get the pages, optionally fetching the upcoming pages in the background while each page is consumed.
+        prefetch = session.list_prefetch if prefetch is None else prefetch
+        pages = cls.__get_pages(session, path, items_per_request=items_per_request, reverse=reverse, filter=filter, search=search, load_extras=load_extras)
+        pages = Prefetcher(pages, prefetch, thread_name='fusion_platform_prefetch') if prefetch > 0 else pages
+
+        try:
+            # Build the generator around all of the returned items, which must all have been persisted. Optional extras are added to each model.
+            for items, extracted_extras in pages:
+                for item in items:
+                    yield cls.__model_from_item(session, {**item, **extracted_extras}, record_class=record_class, **kwargs)
+
+        finally:
+            # Stop getting pages if the generator is closed early.
+            pages.close()
+
+    @classmethod
+    def _models_from_api_path_sharded(cls, session, path, field=None, boundaries=None, ordered=False, items_per_request=None, reverse=False, filter=None,
+                                      search=None, load_extras=True, compact=False, **kwargs):
+        """
+        Generates an iterator through a series of models using a path which returns a list of objects, as for #_models_from_api_path, but with several pages
+        requested concurrently. If boundaries are provided, the list is split into shards using the field: those models with a value less than the first
+        boundary, those with a value between (inclusive) each consecutive pair of boundaries, and those with a value greater than or equal to the last boundary.
+        Each shard is then listed concurrently. Otherwise, the list is walked both forwards and in reverse concurrently until the two walks meet.
+
+        The models from each shard or walk are merged so that each model is only given once. By default, the models are given in the order in which they are
+        obtained. If ordered, each shard is given in turn in the order of the boundaries (reversed if the list is reversed), or the models found by the reverse
+        walk are held until the walks meet so that all the models are given in their natural order. Once the generator is closed, or the walks have met, the
+        requests still being made for the shards or walks are not retried.
+
+        The ids of the models which have been found are held to remove duplicates, while each shard or walk holds at most the session's list prefetch number of
+        pages (and at least one) waiting to be consumed. Note that an ordered walk without boundaries also holds every item found by the reverse walk in memory
+        until the walks meet, which is roughly half of the list. Use boundaries to give very long lists in order.
+
+        Args:
+            session: The linked session object for interfacing with the Fusion Platform<sup>&reg;</sup>.
+            path: The path used to retrieve the list of objects.
+            field: The name of the sortable field, such as created_at, used to split the list into shards. Required with boundaries.
+            boundaries: The optional ascending list of field values, in the form expected by the API, which split the list into shards. The filter must not
+                also filter the field using the lt, between or ge modifiers.
+            ordered: Give the models in order? Default False.
+            items_per_request: The optional fixed maximum number of items to retrieve at each request. Defaults to the session's list page size. If the
+                session has a maximum list page size, then the limit sent with each request is adapted between these as the pages are obtained.
+            reverse: Whether the list should be reversed or not. Default False.
+            filter: The optional filter to be applied to the results. Default is no filter.
+            search: The optional search term to be applied to the results. Default to no search term.
+            load_extras: Should the model extras be automatically loaded? Default True.
+            compact: Return compact read-only records rather than model objects? Default False.
+            kwargs: Any additional attributes which are to be set on each model which are not provided in each item from the path.
+
+        Returns:
+            A generator to iterate through the models, or their records, retrieved via the path.
+
+        Raises:
+            RequestError: if any get fails.
+            ModelError: if a model could not be loaded or validated from the Fusion Platform<sup>&reg;</sup>.
+        """
+        record_class = Record.for_model(cls) if compact else None
         filter = {} if filter is None else filter
-        filter = {f"{Model._REQUEST_KEY_FILTER}[{key}]": value for key, value in filter.items()}
+        depth = max(1, session.list_prefetch)
+        get_pages = partial(cls.__get_pages, session, path, items_per_request=items_per_request, search=search, load_extras=load_extras)
+
+        # Build the pages for each shard, or for the walks in each direction.
+        if boundaries:
+            shards = [(Model._FILTER_MODIFIER_LT, boundaries[0])] + [(Model._FILTER_MODIFIER_BETWEEN, [lower, upper]) for lower, upper in
+                                                                     zip(boundaries[:-1], boundaries[1:])] + [(Model._FILTER_MODIFIER_GE, boundaries[-1])]
+            shards = shards[::-1] if reverse else shards
+            sources = [get_pages(reverse=reverse, filter={**filter, **cls._build_filter([(field, modifier, value)])}) for modifier, value in shards]
+        else:
+            sources = [get_pages(reverse=reverse, filter=filter), get_pages(reverse=not reverse, filter=filter)]
 
-        # Make sure the search term is lowercase, if provided.
-        search = search.lower() if search is not None else search
+        # Each source is fetched concurrently. Ordered shards are consumed in turn, while everything else is consumed as it is obtained. The prefetchers are
+        # created in a cancellable context, so that the requests for the shards or walks are not retried once the generator is closed.
+        cancelled = Event()
 
-        # Loop through all required pages.
-        finished = False
-        last = {}
+        with session.cancellable(cancelled):
+            if boundaries and ordered:
+                prefetchers = [Prefetcher(source, depth, thread_name=f"fusion_platform_shard_{index + 1}") for index, source in enumerate(sources)]
+                pages = ((index, page) for index, prefetcher in enumerate(prefetchers) for page in prefetcher)
+            else:
+                prefetchers = [Prefetcher.interleave(sources, depth, thread_name_prefix='fusion_platform_shard')]
+                pages = prefetchers[0]
 
-        while not finished:
-            # Build the query parameters, including the last index, if available.
-            query_parameters = {Model._REQUEST_KEY_LIMIT: items_per_request, Model._REQUEST_KEY_REVERSE: reverse, Model._REQUEST_KEY_SEARCH: search, **filter,
-                                **last}
+        found = {}
+        held = []
 
-            # Send the request.
-            response = session.request(path=path, query_parameters=query_parameters)
+        try:
+            for index, (items, extracted_extras) in pages:
+                met = False
 
-            # Extract the last index so that we know if we need to continue getting pages.
-            last = {f"{Model._REQUEST_KEY_LAST}[{key}]": value for key, value in response.get(Model._RESPONSE_KEY_LAST).items()} if response.get(
-                Model._RESPONSE_KEY_LAST) is not None else {}
-            finished = len(last) <= 0
+                for item in items:
+                    id = item.get(Model._FIELD_ID)
 
-            # Optionally extract the extras.
-            extracted_extras = cls._extract_extras(response, extras=cls._EXTRAS_LIST) if load_extras else {}
+                    # When one walk finds a model already found by the other walk, the walks have met and so every model has been found.
+                    if (id is not None) and (id in found):
+                        met = (not boundaries) and (found[id] != index)
 
-            # Build the generator around all of the returned items, which must all have been persisted. Optional extras are added to each model.
-            for item in response.get(Model._RESPONSE_KEY_LIST, []):
-                # Add the optional extras into the item.
-                for key, value in extracted_extras.items():
-                    item[key] = value
+                        if met:
+                            break
 
-                # Build the model from the modified item dictionary.
-                model = cls(session)
-                model._set_model_from_response(item, **kwargs)
-                model.__persisted = True
+                        continue
 
-                yield model
+                    if id is not None:
+                        found[id] = index
+
+                    if (not boundaries) and ordered and (index > 0):
+                        held.append({**item, **extracted_extras})
+                    else:
+                        yield cls.__model_from_item(session, {**item, **extracted_extras}, record_class=record_class, **kwargs)
+
+                if met:
+                    break
+
+        finally:
+            # Stop getting pages once the walks have met, or if the generator is closed early.
+            cancelled.set()
+
+            for prefetcher in prefetchers:
+                prefetcher.close()
+
+        # The models found by the reverse walk are given last, in their natural order.
+        for item in reversed(held):
+            yield cls.__model_from_item(session, item, record_class=record_class, **kwargs)
 
     def _new(self, query_parameters=None, **kwargs):
         """
@@ -643,12 +985,18 @@ class Model(Base):
         # Send the request.
         response = self._session.request(path=path, query_parameters=query_parameters, method=method, body=body)
 
+        # If the session has returned the same cached response which was last loaded into the model, then the model is already up-to-date.
+        loaded_response = (response, key, partial, kwargs)
+
+        if (self.__loaded_response is not None) and (self.__loaded_response[0] is response) and (self.__loaded_response[1:] == loaded_response[1:]):
+            return
+
         # Assume that the resulting model is held within the expected key within the resulting dictionary.
         if key not in response:
             raise ModelError(i18n.t('models.model.failed_model_send_and_load'))
 
-        # If any extras are required, extract them and add them to the model.
-        modified_response = response.get(key, {}) if key is not None else response
+        # If any extras are required, extract them and add them to the model. We copy the response, as it may be cached by the session.
+        modified_response = dict(response.get(key, {}) if key is not None else response)
         extracted_extras = self.__class__._extract_extras(response, extras=self.__class__._EXTRAS_MODEL)
 
         for key, value in extracted_extras.items():
@@ -660,6 +1008,7 @@ class Model(Base):
 
         # Load the response into the model. Optionally ignore missing required fields and those which are None.
         self._set_model_from_response(modified_response, partial=partial)
+        self.__loaded_response = loaded_response
 
     def __setattr__(self, key, value):
         """
@@ -687,24 +1036,34 @@ class Model(Base):
             keys: The hierarchical list of keys from top to bottom.
             value: The value to set.
         """
-        # Step through the hierarchy to find the bottom key.
+        # Step through the hierarchy to find the bottom key. Each dictionary and list on the way is copied, so that any read-only views of the model which have
+        # already been provided are unchanged.
         top_key = keys[0]
         bottom_key = keys[-1]
-        field = self.__model if len(keys) <= 1 else None
+        model = copy.copy(self.__model)
+        field = model if len(keys) <= 1 else None
 
         for key in keys[:-1]:  # Does not include bottom key
-            field = self.__model if field is None else field
+            field = model if field is None else field
 
             if (isinstance(field, dict) and (key not in field)) or (isinstance(field, list) and (key >= len(field))):
                 raise ModelError(i18n.t('models.model.no_such_keys', keys=keys))
             else:
-                field = field[key]
+                inner_field = field[key]
+
+                if isinstance(inner_field, (dict, list)):
+                    inner_field = copy.copy(inner_field)
+                    field[key] = inner_field
+
+                field = inner_field
 
         if field is None:
             raise ModelError(i18n.t('models.model.no_such_keys', keys=keys))
 
-        # Set the bottom key value.
+        # Set the bottom key value. The model no longer reflects the last loaded response.
         field[bottom_key] = value
+        self.__model = model
+        self.__loaded_response = None
 
         # Now update the object dictionary to reflect the change.
         schema = self.__get_schema()
@@ -720,8 +1079,20 @@ class Model(Base):
         Args:
             model: The model dictionary which this model object will represent.
         """
-        # Convert the model dictionary into read-only properties. We use a deep copy of the dictionary to prevent later external changes.
-        self.__model = copy.deepcopy(model)
+        # We use a deep copy of the dictionary to prevent later external changes.
+        self.__set_model(copy.deepcopy(model))
+
+    def __set_model(self, model):
+        """
+        Sets the underlying model for the object without copying it. The model dictionary is shared by the read-only views of its values, and so it must not be
+        changed afterwards.
+
+        Args:
+            model: The model dictionary which this model object will represent.
+        """
+        # Convert the model dictionary into read-only properties. The nested values are only made read-only when they are accessed.
+        self.__model = model
+        self.__loaded_response = None
 
         # Remove all existing field values.
         schema = self.__get_schema()
@@ -751,20 +1122,7 @@ class Model(Base):
             ModelError: if the model could not be loaded or validated from the Fusion Platform<sup>&reg;</sup>.
         """
         # Load the model in using the schema, and then use it to set the attributes of the model.
-        try:
-            # If we are loading a partial model, then remove any keys which have None values.
-            if partial:
-                response = {key: value for key, value in response.items() if value is not None}
-
-            model = self.__get_schema().load(response, partial=partial)
-            self._set_model({**model, **kwargs})
-
-        except ModelError:
-            raise
-
-        except Exception as e:
-            message = str(e)
-            raise ModelError(i18n.t('models.model.failed_model_validation', message=message)) from e
+        Model.__load_response(self.__get_schema, response, self.__set_model, partial=partial, **kwargs)
 
     def __repr__(self):
         """
@@ -794,6 +1152,22 @@ class Model(Base):
 
         return ','.join(header), ','.join(line)
 
+    def to_record(self):
+        """
+        Converts the persisted model into a compact read-only record, which uses far less memory when many models are held at once. The record uses the schema
+        defined by the model class.
+
+        Returns:
+            The record.
+
+        Raises:
+            ModelError: if the model has not been persisted.
+        """
+        if not self.__persisted:
+            raise ModelError(i18n.t('models.model.not_persisted'))
+
+        return Record.for_model(self.__class__).from_model(self._session, self.__model)
+
     def update(self, **kwargs):
         """
         Attempts to update the model object with the given values. For models which have not been persisted, the relevant fields are updated without validation,
@@ -111,7 +111,7 @@ class Organisation(Model):
     _PATH_SERVICES = f"{_PATH_BASE}/services/latest"
     _PATH_DISPATCHERS = f"{_PATH_BASE}/services/dispatchers"
 
-    def create_data(self, name, file_type, files, wait=False, **kwargs):
+    def create_data(self, name, file_type, files, wait=False, upload_priority=0, **kwargs):
         """
         Creates a data object for the organisation and uploads the corresponding files. Optionally waits for the upload and analysis to complete.
 
@@ -120,13 +120,14 @@ class Organisation(Model):
             file_type: The type of files that the data object will hold.
             files: The list of file paths to be uploaded.
             wait: Optionally wait for the upload and analysis to complete? Default False.
+            upload_priority: The optional priority of the uploads, where lower values are uploaded first. Default 0.
             kwargs: The model attributes which override those already in the template.
 
         Returns:
             The created data object.
 
         Raises:
-            RequestError: if the create fails.
+            RequestError: if the create or the addition of a file fails, or if waiting and an upload fails.
             ModelError: if the model could not be created and validated by the Fusion Platform<sup>&reg;</sup>.
         """
         # Get a new template for the data model.
@@ -134,7 +135,7 @@ class Organisation(Model):
         data._new(organisation_id=self.id)
 
         # Now attempt to create the data item with any overriding keyword arguments.
-        data._create(name, file_type, files, wait=wait, **kwargs)
+        data._create(name, file_type, files, wait=wait, upload_priority=upload_priority, **kwargs)
 
         return data
 
@@ -282,6 +283,27 @@ class Organisation(Model):
         """
         return self.__find_services(self.__class__._PATH_SERVICES, id, ssd_id, name, keyword, search)
 
+    def list_data(self, boundaries=None, ordered=False):
+        """
+        Provides an iterator through all the organisation's uploaded data objects, with several pages requested concurrently. This is faster than #data for very
+        large numbers of data objects. If creation date boundaries are provided, the data objects created before, between and after the boundaries are listed
+        concurrently. Otherwise, the data objects are listed from both ends concurrently until they meet.
+
+        Args:
+            boundaries: The optional ascending list of creation dates, as ISO 8601 strings, which split the data objects into shards.
+            ordered: Give the data objects in the same order as #data? Default False, which gives them as soon as they are found. Without boundaries, this holds
+                the data objects found from the far end in memory until the listing is complete.
+
+        Returns:
+            An iterator through the data objects.
+
+        Raises:
+            RequestError: if any get fails.
+            ModelError: if a model could not be loaded or validated from the Fusion Platform<sup>&reg;</sup>.
+        """
+        return Data._models_from_api_path_sharded(self._session, self._get_path(self.__class__._PATH_DATA), field=self.__class__._FIELD_CREATED_AT,
+                                                  boundaries=boundaries, ordered=ordered)
+
     def new_process(self, name, service):
         """
         Creates a new template process from the service object. This process is not persisted to the Fusion Platform<sup>&reg;</sup>.
@@ -635,8 +635,8 @@ class Process(Model):
         if Model._RESPONSE_KEY_MODEL not in response:
             raise ModelError(i18n.t('models.process.failed_copy'))
 
-        # Make sure we have an organisation id.
-        modified_response = response.get(Model._RESPONSE_KEY_MODEL, {})
+        # Make sure we have an organisation id. We copy the response, as it may be cached by the session.
+        modified_response = dict(response.get(Model._RESPONSE_KEY_MODEL, {}))
         modified_response['organisation_id'] = self.organisation_id
 
         # Extract the extras.
@@ -807,6 +807,28 @@ class Process(Model):
 
             yield model
 
+    def list_executions(self, boundaries=None, ordered=False):
+        """
+        Provides an iterator through all the process's executions, with several pages requested concurrently. This is faster than #executions for very large
+        numbers of executions. If creation date boundaries are provided, the executions created before, between and after the boundaries are listed
+        concurrently. Otherwise, the executions are listed from both ends concurrently until they meet.
+
+        Args:
+            boundaries: The optional ascending list of creation dates, as ISO 8601 strings, which split the executions into shards.
+            ordered: Give the executions in the same order as #executions (most recent first)? Default False, which gives them as soon as they are found.
+                Without boundaries, this holds the executions found from the far end in memory until the listing is complete.
+
+        Returns:
+            An iterator through the execution objects.
+
+        Raises:
+            RequestError: if any get fails.
+            ModelError: if a model could not be loaded or validated from the Fusion Platform<sup>&reg;</sup>.
+        """
+        return ProcessExecution._models_from_api_path_sharded(self._session, self._get_path(self.__class__._PATH_EXECUTIONS),
+                                                              field=self.__class__._FIELD_CREATED_AT, boundaries=boundaries, ordered=ordered, reverse=True,
+                                                              load_extras=False)  # Most recent first.
+
     @property
     def options(self):
         """
@@ -175,7 +175,9 @@ class ProcessExecution(Model):
         # Optionally wait for the execution to finish.
         while not complete:
             # Load in the most recent version of the model.
-            self.get(organisation_id=self.organisation_id)
+            with self._session.tracer.start_as_current_span('ProcessExecution.check_complete', attributes={'fusion_platform.id': str(self.id)}) as span:
+                self.get(organisation_id=self.organisation_id)
+                span.set_attribute('fusion_platform.progress', self.progress)
 
             # See if the execution has completed.
             self._logger.debug('checking for execution %s to complete: %f', self.id, self.progress)
@@ -223,7 +223,8 @@ class ProcessServiceExecution(Model):
         Raises:
             RequestError if any get fails.
         """
-        logs = ProcessServiceExecutionLog._models_from_api_path(self._session, self._get_path(self.__class__._PATH_LOGS), reverse=True)
+        logs = ProcessServiceExecutionLog._models_from_api_path(self._session, self._get_path(self.__class__._PATH_LOGS), reverse=True,
+                                                                compact=True)
         first = True
 
         try:
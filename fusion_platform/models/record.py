@@ -0,0 +1,194 @@
+"""
+Record class file.
+
+author: Matthew Casey
+
+&copy; [Digital Content Analysis Technology Ltd](https://www.d-cat.co.uk)
+"""
+
+import i18n
+from threading import Lock
+
+from fusion_platform.common.utilities import value_to_read_only, value_to_string
+
+# Marks a field which is not present in a record.
+_MISSING = object()
+
+
+class Record:
+    """
+    Compact read-only representation of a persisted model, for use when large numbers of models are held at once. Each record holds its values in slots named by
+    the index of the fields defined by the model's schema, with the field table shared by all records of the same model class. The visible model attributes are
+    available as read-only properties, in the same way as for the model itself. Use #to_model to obtain the full model object, for example to call its methods.
+    """
+
+    __slots__ = ['_session']
+
+    # The model class, the slot for each schema field and the name and slot of each visible field. These are set for each model class.
+    _MODEL_CLASS = None
+    _FIELDS = {}
+    _ATTRIBUTES = ()
+
+    # The record classes for each model class.
+    _RECORDS = {}
+    _LOCK = Lock()
+
+    def __init__(self, session):
+        """
+        Initialises the object.
+
+        Args:
+            session: The linked session object for interfacing with the Fusion Platform<sup>&reg;</sup>.
+        """
+        self._session = session
+
+    @property
+    def attributes(self):
+        """
+        Returns:
+            The record attributes as a dictionary.
+        """
+        attributes = {}
+
+        for name, slot in self._ATTRIBUTES:
+            value = getattr(self, slot, _MISSING)
+
+            if value is not _MISSING:
+                attributes[name] = value_to_read_only(value)
+
+        return attributes
+
+    def __eq__(self, other):
+        """
+        Determines whether the other object is equal to self. Compares the object's attributes, and so a record is equal to the model it represents.
+
+        Args:
+            other: The other object to compare against.
+
+        Returns:
+            True if the object's attributes are equal.
+        """
+        if isinstance(other, Record):
+            return self.attributes == other.attributes
+
+        return NotImplemented  # Allows a model to compare itself with the record.
+
+    @staticmethod
+    def __field_property(name, slot):
+        """
+        Builds the read-only property for a field.
+
+        Args:
+            name: The field name.
+            slot: The slot holding the field value.
+
+        Returns:
+            The property.
+        """
+
+        def get(self):
+            value = getattr(self, slot, _MISSING)
+
+            if value is _MISSING:
+                raise AttributeError(f"'{self._MODEL_CLASS.__name__}' object has no attribute '{name}'")
+
+            return value_to_read_only(value)
+
+        return property(get)
+
+    @classmethod
+    def for_model(cls, model_class):
+        """
+        Gets the record class for a model class, which is built once from the schema defined by the model class.
+
+        Args:
+            model_class: The model class.
+
+        Returns:
+            The record class.
+
+        Raises:
+            NotImplementedError: if the model class does not define a schema.
+        """
+        record_class = Record._RECORDS.get(model_class)
+
+        if record_class is None:
+            schema = model_class._SCHEMA
+
+            if schema is None:
+                raise NotImplementedError
+
+            # Hidden fields are held by the record, but are not available as attributes.
+            fields = {name: f"_{index}" for index, name in enumerate(schema.fields)}
+            attributes = tuple([(name, slot) for name, slot in fields.items() if model_class._METADATA_HIDE not in schema.fields[name].metadata])
+            namespace = {'__slots__': list(fields.values()), '_MODEL_CLASS': model_class, '_FIELDS': fields, '_ATTRIBUTES': attributes}
+
+            for name, slot in attributes:
+                namespace[name] = Record.__field_property(name, slot)
+
+            record_class = type(f"{model_class.__name__}Record", (Record,), namespace)
+
+            with Record._LOCK:
+                record_class = Record._RECORDS.setdefault(model_class, record_class)
+
+        return record_class
+
+    @classmethod
+    def from_model(cls, session, model):
+        """
+        Builds a record from a model dictionary. The dictionary values are shared with the record, and so they must not be changed afterwards.
+
+        Args:
+            session: The linked session object for interfacing with the Fusion Platform<sup>&reg;</sup>.
+            model: The model dictionary which the record will represent.
+
+        Returns:
+            The record.
+
+        Raises:
+            KeyError: if the model dictionary contains a key which is not a schema field.
+        """
+        record = cls(session)
+
+        for key, value in model.items():
+            setattr(record, cls._FIELDS[key], value)
+
+        return record
+
+    def __repr__(self):
+        """
+        Returns:
+            A string representation of the object.
+        """
+        return i18n.t('models.model.representation', name=self._MODEL_CLASS.__name__, attributes=self.attributes)
+
+    def to_csv(self, exclude=None):
+        """
+        Converts the record attributes into a CSV string.
+
+        Args:
+            exclude: A list of attribute names which should be excluded from the CSV.
+
+        Returns:
+            The attribute names as a CSV header string and the record attributes as a CSV string.
+        """
+        exclude = exclude if exclude is not None else []
+        header = []
+        line = []
+
+        for key, value in self.attributes.items():
+            if key not in exclude:
+                header.append(key)
+                line.append(value_to_string(value))  # Handles things better than base object representations.
+
+        return ','.join(header), ','.join(line)
+
+    def to_model(self):
+        """
+        Converts the record into the full model object which it represents.
+
+        Returns:
+            The persisted model object.
+        """
+        model = {name: getattr(self, slot) for name, slot in self._FIELDS.items() if hasattr(self, slot)}
+        return self._MODEL_CLASS._from_record(self._session, model)
@@ -6,6 +6,7 @@ author: Matthew Casey
 &copy; [Digital Content Analysis Technology Ltd](https://www.d-cat.co.uk)
 """
 
+import itertools
 from marshmallow import Schema, EXCLUDE
 
 from fusion_platform.models import fields
@@ -130,15 +131,20 @@ class User(Model):
             RequestError: if any get fails.
             ModelError: if a model could not be loaded or validated from the Fusion Platform<sup>&reg;</sup>.
         """
-        # Search for the id and/or name.
+        # Search for the id and/or name. The organisations obtained while searching are reused by the iterator, which then continues from where the search
+        # stopped rather than getting every organisation again.
         organisation = None
+        organisations = self.organisations
+        obtained = []
+
+        for item in organisations:
+            obtained.append(item)
 
-        for item in self.organisations:
             if ((id is not None) and (str(id).lower() == str(item.id).lower())) or ((name is not None) and (item.name.lower().startswith(name.lower()))):
                 organisation = item
                 break
 
-        return organisation, self.organisations
+        return organisation, itertools.chain(obtained, organisations)
 
     @property
     def organisations(self):
@@ -0,0 +1,232 @@
+"""
+Offload session class file.
+
+author: Matthew Casey
+
+&copy; [Digital Content Analysis Technology Ltd](https://www.d-cat.co.uk)
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+from functools import partial
+
+from fusion_platform.base import Base
+from fusion_platform.session import Session
+
+
+class OffloadSession(Base):
+    """
+    Lets the blocking SDK be awaited from asyncio code by offloading each operation to a bounded pool of worker threads. The offload session wraps a standard
+    session, and therefore its pooled HTTP transport. Note that this is not a native asyncio client: every request or transfer in progress occupies one of the
+    workers, so at most the offload max workers number of operations run concurrently, and any others wait for a free worker. Only the waits between polls do
+    not use a worker, as they sleep on the event loop.
+
+    Models loaded through the offload session are standard models. Any model method can be awaited using #run, model iterators can be consumed with
+    `async for` using #iterate, and completion checks can be polled without blocking a worker using #poll. For example:
+
+        user = await offload_session.login(email=email, password=password)
+        organisation = await offload_session.run(lambda: next(user.organisations))
+
+        async for process in offload_session.iterate(organisation.processes):
+            execution = await offload_session.run(lambda: next(process.executions, None))
+            await offload_session.poll(execution.check_complete)
+    """
+
+    # Session option fields and their defaults.
+    OFFLOAD_MAX_WORKERS = 'offload_max_workers'  # Maximum number of blocking operations, each using a worker thread, which can run concurrently.
+    OFFLOAD_MAX_WORKERS_DEFAULT = 32
+
+    def __init__(self, options=None, session=None):
+        """
+        Initialises the object.
+
+        Args:
+            options: The optional session options, which are also passed to the standard session.
+            session: The optional standard session to wrap. If not provided, a new session is created using the options.
+        """
+        super(OffloadSession, self).__init__()
+
+        # Extract any options.
+        options = {} if options is None else options
+        self.offload_max_workers = options.get(OffloadSession.OFFLOAD_MAX_WORKERS, OffloadSession.OFFLOAD_MAX_WORKERS_DEFAULT)
+        self._logger.debug('offload_max_workers: %d', self.offload_max_workers)
+
+        # Initialise the private fields.
+        self.__session = Session(options=options) if session is None else session
+        self.__executor = ThreadPoolExecutor(max_workers=self.offload_max_workers, thread_name_prefix='fusion_platform_offload')
+
+    async def __aenter__(self):
+        """
+        Enters the asynchronous context.
+
+        Returns:
+            The offload session.
+        """
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        Exits the asynchronous context, closing the session.
+
+        Args:
+            exc_type: The exception type, if any.
+            exc_value: The exception value, if any.
+            traceback: The exception traceback, if any.
+        """
+        await self.close()
+
+    async def close(self):
+        """
+        Closes the session, waiting for any running operations to complete and releasing the pooled HTTP transport.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, partial(self.__executor.shutdown, wait=True))
+        self.__session.close()
+
+    async def download_file(self, url, destination, callback=None, size=None, refresh_url=None):
+        """
+        Downloads a file to the destination path. See Session#download_file.
+
+        Args:
+            url: The URL to download as a file.
+            destination: The destination file path.
+            callback: The optional callback method used to receive download progress.
+            size: The optional expected size of the file in bytes, against which the download is verified.
+            refresh_url: The optional function called without arguments to obtain a new URL if the URL has expired.
+
+        Raises:
+            RequestError: if the download fails.
+        """
+        await self.run(self.__session.download_file, url, destination, callback=callback, size=size, refresh_url=refresh_url)
+
+    async def iterate(self, models):
+        """
+        Asynchronously iterates through a model iterator, such as those returned by `organisation.processes` or `process.executions`. Each step of the iterator
+        is run on a worker, so that the event loop is not blocked while a page of results is being obtained. If the iteration stops early, the model iterator is
+        closed so that it stops obtaining pages.
+
+        Args:
+            models: The model iterator.
+
+        Returns:
+            An asynchronous generator through the models.
+
+        Raises:
+            RequestError: if any get fails.
+            ModelError: if a model could not be loaded or validated from the Fusion Platform<sup>&reg;</sup>.
+        """
+        # We use a sentinel to mark the end of the iterator, as StopIteration cannot be raised through a future.
+        finished = object()
+        models = iter(models)
+
+        try:
+            while True:
+                model = await self.run(next, models, finished)
+
+                if model is finished:
+                    break
+
+                yield model
+
+        finally:
+            # Closing a model generator may wait for its background threads, and so it is also run on a worker.
+            if hasattr(models, 'close'):
+                await self.run(models.close)
+
+    async def login(self, email=None, user_id=None, password=None, api_url=None):
+        """
+        Attempts to log into the Fusion Platform<sup>&reg;</sup> to return a user model for the active session.
+
+        Args:
+            email: The user account email address. Either an email address or a user id must be provided.
+            user_id: The user account user id. Either an email address or a user id must be provided.
+            password: The password for the user account.
+            api_url: The optional custom API URL to use. Defaults to the production Fusion Platform<sup>&reg;</sup>.
+
+        Returns:
+            The corresponding user model for the account on successful login.
+
+        Raises:
+            ValueError: on incorrect parameters.
+            RequestError: on login failure.
+        """
+        # Import here to prevent circular imports.
+        from fusion_platform.models.user import User
+
+        await self.run(self.__session.login, email, user_id, password, api_url)
+
+        return await self.run(User._model_from_api_id, self.__session, id=self.__session.user_id)
+
+    async def poll(self, check, period=None, **kwargs):
+        """
+        Repeatedly calls a completion check method, such as `ProcessExecution.check_complete` or `Data.create_complete`, until it returns True. Each check is run
+        on a worker without waiting, and the event loop sleeps between checks so that no worker is blocked while waiting.
+
+        Args:
+            check: The completion check method. This must accept a wait keyword argument.
+            period: The optional period in seconds between checks. Defaults to the session's API update wait period.
+            kwargs: Any additional keyword arguments passed to the check.
+
+        Raises:
+            RequestError: if any request fails.
+            ModelError: if the check fails.
+        """
+        period = self.__session.api_update_wait_period if period is None else period
+
+        while not await self.run(check, wait=False, **kwargs):
+            await asyncio.sleep(period)
+
+    async def request(self, path='/', query_parameters=None, method=Session.METHOD_GET, body=None):
+        """
+        Sends a request to the Fusion Platform<sup>&reg;</sup>. See Session#request.
+
+        Args:
+            path: The optional path. Default '/'.
+            query_parameters: The optional query parameters as a dictionary.
+            method: The optional RESTful method type. Default GET.
+            body: The optional body. Default None.
+
+        Returns:
+            The decoded response body.
+
+        Raises:
+            RequestError: if the request failed.
+        """
+        return await self.run(self.__session.request, path=path, query_parameters=query_parameters, method=method, body=body)
+
+    async def run(self, function, *args, **kwargs):
+        """
+        Runs any blocking SDK method on a worker, such as `model.get`, `process.execute` or `data_file.download`, and awaits its result.
+
+        Args:
+            function: The blocking method to run.
+            args: The positional arguments for the method.
+            kwargs: The keyword arguments for the method.
+
+        Returns:
+            The result of the method.
+        """
+        # The function is run in a copy of the current context, so that context variables such as the current tracing span are carried over to the worker.
+        return await asyncio.get_running_loop().run_in_executor(self.__executor, partial(contextvars.copy_context().run, function, *args, **kwargs))
+
+    @property
+    def session(self):
+        """
+        Returns:
+            The wrapped standard session.
+        """
+        return self.__session
+
+    async def upload_file(self, url, source, callback=None):
+        """
+        Uploads a file from the source path. See Session#upload_file.
+
+        Args:
+            url: The URL to upload the file to.
+            source: The source file path.
+            callback: The optional callback method used to receive upload progress.
+
+        Raises:
+            RequestError: if the upload fails.
+        """
+        await self.run(self.__session.upload_file, url, source, callback=callback)
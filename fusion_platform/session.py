@@ -6,18 +6,34 @@ author: Matthew Casey
 &copy; [Digital Content Analysis Technology Ltd](https://www.d-cat.co.uk)
 """
 
+import builtins
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+import contextvars
+import copy
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 import i18n
-import json
 import jwt
 import logging
 import os
+import re
 import requests
-from tenacity import before_sleep_log, retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
+from requests.adapters import HTTPAdapter
+from threading import Lock
+import time
+from tenacity import before_sleep_log, retry_if_exception_type, Retrying, stop_after_attempt, stop_when_event_set, wait_random_exponential
 from tqdm.utils import CallbackIOWrapper
 
 import fusion_platform
 from fusion_platform.base import Base
-from fusion_platform.common.utilities import json_default
+from fusion_platform.common.metrics import MetricsRegistry, TemplatedPath
+from fusion_platform.common.priority_executor import PriorityExecutor
+from fusion_platform.common.rate_limiter import RateLimiter
+from fusion_platform.common.tracing import Tracer
+from fusion_platform.common.utilities import json_dumps, json_loads
+from fusion_platform.download_manager import DownloadManager
 
 
 class SessionError(Exception):
@@ -38,6 +54,23 @@ class RetryableRequestError(RequestError):
     """
     Exception raised on request failure which is retryable.
     """
+
+    def __init__(self, message=None, retry_after=None):
+        """
+        Initialises the object.
+
+        Args:
+            message: The optional error message.
+            retry_after: The optional time in seconds which the server has asked us to wait before retrying.
+        """
+        super(RetryableRequestError, self).__init__(message)
+        self.retry_after = retry_after
+
+
+class ExpiredUrlError(RequestError):
+    """
+    Exception raised when a signed URL has expired or is no longer authorised.
+    """
     pass
 
 
@@ -48,9 +81,224 @@ class ValueError(SessionError):
     pass
 
 
+class LoggedPayload:
+    """
+    Wraps a request or response payload so that it is only masked and formatted for logging if the log message is actually emitted. The payload can be logged in
+    full, truncated, or summarised by its size and the lengths of its lists.
+    """
+
+    # Mask keys.
+    _MASK_KEYS = ['password', 'old_password', 'new_password', 'access_token', 'id_token', 'refresh_token']
+
+    def __init__(self, payload, size=None, summarise=False, maximum_length=None):
+        """
+        Initialises the object.
+
+        Args:
+            payload: The payload to log.
+            size: The optional size of the encoded payload in bytes.
+            summarise: True if only a summary of the payload should be logged. Default False.
+            maximum_length: The optional maximum number of characters of the payload to log.
+        """
+        self.__payload = payload
+        self.__size = size
+        self.__summarise = summarise
+        self.__maximum_length = maximum_length
+
+    def __str__(self):
+        """
+        Returns:
+            The masked, truncated or summarised payload.
+        """
+        if self.__summarise:
+            return LoggedPayload.__summary(self.__payload, self.__size)
+
+        text = str(LoggedPayload.__mask(self.__payload))
+
+        if (self.__maximum_length is not None) and (len(text) > self.__maximum_length):
+            text = f"{text[:self.__maximum_length]}... ({len(text)} characters)"
+
+        return text
+
+    @staticmethod
+    def __mask(dictionary):
+        """
+        Recursively filters a nested dictionary to mask out any keys which should be masked.
+
+        Args:
+            dictionary: The nested dictionary to mask.
+
+        Returns:
+            The masked nested dictionary.
+        """
+        if (dictionary is not None) and isinstance(dictionary, dict):
+            return {key: '*****' if key in LoggedPayload._MASK_KEYS else LoggedPayload.__mask(value) for key, value in dictionary.items()}
+        else:
+            return dictionary
+
+    @staticmethod
+    def __summary(payload, size):
+        """
+        Summarises a payload by its type, its size and the lengths of any top-level lists, without including any of its values.
+
+        Args:
+            payload: The payload to summarise.
+            size: The optional size of the encoded payload in bytes.
+
+        Returns:
+            The summary.
+        """
+        details = []
+
+        if isinstance(payload, dict):
+            details.append(f"{len(payload)} keys")
+            details.extend([f"{key}: {len(value)} items" for key, value in payload.items() if isinstance(value, (list, tuple))])
+        elif isinstance(payload, (list, tuple)):
+            details.append(f"{len(payload)} items")
+
+        if size is not None:
+            details.append(f"{size} bytes")
+
+        return f"<{type(payload).__name__}{': ' if len(details) > 0 else ''}{', '.join(details)}>"
+
+
+class RetryPolicy:
+    """
+    Defines how failed requests, uploads and downloads are retried. A request is retried if it failed because of an intermittent connection error, or because the
+    response has a retryable status code. By default, only idempotent methods are retried, except when the request failed to connect or was rate limited, in which
+    case the server cannot have acted on it. Retries use a randomised exponential backoff, unless the server has asked us to wait for a specific time using the
+    Retry-After header.
+    """
+
+    # Default retryable status codes and methods.
+    _STATUS_CODES_DEFAULT = [requests.codes.too_many_requests, requests.codes.internal_server_error, requests.codes.bad_gateway, requests.codes.service_unavailable,
+                             requests.codes.gateway_timeout]
+    _METHODS_DEFAULT = ['DELETE', 'GET', 'HEAD', 'OPTIONS', 'PUT']
+
+    # Status codes for requests which the server has refused to act on, and which can therefore be retried whatever their method.
+    _REFUSED_STATUS_CODES = [requests.codes.too_many_requests]
+
+    # Retry after response header.
+    _HEADER_RETRY_AFTER = 'Retry-After'
+
+    def __init__(self, attempts=10, wait_minimum=1, wait_maximum=5, multiplier=1, status_codes=None, methods=None, retry_after_maximum=60):
+        """
+        Initialises the object.
+
+        Args:
+            attempts: The optional maximum number of attempts, including the first. Default 10.
+            wait_minimum: The optional minimum backoff between attempts in seconds. Default 1.
+            wait_maximum: The optional maximum backoff between attempts in seconds. Default 5.
+            multiplier: The optional exponential backoff multiplier. Default 1.
+            status_codes: The optional list of retryable status codes. Defaults to 429, 500, 502, 503 and 504.
+            methods: The optional list of methods which can be retried. Defaults to the idempotent methods DELETE, GET, HEAD, OPTIONS and PUT.
+            retry_after_maximum: The optional maximum time in seconds which will be waited in response to a Retry-After header. Default 60.
+        """
+        self.attempts = attempts
+        self.wait_minimum = wait_minimum
+        self.wait_maximum = wait_maximum
+        self.multiplier = multiplier
+        self.status_codes = RetryPolicy._STATUS_CODES_DEFAULT if status_codes is None else status_codes
+        self.methods = RetryPolicy._METHODS_DEFAULT if methods is None else methods
+        self.retry_after_maximum = retry_after_maximum
+
+    def is_retryable(self, method, status_code=None, exception=None):
+        """
+        Determines whether a failed request can be retried.
+
+        Args:
+            method: The request method.
+            status_code: The optional response status code.
+            exception: The optional exception raised while sending the request or receiving the response.
+
+        Returns:
+            True if the request can be retried.
+        """
+        # A request which failed to connect can always be retried, as can a refused request if its status code is retryable.
+        if isinstance(exception, requests.ConnectTimeout):
+            return True
+
+        if status_code in RetryPolicy._REFUSED_STATUS_CODES:
+            return status_code in self.status_codes
+
+        if method.upper() not in self.methods:
+            return False
+
+        if exception is not None:
+            return isinstance(exception, (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError))
+
+        return status_code in self.status_codes
+
+    @staticmethod
+    def retry_after(response):
+        """
+        Extracts the time to wait before retrying from the response's Retry-After header, which can be either a number of seconds or a date.
+
+        Args:
+            response: The response.
+
+        Returns:
+            The time to wait in seconds, or None if the response does not specify a time.
+        """
+        value = response.headers.get(RetryPolicy._HEADER_RETRY_AFTER) if response is not None else None
+
+        if value is None:
+            return None
+
+        # Note that the built-in ValueError is needed, as this module defines its own ValueError.
+        try:
+            return max(0.0, float(value))
+        except (TypeError, builtins.ValueError):
+            pass
+
+        try:
+            return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, builtins.ValueError):
+            return None
+
+    def retrying(self, attempts=None, cancelled=None):
+        """
+        Creates a retrying callable which calls a function, retrying it while it raises a RetryableRequestError.
+
+        Args:
+            attempts: The optional maximum number of attempts, overriding the policy.
+            cancelled: The optional event which, once set, stops any further attempts and interrupts the wait before the next attempt.
+
+        Returns:
+            The retrying callable, which is called with the function and its arguments.
+        """
+        stop = stop_after_attempt(self.attempts if attempts is None else attempts)
+        optional = {}
+
+        if cancelled is not None:
+            stop = stop | stop_when_event_set(cancelled)
+            optional['sleep'] = cancelled.wait
+
+        return Retrying(wait=self.__wait, stop=stop, reraise=True, retry=retry_if_exception_type(RetryableRequestError),
+                        before_sleep=before_sleep_log(logging.getLogger(fusion_platform.FUSION_PLATFORM_LOGGER), logging.INFO), **optional)
+
+    def __wait(self, retry_state):
+        """
+        Calculates the time to wait before the next attempt.
+
+        Args:
+            retry_state: The tenacity retry state.
+
+        Returns:
+            The time to wait in seconds.
+        """
+        exception = retry_state.outcome.exception() if retry_state.outcome is not None else None
+        retry_after = getattr(exception, 'retry_after', None)
+
+        if retry_after is not None:
+            return min(retry_after, self.retry_after_maximum)
+
+        return wait_random_exponential(multiplier=self.multiplier, min=self.wait_minimum, max=self.wait_maximum)(retry_state)
+
+
 class UploadCallback:
     """
-    Provides a callback mechanism for uploads using the CallbackIOWrapper.
+    Provides a callback mechanism for uploads using the CallbackIOWrapper. This is thread-safe.
     """
 
     def __init__(self, url, source, callback):
@@ -66,16 +314,21 @@ class UploadCallback:
         self.__source = source
         self.__callback = callback
         self.__upload_size = 0
+        self.__lock = Lock()
 
     def callback(self, size):
         """
-        Receives the upload callback every time data is read from the associated file.
+        Receives the upload callback every time data is read from the associated file. A negative size is used to discount data which has to be uploaded again.
 
         Args:
             size: The number of bytes which have been read from the associated file.
         """
-        self.__upload_size += size
-        self.__callback(self.__url, self.__source, self.__upload_size)
+        with self.__lock:
+            self.__upload_size += size
+            upload_size = self.__upload_size
+
+        if self.__callback is not None:
+            self.__callback(self.__url, self.__source, upload_size)
 
 
 class Session(Base):
@@ -96,13 +349,94 @@ class Session(Base):
     # Session option fields and their defaults.
     API_UPDATE_WAIT_PERIOD = 'api_update_wait_period'  # Time in seconds to wait between checking jobs on the API.
     API_UPDATE_WAIT_PERIOD_DEFAULT = 10
-
-    # Mask keys.
-    _MASK_KEYS = ['password', 'old_password', 'new_password', 'access_token', 'id_token', 'refresh_token']
+    CONNECTION_POOL_SIZE = 'connection_pool_size'  # Maximum number of pooled connections kept per host.
+    CONNECTION_POOL_SIZE_DEFAULT = 32
+    KEEP_ALIVE = 'keep_alive'  # Whether connections are kept alive between requests.
+    KEEP_ALIVE_DEFAULT = True
+    DOWNLOAD_SEGMENTS = 'download_segments'  # Number of byte ranges downloaded concurrently for large files. Use 1 to always download as a single stream.
+    DOWNLOAD_SEGMENTS_DEFAULT = 1
+    DOWNLOAD_SEGMENT_SIZE_MINIMUM = 'download_segment_size_minimum'  # Minimum file size in bytes before a segmented download is used.
+    DOWNLOAD_SEGMENT_SIZE_MINIMUM_DEFAULT = 64 * 1024 * 1024
+    DOWNLOAD_RESUME = 'download_resume'  # Whether downloads continue from any partially downloaded file left by a previous attempt.
+    DOWNLOAD_RESUME_DEFAULT = True
+    DOWNLOAD_URL_REFRESHES = 'download_url_refreshes'  # Maximum number of times an expired download URL is refreshed during a single download.
+    DOWNLOAD_URL_REFRESHES_DEFAULT = 3
+    DOWNLOAD_MAX_WORKERS = 'download_max_workers'  # Maximum number of files downloaded concurrently across the session.
+    DOWNLOAD_MAX_WORKERS_DEFAULT = 8
+    UPLOAD_MAX_WORKERS = 'upload_max_workers'  # Maximum number of files uploaded concurrently across the session.
+    UPLOAD_MAX_WORKERS_DEFAULT = 8
+    RESPONSE_CACHE_SIZE = 'response_cache_size'  # Maximum number of GET responses cached for conditional requests. Use 0 to disable the cache.
+    RESPONSE_CACHE_SIZE_DEFAULT = 0
+    COALESCE_REQUESTS = 'coalesce_requests'  # Whether identical concurrent GET requests are sent as a single request whose response is shared.
+    COALESCE_REQUESTS_DEFAULT = True
+    LIST_PREFETCH = 'list_prefetch'  # Number of upcoming list pages fetched in the background while each page is consumed. Use 0 to not prefetch.
+    LIST_PREFETCH_DEFAULT = 0
+    LIST_PAGE_SIZE = 'list_page_size'  # Number of items requested for the first page of each list, unless the list is given its own page size.
+    LIST_PAGE_SIZE_DEFAULT = 24
+    LIST_PAGE_SIZE_MAXIMUM = 'list_page_size_maximum'  # Maximum items requested for each list page, which the API must accept. Use None to not adapt.
+    LIST_PAGE_SIZE_MAXIMUM_DEFAULT = None
+    LIST_PAGE_TIME_TARGET = 'list_page_time_target'  # Time in seconds to get a list page within which the page size grows, otherwise it shrinks.
+    LIST_PAGE_TIME_TARGET_DEFAULT = 2.0
+    LIST_PAGE_BYTES_TARGET = 'list_page_bytes_target'  # Size in bytes of a list page within which the page size grows, otherwise it shrinks.
+    LIST_PAGE_BYTES_TARGET_DEFAULT = 1024 * 1024
+    FETCH_MAX_WORKERS = 'fetch_max_workers'  # Maximum number of models obtained concurrently using their ids. Use 1 to obtain them one at a time.
+    FETCH_MAX_WORKERS_DEFAULT = 8
+    RATE_LIMIT = 'rate_limit'  # Maximum number of API requests per second across all threads using the session. Use None to not limit the rate.
+    RATE_LIMIT_DEFAULT = None
+    CONCURRENCY_LIMIT = 'concurrency_limit'  # Maximum number of concurrent API requests, which is adapted when throttled. Use None to not limit concurrency.
+    CONCURRENCY_LIMIT_DEFAULT = None
+    RATE_LIMITER = 'rate_limiter'  # Optional custom RateLimiter used instead of one created from the rate and concurrency limits.
+    RATE_LIMITER_DEFAULT = None
+    RETRY_POLICY = 'retry_policy'  # Optional RetryPolicy used to retry failed requests, uploads and downloads instead of the default policy.
+    RETRY_POLICY_DEFAULT = None
+    LOG_PAYLOADS = 'log_payloads'  # How request and response payloads are logged, either LOG_PAYLOADS_FULL or LOG_PAYLOADS_SUMMARY.
+    LOG_PAYLOADS_FULL = 'full'  # Log the masked payloads.
+    LOG_PAYLOADS_SUMMARY = 'summary'  # Log only the sizes of the payloads and the lengths of their lists.
+    LOG_PAYLOADS_DEFAULT = LOG_PAYLOADS_FULL
+    LOG_PAYLOAD_LENGTH = 'log_payload_length'  # Maximum number of characters of each payload which are logged in full. Use None to not truncate payloads.
+    LOG_PAYLOAD_LENGTH_DEFAULT = None
+    METRICS = 'metrics'  # Whether request, upload and download metrics are recorded.
+    METRICS_DEFAULT = True
+    METRICS_REGISTRY = 'metrics_registry'  # Optional MetricsRegistry used to record metrics instead of one created for the session, such as one shared by sessions.
+    METRICS_REGISTRY_DEFAULT = None
+    TRACER = 'tracer'  # Optional tracer, such as an OpenTelemetry tracer, used to trace requests, uploads and downloads. Defaults to a tracer which does nothing.
+    TRACER_DEFAULT = None
 
     # Download temporary file name extension.
     DOWNLOAD_EXTENSION = '.download'
 
+    # Segmented download temporary file name extension, which is appended to the download extension. Segmented downloads are written out of order and therefore
+    # use a separate file which is never resumed.
+    _DOWNLOAD_SEGMENTED_EXTENSION = '.segmented'
+
+    # Download validator file name extension, which is appended to the download extension. The validator file holds the entity tag or last modified date of the
+    # partial download, so that a resumed download is only continued if the file has not changed.
+    _DOWNLOAD_VALIDATOR_EXTENSION = '.validator'
+
+    # Download chunk size in bytes.
+    _DOWNLOAD_CHUNK_SIZE = 1024 * 1024 * 10
+
+    # Range request header and response content range pattern.
+    _HEADER_CONTENT_RANGE = 'Content-Range'
+    _HEADER_RANGE = 'Range'
+    _RANGE_TEMPLATE = 'bytes={start}-{end}'
+    _RANGE_FROM_TEMPLATE = 'bytes={start}-'
+    _CONTENT_RANGE_PATTERN = re.compile(r'bytes\s+(\d+)-(\d+)/(\d+)')
+    _CONTENT_RANGE_UNSATISFIED_PATTERN = re.compile(r'bytes\s+\*/(\d+)')
+
+    # Status codes returned when a request has been throttled.
+    _THROTTLED_STATUS_CODES = [requests.codes.too_many_requests, requests.codes.service_unavailable]
+
+    # Status codes returned when a signed URL has expired.
+    _EXPIRED_URL_STATUS_CODES = [requests.codes.unauthorized, requests.codes.forbidden]
+
+    # Conditional request headers.
+    _HEADER_ETAG = 'ETag'
+    _HEADER_IF_MODIFIED_SINCE = 'If-Modified-Since'
+    _HEADER_IF_NONE_MATCH = 'If-None-Match'
+    _HEADER_IF_RANGE = 'If-Range'
+    _HEADER_LAST_MODIFIED = 'Last-Modified'
+
     def __init__(self, options=None):
         """
         Initialises the object.
@@ -121,16 +455,266 @@ class Session(Base):
         options = {} if options is None else options
         self.api_update_wait_period = options.get(Session.API_UPDATE_WAIT_PERIOD, Session.API_UPDATE_WAIT_PERIOD_DEFAULT)
         self._logger.debug('api_update_wait_period: %d', self.api_update_wait_period)
+        self.connection_pool_size = options.get(Session.CONNECTION_POOL_SIZE, Session.CONNECTION_POOL_SIZE_DEFAULT)
+        self._logger.debug('connection_pool_size: %d', self.connection_pool_size)
+        self.keep_alive = options.get(Session.KEEP_ALIVE, Session.KEEP_ALIVE_DEFAULT)
+        self._logger.debug('keep_alive: %s', self.keep_alive)
+        self.download_segments = max(1, options.get(Session.DOWNLOAD_SEGMENTS, Session.DOWNLOAD_SEGMENTS_DEFAULT))
+        self._logger.debug('download_segments: %d', self.download_segments)
+        self.download_segment_size_minimum = options.get(Session.DOWNLOAD_SEGMENT_SIZE_MINIMUM, Session.DOWNLOAD_SEGMENT_SIZE_MINIMUM_DEFAULT)
+        self._logger.debug('download_segment_size_minimum: %d', self.download_segment_size_minimum)
+        self.download_resume = options.get(Session.DOWNLOAD_RESUME, Session.DOWNLOAD_RESUME_DEFAULT)
+        self._logger.debug('download_resume: %s', self.download_resume)
+        self.download_url_refreshes = options.get(Session.DOWNLOAD_URL_REFRESHES, Session.DOWNLOAD_URL_REFRESHES_DEFAULT)
+        self._logger.debug('download_url_refreshes: %d', self.download_url_refreshes)
+        self.download_max_workers = options.get(Session.DOWNLOAD_MAX_WORKERS, Session.DOWNLOAD_MAX_WORKERS_DEFAULT)
+        self._logger.debug('download_max_workers: %d', self.download_max_workers)
+        self.upload_max_workers = options.get(Session.UPLOAD_MAX_WORKERS, Session.UPLOAD_MAX_WORKERS_DEFAULT)
+        self._logger.debug('upload_max_workers: %d', self.upload_max_workers)
+        self.response_cache_size = options.get(Session.RESPONSE_CACHE_SIZE, Session.RESPONSE_CACHE_SIZE_DEFAULT)
+        self._logger.debug('response_cache_size: %d', self.response_cache_size)
+        self.list_prefetch = max(0, options.get(Session.LIST_PREFETCH, Session.LIST_PREFETCH_DEFAULT))
+        self._logger.debug('list_prefetch: %d', self.list_prefetch)
+        self.list_page_size = max(1, options.get(Session.LIST_PAGE_SIZE, Session.LIST_PAGE_SIZE_DEFAULT))
+        self._logger.debug('list_page_size: %d', self.list_page_size)
+        self.list_page_size_maximum = options.get(Session.LIST_PAGE_SIZE_MAXIMUM, Session.LIST_PAGE_SIZE_MAXIMUM_DEFAULT)
+        self._logger.debug('list_page_size_maximum: %s', self.list_page_size_maximum)
+        self.list_page_time_target = options.get(Session.LIST_PAGE_TIME_TARGET, Session.LIST_PAGE_TIME_TARGET_DEFAULT)
+        self._logger.debug('list_page_time_target: %s', self.list_page_time_target)
+        self.list_page_bytes_target = options.get(Session.LIST_PAGE_BYTES_TARGET, Session.LIST_PAGE_BYTES_TARGET_DEFAULT)
+        self._logger.debug('list_page_bytes_target: %s', self.list_page_bytes_target)
+        self.fetch_max_workers = max(1, options.get(Session.FETCH_MAX_WORKERS, Session.FETCH_MAX_WORKERS_DEFAULT))
+        self._logger.debug('fetch_max_workers: %d', self.fetch_max_workers)
+
+        # The least recently used response cache, which maps each GET request to its validators and decoded payload.
+        self.__response_cache = OrderedDict()
+        self.__response_cache_lock = Lock()
+
+        # The GET requests currently in flight, which maps each request to a future for its response.
+        self.coalesce_requests = options.get(Session.COALESCE_REQUESTS, Session.COALESCE_REQUESTS_DEFAULT)
+        self._logger.debug('coalesce_requests: %s', self.coalesce_requests)
+        self.__in_flight = {}
+        self.__in_flight_lock = Lock()
+
+        # The optional event which cancels the requests sent from the current context. See #cancellable.
+        self.__cancelled = contextvars.ContextVar(f"fusion_platform_cancelled_{id(self)}", default=None)
+
+        # The rate limiter shared by all API requests using this session.
+        self.rate_limit = options.get(Session.RATE_LIMIT, Session.RATE_LIMIT_DEFAULT)
+        self._logger.debug('rate_limit: %s', self.rate_limit)
+        self.concurrency_limit = options.get(Session.CONCURRENCY_LIMIT, Session.CONCURRENCY_LIMIT_DEFAULT)
+        self._logger.debug('concurrency_limit: %s', self.concurrency_limit)
+        self.rate_limiter = options.get(Session.RATE_LIMITER, Session.RATE_LIMITER_DEFAULT)
+
+        if (self.rate_limiter is None) and ((self.rate_limit is not None) or (self.concurrency_limit is not None)):
+            self.rate_limiter = RateLimiter(rate=self.rate_limit, concurrency=self.concurrency_limit)
+
+        self._logger.debug('rate_limiter: %s', self.rate_limiter)
+
+        # The retry policy used for all requests, uploads and downloads.
+        self.retry_policy = options.get(Session.RETRY_POLICY, Session.RETRY_POLICY_DEFAULT)
+
+        if self.retry_policy is None:
+            self.retry_policy = RetryPolicy()
+
+        self._logger.debug('retry_policy: %s', self.retry_policy)
+
+        # How request and response payloads are logged.
+        self.log_payloads = options.get(Session.LOG_PAYLOADS, Session.LOG_PAYLOADS_DEFAULT)
+        self._logger.debug('log_payloads: %s', self.log_payloads)
+        self.log_payload_length = options.get(Session.LOG_PAYLOAD_LENGTH, Session.LOG_PAYLOAD_LENGTH_DEFAULT)
+        self._logger.debug('log_payload_length: %s', self.log_payload_length)
+
+        # The registry in which request, upload and download metrics are recorded.
+        self.__metrics = options.get(Session.METRICS_REGISTRY, Session.METRICS_REGISTRY_DEFAULT)
+
+        if (self.__metrics is None) and options.get(Session.METRICS, Session.METRICS_DEFAULT):
+            self.__metrics = MetricsRegistry()
+
+        self._logger.debug('metrics: %s', self.__metrics)
+
+        # The tracer used to trace requests, uploads and downloads.
+        self.tracer = options.get(Session.TRACER, Session.TRACER_DEFAULT)
+
+        if self.tracer is None:
+            self.tracer = Tracer()
+
+        self._logger.debug('tracer: %s', self.tracer)
+
+        # Create the pooled HTTP transport which is shared by all requests, uploads and downloads. The underlying connection pool is thread-safe, so the transport
+        # can be used by any threads using this session.
+        self.__http = Session.__create_transport(self.connection_pool_size, self.keep_alive)
+
+        # Create the executor shared by all file uploads using this session, so that the number of concurrent uploads is bounded.
+        self.__upload_executor = PriorityExecutor(self.upload_max_workers, thread_name_prefix='fusion_platform_upload')
+
+        # Similarly, create the download manager shared by all file downloads.
+        self.__download_manager = DownloadManager(self, self.download_max_workers)
+
+    def __cache_get(self, key):
+        """
+        Gets a cached response, marking it as the most recently used.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached tuple of ETag, last modified date, payload and response length in bytes, or None if the response is not cached.
+        """
+        with self.__response_cache_lock:
+            entry = self.__response_cache.get(key)
+
+            if entry is not None:
+                self.__response_cache.move_to_end(key)
+
+            return entry
+
+    def __cache_put(self, key, etag, last_modified, payload, length):
+        """
+        Caches a response, removing the least recently used responses if the cache is full.
+
+        Args:
+            key: The cache key.
+            etag: The optional response ETag.
+            last_modified: The optional response last modified date.
+            payload: The decoded response payload.
+            length: The length of the response body in bytes.
+        """
+        with self.__response_cache_lock:
+            self.__response_cache[key] = (etag, last_modified, payload, length)
+            self.__response_cache.move_to_end(key)
+
+            while len(self.__response_cache) > self.response_cache_size:
+                self.__response_cache.popitem(last=False)
+
+    @contextmanager
+    def cancellable(self, cancelled):
+        """
+        Makes the requests sent from the current context cancellable. Once the event has been set, no further attempts are made to send a request, and any wait
+        before retrying a request is interrupted, so that the request fails with a RequestError. These requests are not coalesced with those of other callers.
+
+        Args:
+            cancelled: The event which is set to cancel the requests.
+
+        Returns:
+            The context manager.
+        """
+        token = self.__cancelled.set(cancelled)
+
+        try:
+            yield
+
+        finally:
+            self.__cancelled.reset(token)
+
+    def __check_download_response(self, response):
+        """
+        Checks a download response, raising an appropriate error if it failed.
+
+        Args:
+            response: The download response.
+
+        Raises:
+            ExpiredUrlError: if the download URL has expired.
+            RetryableRequestError: if the download failed but can be retried.
+            RequestError: if the download failed.
+        """
+        if response.status_code in Session._EXPIRED_URL_STATUS_CODES:
+            raise ExpiredUrlError(i18n.t('session.request_failed', message=response))
+
+        if not response:
+            if self.retry_policy.is_retryable(Session.METHOD_GET, status_code=response.status_code):
+                raise RetryableRequestError(i18n.t('session.request_failed', message=response), retry_after=RetryPolicy.retry_after(response))
+
+            raise RequestError(i18n.t('session.request_failed', message=response))
+
+    def close(self):
+        """
+        Closes the pooled HTTP transport, releasing any kept-alive connections. The session can continue to be used after closing, in which case new connections
+        are opened as required.
+        """
+        self.__http.close()
 
-    def download_file(self, url, destination, callback=None):
+    @staticmethod
+    def __create_transport(pool_size, keep_alive):
+        """
+        Creates the pooled HTTP transport used for all requests.
+
+        Args:
+            pool_size: The maximum number of pooled connections kept per host.
+            keep_alive: Whether connections are kept alive between requests.
+
+        Returns:
+            The pooled HTTP transport.
+        """
+        http = requests.Session()
+
+        # Use the same pool size for the number of hosts and the number of connections per host. Do not block when the pool is exhausted, so that excess
+        # concurrent requests open (and then discard) additional connections rather than waiting.
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        http.mount('https://', adapter)
+        http.mount('http://', adapter)
+
+        if not keep_alive:
+            http.headers['Connection'] = 'close'
+
+        return http
+
+    def __download(self, url, destination, temporary_destination, callback):
+        """
+        Downloads the file to the temporary destination, resuming any partial download or using a segmented download as appropriate.
+
+        Args:
+            url: The URL to download as a file.
+            destination: The destination file path.
+            temporary_destination: The temporary file path to download to.
+            callback: The optional callback method used to receive download progress.
+
+        Raises:
+            RetryableRequestError: if the download failed but can be retried.
+        """
+        try:
+            # Only a partial file written sequentially by a single stream can be resumed. Segmented downloads use a separate file, and so are never resumed.
+            partial_size = os.path.getsize(temporary_destination) if self.download_resume and os.path.exists(temporary_destination) else 0
+
+            if partial_size > 0:
+                self.__download_stream(url, destination, temporary_destination, callback, start=partial_size)
+                return
+
+            # Only probe for range support if a segmented download could be used.
+            size = self.__download_probe(url) if self.download_segments > 1 else None
+
+            if (size is not None) and (size >= self.download_segment_size_minimum):
+                self.__download_segmented(url, destination, temporary_destination, size, callback)
+            else:
+                self.__download_stream(url, destination, temporary_destination, callback)
+
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+            self.__raise_retryable_download_error(e)
+
+    def download_file(self, url, destination, callback=None, size=None, refresh_url=None):
         """
         Downloads a file to the destination path. The destination directories are created if they do not exist. The optional callback function receives three
         arguments which are the URL, destination and the number of bytes downloaded so far.
 
+        If the session is configured to use more than one download segment, large files are downloaded as a series of byte ranges which are fetched concurrently.
+        This falls back to a single stream if the server does not support range requests.
+
+        If a partially downloaded file has been left behind by a previous attempt, and the session is configured to resume downloads, then the download continues
+        from the end of the partial file using a range request. The range request is made conditional on the entity tag or last modified date saved with the
+        partial file using an If-Range header, so that the download restarts from the beginning if the file has changed, or if no such validator was saved. If
+        the URL has expired, the optional refresh URL function is called to obtain a new URL and the
+        download continues. Other failures are retried according to the session's retry policy, again continuing from whatever has been downloaded so far.
+
         Args:
             url: The URL to download as a file.
             destination: The destination file path.
             callback: The optional callback method used to receive download progress.
+            size: The optional expected size of the file in bytes, against which the download is verified.
+            refresh_url: The optional function called without arguments to obtain a new URL if the URL has expired.
+
+        Raises:
+            RequestError: if the download fails.
         """
         # Make sure the destination directory exists.
         directory = os.path.dirname(destination.strip())
@@ -138,21 +722,256 @@ class Session(Base):
         if len(directory) > 0:
             os.makedirs(directory, exist_ok=True)
 
+        started_at = time.monotonic()
+        temporary_destination = f"{destination}{Session.DOWNLOAD_EXTENSION}"
+        partial_size = os.path.getsize(temporary_destination) if self.download_resume and os.path.exists(temporary_destination) else 0
+
+        with self.tracer.start_as_current_span('Session.download_file', attributes={'fusion_platform.destination': destination}) as span:
+            try:
+                # Download the file to a temporarily named file.
+                self._logger.info('downloading %s -> %s', url, destination)
+                refreshes = 0
+
+                while True:
+                    try:
+                        self.retry_policy.retrying()(self.__download, url, destination, temporary_destination, callback)
+                        break
+
+                    except ExpiredUrlError:
+                        # Obtain a new URL and try again, continuing from whatever has been downloaded so far.
+                        if (refresh_url is None) or (refreshes >= self.download_url_refreshes):
+                            raise
+
+                        refreshes += 1
+                        self._logger.info('refreshing expired download URL for %s', destination)
+                        url = refresh_url()
+
+                # Verify the downloaded size. A partial file which is too small is kept so that the download can be resumed, whereas one which is too large cannot be
+                # resumed and is therefore removed.
+                download_size = os.path.getsize(temporary_destination)
+
+                if (size is not None) and (download_size != size):
+                    if download_size > size:
+                        os.remove(temporary_destination)
+                        self.__remove_download_validator(temporary_destination)
+
+                    raise RequestError(i18n.t('session.download_incomplete', expected=size, actual=download_size))
+
+                # Rename the downloaded file.
+                os.replace(temporary_destination, destination)
+                self.__remove_download_validator(temporary_destination)
+
+                self._logger.info('downloaded %s', destination)
+                span.set_attribute('fusion_platform.bytes', max(0, download_size - partial_size))
+                self.__record_transfer('download', started_at, max(0, download_size - partial_size), True)
+
+            except RequestError:
+                self.__record_transfer('download', started_at, 0, False)
+                raise
+
+            except Exception as e:
+                self.__record_transfer('download', started_at, 0, False)
+                message = str(e)
+                message = e.__class__.__name__ if (e is None) or (len(str(e).strip()) <= 0) else message
+                raise RequestError(i18n.t('session.request_failed', message=message)) from e
+
+    @property
+    def download_manager(self):
+        """
+        Returns:
+            The download manager shared by all file downloads using this session.
+        """
+        return self.__download_manager
+
+    def __download_probe(self, url):
+        """
+        Probes the URL to find out whether range requests are supported and, if so, the size of the file. A single byte range GET is used rather than a HEAD
+        request because signed URLs are typically only valid for the GET method.
+
+        Args:
+            url: The URL to probe.
+
+        Returns:
+            The size of the file in bytes, or None if range requests are not supported.
+        """
+        with self.__http.get(url, headers={Session._HEADER_RANGE: Session._RANGE_TEMPLATE.format(start=0, end=0)}, stream=True) as response:
+            if response.status_code in Session._EXPIRED_URL_STATUS_CODES:
+                raise ExpiredUrlError(i18n.t('session.request_failed', message=response))
+
+            match = Session._CONTENT_RANGE_PATTERN.match(response.headers.get(Session._HEADER_CONTENT_RANGE, ''))
+
+            if (response.status_code != requests.codes.partial_content) or (match is None):
+                self._logger.debug('range requests not supported for %s', url)
+                return None
+
+            return int(match.group(3))
+
+    def __download_segmented(self, url, destination, temporary_destination, size, callback):
+        """
+        Downloads the file as a series of byte ranges which are fetched concurrently and written into their position within a preallocated file. As the segments are
+        written out of order, this file is separate from the temporary file, and is only renamed to the temporary file once every segment has completed. This
+        ensures that a partial segmented download is never mistaken for a partial stream which can be resumed.
+
+        Each segment is retried according to the session's retry policy, continuing from whatever has been downloaded of that segment so far.
+
+        Args:
+            url: The URL to download as a file.
+            destination: The destination file path.
+            temporary_destination: The temporary file path to download to.
+            size: The size of the file in bytes.
+            callback: The optional callback method used to receive download progress.
+
+        Raises:
+            RequestError: if any segment fails.
+        """
+        # Split the file into contiguous byte ranges, each of which is inclusive of its end.
+        segment_size = -(-size // self.download_segments)  # Ceiling division.
+        segments = [(start, min(start + segment_size, size) - 1) for start in range(0, size, segment_size)]
+        self._logger.debug('downloading %d bytes in %d segments', size, len(segments))
+
+        # Preallocate the segmented file so that each segment can be written into its position.
+        segmented_destination = f"{temporary_destination}{Session._DOWNLOAD_SEGMENTED_EXTENSION}"
+
+        with open(segmented_destination, 'wb') as file:
+            file.truncate(size)
+
+        # Progress is aggregated across all segments.
+        lock = Lock()
+        progress = {'size': 0}
+
+        def download_range(segment, end):
+            headers = {Session._HEADER_RANGE: Session._RANGE_TEMPLATE.format(start=segment['position'], end=end)}
+
+            try:
+                with self.__http.get(url, headers=headers, stream=True) as response:
+                    # Make sure we have received the range we asked for.
+                    self.__check_download_response(response)
+
+                    if response.status_code != requests.codes.partial_content:
+                        raise RequestError(i18n.t('session.request_failed', message=response))
+
+                    with open(segmented_destination, 'r+b') as segment_file:
+                        segment_file.seek(segment['position'])
+
+                        for chunk in response.iter_content(chunk_size=Session._DOWNLOAD_CHUNK_SIZE):
+                            segment_file.write(chunk)
+                            segment['position'] += len(chunk)
+
+                            with lock:
+                                progress['size'] += len(chunk)
+                                download_size = progress['size']
+
+                            self._logger.debug('downloaded %d bytes', download_size)
+
+                            if callback is not None:
+                                callback(url, destination, download_size)
+
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                self.__raise_retryable_download_error(e)
+
+            # Make sure the whole segment has been written.
+            if segment['position'] != end + 1:
+                raise RequestError(i18n.t('session.download_incomplete', expected=end + 1 - segment['start'], actual=segment['position'] - segment['start']))
+
+        def download_segment(start, end):
+            # Retries continue from whatever has been downloaded of the segment so far.
+            segment = {'start': start, 'position': start}
+
+            try:
+                self.retry_policy.retrying()(download_range, segment, end)
+
+            except RetryableRequestError as e:
+                # The segment has already been retried, so the download as a whole should not be.
+                raise RequestError(str(e)) from e
+
         try:
-            # Download the file in chunks to a temporarily named file.
-            self._logger.info('downloading %s -> %s', url, destination)
-            response = requests.get(url, stream=True)
+            with ThreadPoolExecutor(max_workers=len(segments)) as executor:
+                futures = [executor.submit(contextvars.copy_context().run, download_segment, start, end) for start, end in segments]
+
+                # Raise the first error, if any, once all the segments have finished.
+                for future in futures:
+                    future.result()
+
+            os.replace(segmented_destination, temporary_destination)
+            self.__remove_download_validator(temporary_destination)
+
+        except Exception:
+            # The segmented file cannot be resumed, as we do not know which segments completed.
+            if os.path.exists(segmented_destination):
+                os.remove(segmented_destination)
+
+            raise
+
+    def __download_stream(self, url, destination, temporary_destination, callback, start=0):
+        """
+        Downloads the file as a single stream in chunks, optionally continuing from the end of a partially downloaded file.
+
+        Args:
+            url: The URL to download as a file.
+            destination: The destination file path.
+            temporary_destination: The temporary file path to download to.
+            callback: The optional callback method used to receive download progress.
+            start: The optional number of bytes already downloaded to the temporary file. Default 0.
+        """
+        validator_destination = f"{temporary_destination}{Session._DOWNLOAD_VALIDATOR_EXTENSION}"
+        validator = None
+
+        if start > 0:
+            # Only resume if we know which version of the file the partial download came from, as otherwise we could join together different versions.
+            if os.path.exists(validator_destination):
+                with open(validator_destination, 'r') as file:
+                    validator = file.read().strip()
+
+            if not validator:
+                self._logger.debug('unable to resume download from %d bytes without a validator', start)
+                start = 0
+
+        headers = {Session._HEADER_RANGE: Session._RANGE_FROM_TEMPLATE.format(start=start), Session._HEADER_IF_RANGE: validator} if start > 0 else None
+
+        with self.__http.get(url, headers=headers, stream=True) as response:
+            if start > 0:
+                # A range which cannot be satisfied suggests that the partial file is already complete, in which case there is nothing more to download. Otherwise,
+                # we restart from the beginning.
+                if response.status_code == requests.codes.requested_range_not_satisfiable:
+                    match = Session._CONTENT_RANGE_UNSATISFIED_PATTERN.match(response.headers.get(Session._HEADER_CONTENT_RANGE, ''))
+
+                    if (match is not None) and (int(match.group(1)) == start):
+                        self._logger.debug('partial download %s is already complete', temporary_destination)
+                        return
+
+                    response.close()
+                    self.__download_stream(url, destination, temporary_destination, callback)
+                    return
+
+                # If the server has ignored the range, or the file has changed since the partial download, then we have to restart from the beginning.
+                match = Session._CONTENT_RANGE_PATTERN.match(response.headers.get(Session._HEADER_CONTENT_RANGE, ''))
+
+                if (response.status_code != requests.codes.partial_content) or (match is None) or (int(match.group(1)) != start):
+                    self._logger.debug('unable to resume download from %d bytes', start)
+                    start = 0
+                else:
+                    self._logger.info('resuming download from %d bytes', start)
 
             # Raise any errors.
-            if not response:
-                raise RequestError(i18n.t('session.request_failed', message=response))
+            self.__check_download_response(response)
+
+            # Save the validator for the file we are about to download from the beginning, so that it can be resumed. Weak entity tags cannot be used with
+            # range requests.
+            if start <= 0:
+                etag = response.headers.get(Session._HEADER_ETAG)
+                validator = etag if (etag is not None) and not etag.startswith('W/') else response.headers.get(Session._HEADER_LAST_MODIFIED)
+
+                if validator:
+                    with open(validator_destination, 'w') as file:
+                        file.write(validator)
+                else:
+                    self.__remove_download_validator(temporary_destination)
 
             # Download the content to file as a series of chunks.
-            temporary_destination = f"{destination}{Session.DOWNLOAD_EXTENSION}"
-            download_size = 0
+            download_size = start
 
-            with open(temporary_destination, 'wb') as file:
-                for chunk in response.iter_content(chunk_size=1024 * 1024 * 10):
+            with open(temporary_destination, 'ab' if start > 0 else 'wb') as file:
+                for chunk in response.iter_content(chunk_size=Session._DOWNLOAD_CHUNK_SIZE):
                     file.write(chunk)
                     download_size += len(chunk)
                     self._logger.debug('downloaded %d bytes', download_size)
@@ -160,34 +979,18 @@ class Session(Base):
                     if callback is not None:
                         callback(url, destination, download_size)
 
-            # Rename the downloaded file.
-            if os.path.exists(temporary_destination):
-                os.rename(temporary_destination, destination)
-
-            self._logger.info('downloaded %s', destination)
-
-        except RequestError:
-            raise
-
-        except Exception as e:
-            message = str(e)
-            message = e.__class__.__name__ if (e is None) or (len(str(e).strip()) <= 0) else message
-            raise RequestError(i18n.t('session.request_failed', message=message)) from e
-
-    def __filter_nested_dictionary(self, dictionary):
+    def __logged_payload(self, payload, size=None):
         """
-        Recursively filters a nested dictionary to mask out any keys which should be masked.
+        Wraps a payload so that it is lazily logged according to the session's logging options.
 
         Args:
-            dictionary: The nested dictionary to mask.
+            payload: The payload to log.
+            size: The optional size of the encoded payload in bytes.
 
         Returns:
-            The masked nested dictionary.
+            The wrapped payload.
         """
-        if (dictionary is not None) and isinstance(dictionary, dict):
-            return {key: '*****' if key in Session._MASK_KEYS else self.__filter_nested_dictionary(value) for key, value in dictionary.items()}
-        else:
-            return dictionary
+        return LoggedPayload(payload, size=size, summarise=self.log_payloads == Session.LOG_PAYLOADS_SUMMARY, maximum_length=self.log_payload_length)
 
     def login(self, email=None, user_id=None, password=None, api_url=None):
         """
@@ -229,32 +1032,226 @@ class Session(Base):
 
         self.__bearer_token = response.get('access_token')
 
+        # Cached responses may belong to a different user.
+        with self.__response_cache_lock:
+            self.__response_cache.clear()
+
         if (self.__user_id is None) or (self.__bearer_token is None):
             raise RequestError(i18n.t('session.login_failed'))
 
         self._logger.debug('logged in')
 
-    @retry(wait=wait_random_exponential(multiplier=1, min=1, max=5), stop=stop_after_attempt(10), reraise=True,
-           retry=retry_if_exception_type(RetryableRequestError),
-           before_sleep=before_sleep_log(logging.getLogger(fusion_platform.FUSION_PLATFORM_LOGGER), logging.INFO))
-    def request(self, path='/', query_parameters=None, method=METHOD_GET, body=None):
+    @property
+    def metrics(self):
+        """
+        Returns:
+            The registry in which request, upload and download metrics are recorded, or None if metrics are not being recorded.
+        """
+        return self.__metrics
+
+    def __raise_retryable_download_error(self, e):
+        """
+        Raises a download connection error as a retryable error if the retry policy allows it to be retried, or otherwise re-raises it.
+
+        Args:
+            e: The connection error.
+
+        Raises:
+            RetryableRequestError: if the download can be retried.
+        """
+        if not self.retry_policy.is_retryable(Session.METHOD_GET, exception=e):
+            raise e
+
+        message = str(e)
+        message = e.__class__.__name__ if (e is None) or (len(str(e).strip()) <= 0) else message
+        raise RetryableRequestError(i18n.t('session.request_failed', message=message)) from e
+
+    def __record_request(self, method, path, started_at, json_body, response):
+        """
+        Records the metrics for a single request attempt against the path's template.
+
+        Args:
+            method: The RESTful method type.
+            path: The path.
+            started_at: The monotonic time at which the request was started.
+            json_body: The optional encoded request body.
+            response: The optional response, which is None if the request failed without a response.
+        """
+        labels = {'method': method, 'template': TemplatedPath.template_of(path)}
+
+        self.__metrics.increment('requests_total', dict(labels, status=str(response.status_code) if response is not None else 'error'))
+        self.__metrics.observe('request_duration_seconds', time.monotonic() - started_at, labels)
+
+        if json_body is not None:
+            self.__metrics.increment('request_sent_bytes_total', labels, len(json_body))
+
+        if response is not None:
+            # The elapsed time is measured until the response headers have been received.
+            self.__metrics.observe('request_time_to_first_byte_seconds', response.elapsed.total_seconds(), labels)
+            self.__metrics.increment('request_received_bytes_total', labels, len(response.content))
+
+    def __record_transfer(self, transfer, started_at, size, success):
+        """
+        Records the metrics for a file upload or download.
+
+        Args:
+            transfer: Either "upload" or "download".
+            started_at: The monotonic time at which the transfer was started.
+            size: The number of bytes transferred.
+            success: True if the transfer succeeded.
+        """
+        if self.__metrics is None:
+            return
+
+        self.__metrics.increment(f"{transfer}s_total", {'status': 'success' if success else 'failure'})
+        self.__metrics.observe(f"{transfer}_duration_seconds", time.monotonic() - started_at)
+
+        if size > 0:
+            self.__metrics.increment(f"{transfer}_bytes_total", value=size)
+
+    @staticmethod
+    def __remove_download_validator(temporary_destination):
+        """
+        Removes any validator saved for a partial download.
+
+        Args:
+            temporary_destination: The temporary file path of the partial download.
+        """
+        validator_destination = f"{temporary_destination}{Session._DOWNLOAD_VALIDATOR_EXTENSION}"
+
+        if os.path.exists(validator_destination):
+            os.remove(validator_destination)
+
+    def request(self, path='/', query_parameters=None, method=METHOD_GET, body=None, include_length=False):
         """
         Sends a request to the Fusion Platform<sup>&reg;</sup> using the specified path, method and JSON payload. This method will use the authentication bearer token, if
         available.
 
+        If the session has a response cache, GET requests for a cached response are sent as conditional requests. When the response has not been modified, the
+        same cached payload object is returned without being decoded again. Callers must therefore not modify the returned payload.
+
+        Identical GET requests made concurrently from different threads are coalesced, so that only one request is sent and its response is given to every caller.
+        Requests made from a cancellable context (see #cancellable) are not coalesced, so that their cancellation cannot fail the requests of other callers.
+
+        Failed requests are retried according to the session's retry policy. By default, intermittent connection errors and transient 429 and 5xx responses are
+        retried for idempotent methods, waiting for any time requested by the server in a Retry-After header.
+
         Args:
             path: The optional path. Default '/'.
             query_parameters: The optional query parameters as a dictionary.
             method: The optional RESTful method type. Default GET.
             body: The optional body. Default None.
+            include_length: Optionally also return the length of the response body in bytes. Default False.
+
+        Returns:
+            The decoded response body, or a tuple of the decoded response body and its length in bytes if the length is included.
+
+        Raises:
+            RequestError: if the request failed.
+        """
+        if (not self.coalesce_requests) or (method != Session.METHOD_GET) or (self.__cancelled.get() is not None):
+            payload, length = self.__request(path, query_parameters, method, body)
+            return (payload, length) if include_length else payload
+
+        # Either join an identical request which is already in flight, or become the request which is sent.
+        key = (path, tuple(sorted((key, str(value)) for key, value in (query_parameters or {}).items())), self.__bearer_token)
+
+        with self.__in_flight_lock:
+            in_flight = self.__in_flight.get(key)
+            leader = in_flight is None
+
+            if leader:
+                in_flight = [Future(), 0]
+                self.__in_flight[key] = in_flight
+            else:
+                in_flight[1] += 1
+
+        future = in_flight[0]
+
+        # Unless responses are already shared through the response cache, each caller receives its own copy of a coalesced response.
+        share = self.response_cache_size > 0
+
+        if not leader:
+            self._logger.debug('coalesced request %s: %s%s(%s)', method, self.__api_url, path, query_parameters)
+            payload, length = future.result()
+            payload = payload if share else copy.deepcopy(payload)
+
+            return (payload, length) if include_length else payload
+
+        try:
+            payload, length = self.__request(path, query_parameters, method, body)
+
+        except BaseException as e:
+            with self.__in_flight_lock:
+                self.__in_flight.pop(key, None)
+
+            future.set_exception(e)
+            raise
+
+        # No more callers can join once the request has been removed.
+        with self.__in_flight_lock:
+            self.__in_flight.pop(key, None)
+            followers = in_flight[1]
+
+        future.set_result((payload, length))
+        payload = payload if share or (followers <= 0) else copy.deepcopy(payload)
+
+        return (payload, length) if include_length else payload
+
+    def __request(self, path, query_parameters, method, body):
+        """
+        Sends a single request to the Fusion Platform<sup>&reg;</sup>, retrying intermittent errors according to the retry policy. See #request.
+
+        Args:
+            path: The path.
+            query_parameters: The optional query parameters as a dictionary.
+            method: The RESTful method type.
+            body: The optional body.
+
+        Returns:
+            A tuple of the decoded response body and its length in bytes.
+
+        Raises:
+            RequestError: if the request failed.
+        """
+        attempts = {'count': 0}
+        cancelled = self.__cancelled.get()
+
+        def attempt():
+            if (cancelled is not None) and cancelled.is_set():
+                raise RequestError(i18n.t('session.request_cancelled'))
+
+            attempts['count'] += 1
+            return self.__request_attempt(path, query_parameters, method, body)
+
+        with self.tracer.start_as_current_span('Session.request', attributes={'http.method': method, 'fusion_platform.path': str(path)}) as span:
+            try:
+                return self.retry_policy.retrying(cancelled=cancelled)(attempt)
+            finally:
+                span.set_attribute('fusion_platform.attempts', attempts['count'])
+
+                if (self.__metrics is not None) and (attempts['count'] > 1):
+                    self.__metrics.increment('request_retries_total', {'method': method, 'template': TemplatedPath.template_of(path)}, attempts['count'] - 1)
+
+    def __request_attempt(self, path, query_parameters, method, body):
+        """
+        Makes a single attempt at sending a request to the Fusion Platform<sup>&reg;</sup>. See #request.
+
+        Args:
+            path: The path.
+            query_parameters: The optional query parameters as a dictionary.
+            method: The RESTful method type.
+            body: The optional body.
 
         Returns:
-            The decoded response body.
+            A tuple of the decoded response body and its length in bytes.
 
         Raises:
+            RetryableRequestError: if the request failed but can be retried.
             RequestError: if the request failed.
         """
         payload = None
+        length = 0
 
         # Optionally add the bearer token.
         headers = {'Content-Type': 'application/json'}
@@ -262,19 +1259,56 @@ class Session(Base):
         if self.__bearer_token is not None:
             headers['Authorization'] = f"Bearer {self.__bearer_token}"
 
+        # Optionally make the request conditional on a cached response.
+        cache_key = (path, tuple(sorted((key, str(value)) for key, value in (query_parameters or {}).items()))) if (
+                self.response_cache_size > 0) and (method == Session.METHOD_GET) else None
+        cached = self.__cache_get(cache_key) if cache_key is not None else None
+
+        if cached is not None:
+            etag, last_modified, _, _ = cached
+
+            if etag is not None:
+                headers[Session._HEADER_IF_NONE_MATCH] = etag
+
+            if last_modified is not None:
+                headers[Session._HEADER_IF_MODIFIED_SINCE] = last_modified
+
+        # Wait until the request is allowed by any rate limiter.
+        throttled = False
+
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+        started_at = time.monotonic()
+        json_body = None
+        response = None
+
         try:
-            # Issue the request.
-            self._logger.info('request %s: %s%s(%s) -> %s', method, self.__api_url, path, query_parameters, self.__filter_nested_dictionary(body))
-            json_body = json.dumps(body, default=json_default) if body is not None else None
-            with requests.request(method, f"{self.__api_url}{path}", params=query_parameters, data=json_body, headers=headers) as response:
+            # Issue the request. The payloads are only masked and formatted if they are actually logged.
+            json_body = json_dumps(body, binary=True) if body is not None else None
+            self._logger.info('request %s: %s%s(%s) -> %s', method, self.__api_url, path, query_parameters,
+                              self.__logged_payload(body, len(json_body) if json_body is not None else None))
+            with self.__http.request(method, f"{self.__api_url}{path}", params=query_parameters, data=json_body, headers=headers) as response:
                 self._logger.debug('response headers: %s', response.headers)
 
+                # Let any rate limiter know if the request has been throttled.
+                throttled = response.status_code in Session._THROTTLED_STATUS_CODES
+
+                # Reuse the cached payload if it has not been modified.
+                if (cached is not None) and (response.status_code == requests.codes.not_modified):
+                    self._logger.debug('response not modified')
+                    return cached[2], cached[3]
+
+                # Transient errors can be retried after a delay.
+                if (not response) and self.retry_policy.is_retryable(method, status_code=response.status_code):
+                    raise RetryableRequestError(i18n.t('session.request_failed', message=response), retry_after=RetryPolicy.retry_after(response))
+
                 # Raise any errors.
                 if not response:
                     message = str(response.status_code)
 
                     try:
-                        message = response.json().get('error_message')
+                        message = json_loads(response.content).get('error_message')
                         self._logger.error(message)
                     except:
                         pass  # Ignore the inability to extract the error message.
@@ -284,56 +1318,133 @@ class Session(Base):
 
                     raise RequestError(i18n.t('session.request_failed', message=message))
 
-                payload = response.json()
-                self._logger.debug('response: %s', self.__filter_nested_dictionary(payload))
+                payload = json_loads(response.content)
+                length = len(response.content)
+                self._logger.debug('response %d in %.3fs: %s', response.status_code, response.elapsed.total_seconds(),
+                                   self.__logged_payload(payload, length))
+
+                # Cache the response if it can be validated by a later conditional request.
+                etag = response.headers.get(Session._HEADER_ETAG)
+                last_modified = response.headers.get(Session._HEADER_LAST_MODIFIED)
+
+                if (cache_key is not None) and ((etag is not None) or (last_modified is not None)):
+                    self.__cache_put(cache_key, etag, last_modified, payload, length)
 
         except RequestError:  # Suggests a fatal error which cannot be retried.
             raise
 
-        except (requests.ConnectionError, requests.Timeout) as e:  # Suggests an intermittent error which can be retried.
+        except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:  # Suggests an intermittent error which may be retried.
             message = str(e)
             message = e.__class__.__name__ if (e is None) or (len(str(e).strip()) <= 0) else message
-            raise RetryableRequestError(i18n.t('session.request_failed', message=message)) from e
+
+            if self.retry_policy.is_retryable(method, exception=e):
+                raise RetryableRequestError(i18n.t('session.request_failed', message=message)) from e
+
+            raise RequestError(i18n.t('session.request_failed', message=message)) from e
 
         except Exception as e:  # Suggests a fatal error which cannot be retried.
             message = str(e)
             message = e.__class__.__name__ if (e is None) or (len(str(e).strip()) <= 0) else message
             raise RequestError(i18n.t('session.request_failed', message=message)) from e
 
+        finally:
+            if self.rate_limiter is not None:
+                self.rate_limiter.release(throttled=throttled)
+
+            if self.__metrics is not None:
+                self.__record_request(method, path, started_at, json_body, response)
+
         # Return the payload.
-        return payload
+        return payload, length
 
     def upload_file(self, url, source, callback=None):
         """
-        Uploads a file from the source path.
+        Uploads a file from the source path as a single stream, which is retried according to the session's retry policy.
 
         Args:
-            url: The URL to download as a file.
+            url: The URL to upload the file to.
             source: The source file path.
             callback: The optional callback method used to receive upload progress.
+
+        Raises:
+            RequestError: if the upload fails.
         """
-        try:
-            # Upload the file as a data stream.
-            self._logger.info('uploading %s -> %s', url, source)
+        started_at = time.monotonic()
+
+        with self.tracer.start_as_current_span('Session.upload_file', attributes={'fusion_platform.source': source}) as span:
+            try:
+                self._logger.info('uploading %s -> %s', url, source)
+                upload_callback = UploadCallback(url, source, callback)
+
+                self.retry_policy.retrying()(self.__upload_stream, url, source, upload_callback, callback is not None)
+
+                self._logger.info('uploaded %s', source)
+                span.set_attribute('fusion_platform.bytes', os.path.getsize(source))
+                self.__record_transfer('upload', started_at, os.path.getsize(source), True)
 
+            except RequestError:
+                self.__record_transfer('upload', started_at, 0, False)
+                raise
+
+            except Exception as e:
+                self.__record_transfer('upload', started_at, 0, False)
+                message = str(e)
+                message = e.__class__.__name__ if (e is None) or (len(str(e).strip()) <= 0) else message
+                raise RequestError(i18n.t('session.request_failed', message=message)) from e
+
+    def __upload_stream(self, url, source, upload_callback, progress):
+        """
+        Makes a single attempt at uploading a file as a data stream. Any progress is discounted if the upload fails, so that it can be retried.
+
+        Args:
+            url: The URL to upload the file to.
+            source: The source file path.
+            upload_callback: The upload callback used to receive upload progress.
+            progress: True if upload progress is required.
+
+        Raises:
+            RetryableRequestError: if the upload failed but can be retried.
+            RequestError: if the upload failed.
+        """
+        stream_progress = {'size': 0}
+
+        def stream_callback(size):
+            stream_progress['size'] += size
+            upload_callback.callback(size)
+
+        try:
             with open(source, 'rb') as file:
                 # Wrap the file reader with a callback to give progress.
-                file = CallbackIOWrapper(UploadCallback(url, source, callback).callback, file, 'read') if callback is not None else file
-                response = requests.put(url, data=file)
+                file = CallbackIOWrapper(stream_callback, file, 'read') if progress else file
+                response = self.__http.put(url, data=file)
 
-                # Raise any errors.
-                if not response:
-                    raise RequestError(i18n.t('session.request_failed', message=response))
+            # Raise any errors.
+            if not response:
+                if self.retry_policy.is_retryable(Session.METHOD_PUT, status_code=response.status_code):
+                    raise RetryableRequestError(i18n.t('session.request_failed', message=response), retry_after=RetryPolicy.retry_after(response))
 
-            self._logger.info('uploaded %s', source)
+                raise RequestError(i18n.t('session.request_failed', message=response))
 
-        except RequestError:
+        except RetryableRequestError:
+            upload_callback.callback(-stream_progress['size'])
             raise
 
-        except Exception as e:
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if not self.retry_policy.is_retryable(Session.METHOD_PUT, exception=e):
+                raise
+
+            upload_callback.callback(-stream_progress['size'])
             message = str(e)
             message = e.__class__.__name__ if (e is None) or (len(str(e).strip()) <= 0) else message
-            raise RequestError(i18n.t('session.request_failed', message=message)) from e
+            raise RetryableRequestError(i18n.t('session.request_failed', message=message)) from e
+
+    @property
+    def upload_executor(self):
+        """
+        Returns:
+            The executor shared by all file uploads using this session. Tasks are submitted with an optional priority, where lower values are run first.
+        """
+        return self.__upload_executor
 
     @property
     def user_id(self):
@@ -140,6 +140,9 @@ i18n.add_translation('command.version_content', '%%(prog)s %{version} (%{version
 i18n.add_translation('command.version_help', 'show the version information and exit', 'en')
 i18n.add_translation('command.version_long', '--version', 'en')
 i18n.add_translation('command.version_short', '-v', 'en')
+i18n.add_translation('command.profile_help', 'profile the SDK calls, writing a report sorted by wall time to the file, or cProfile statistics if the file name ends with \'.pstats\'', 'en')
+i18n.add_translation('command.profile_long', '--profile', 'en')
+i18n.add_translation('command.profile_short', '-f', 'en')
 i18n.add_translation('command.debug_help', 'show debug output (default \'%%(default)s\')', 'en')
 i18n.add_translation('command.debug_long', '--debug', 'en')
 i18n.add_translation('command.debug_short', '-b', 'en')
@@ -243,7 +246,9 @@ Usage:
 
 ''', 'en')
 i18n.add_translation('command.program', 'fusion_platform', 'en')
+i18n.add_translation('session.download_incomplete', 'Download incomplete: expected %{expected} bytes but received %{actual} bytes', 'en')
 i18n.add_translation('session.request_failed', 'API request failed: %{message}', 'en')
+i18n.add_translation('session.request_cancelled', 'API request cancelled', 'en')
 i18n.add_translation('session.login_failed', 'Login failed', 'en')
 i18n.add_translation('session.missing_password', 'Password must be specified', 'en')
 i18n.add_translation('session.missing_email_user_id', 'Either an email address or a user id must be specified', 'en')
@@ -261,7 +266,7 @@ i18n.add_translation('models.data_file.organisation_id.title', 'Organisation', '
 i18n.add_translation('models.data.no_upload', 'No upload is in progress', 'en')
 i18n.add_translation('models.data.no_create', 'No create is in progress', 'en')
 i18n.add_translation('models.data.failed_add_missing_file', 'Failed to add file as the file does not exist: %{file}', 'en')
-i18n.add_translation('models.data.failed_add_file_not_unique', 'Failed to add file as the id is not unique', 'en')
+i18n.add_translation('models.data.failed_add_file_not_unique', 'Failed to add file as it has already been added', 'en')
 i18n.add_translation('models.data.failed_add_file_url', 'Failed to get URL from add file response', 'en')
 i18n.add_translation('models.data.failed_add_file_id', 'Failed to get id from add file response', 'en')
 i18n.add_translation('models.data.failed_copy_id', 'Failed to get data id from copy response', 'en')
@@ -49,6 +49,9 @@ setup(
         'tenacity',
         'tqdm'
     ],
+    extras_require={
+        'fast': ['orjson']
+    },
     entry_points={
         'console_scripts': [
             'fusion_platform=fusion_platform.command:main',
@@ -0,0 +1,78 @@
+#
+# Metrics test file.
+#
+# @author Matthew Casey
+#
+# (c) Digital Content Analysis Technology Ltd 2022
+#
+
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.custom_test_case import CustomTestCase
+
+from fusion_platform.common.metrics import MetricsRegistry, TemplatedPath
+
+
+class TestMetrics(CustomTestCase):
+    def test_templated_path(self):
+        """
+        Tests that paths remember their template, and that ids are replaced in paths without a template.
+        """
+        template = '/organisations/{organisation_id}/processes/{process_id}/executions'
+        path = TemplatedPath(template.format(organisation_id='a', process_id='b'), template)
+
+        self.assertEqual('/organisations/a/processes/b/executions', path)
+        self.assertEqual(template, TemplatedPath.template_of(path))
+
+        self.assertEqual('/organisations/{id}/processes/{id}', TemplatedPath.template_of(
+            '/organisations/8c4f7b3e-1a2b-4c3d-8e9f-0a1b2c3d4e5f/processes/0f1e2d3c-4b5a-4968-8776-5a4b3c2d1e0f'))
+        self.assertEqual('/users/login', TemplatedPath.template_of('/users/login'))
+
+    def test_counters(self):
+        """
+        Tests that counters are incremented safely from several threads.
+        """
+        registry = MetricsRegistry()
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(lambda _: registry.increment('requests_total', {'method': 'GET'}), range(100)))
+
+        registry.increment('requests_total', {'method': 'POST'}, 5)
+        counters = registry.snapshot()['counters']['requests_total']
+        self.assertEqual(100, counters[(('method', 'GET'),)])
+        self.assertEqual(5, counters[(('method', 'POST'),)])
+
+        registry.reset()
+        self.assertEqual({'counters': {}, 'histograms': {}}, registry.snapshot())
+
+    def test_histograms(self):
+        """
+        Tests that histograms record cumulative bucket counts, the count and the sum.
+        """
+        registry = MetricsRegistry(buckets=[1, 10])
+
+        for value in [0.5, 5, 50]:
+            registry.observe('request_duration_seconds', value, {'template': '/path'})
+
+        histogram = registry.snapshot()['histograms']['request_duration_seconds'][(('template', '/path'),)]
+        self.assertEqual({1: 1, 10: 2}, histogram['buckets'])
+        self.assertEqual(3, histogram['count'])
+        self.assertEqual(55.5, histogram['sum'])
+
+    def test_to_prometheus(self):
+        """
+        Tests the Prometheus text export.
+        """
+        registry = MetricsRegistry(buckets=[1])
+        self.assertEqual('', registry.to_prometheus())
+
+        registry.increment('requests_total', {'template': '/path/"{id}"'})
+        registry.observe('upload_duration_seconds', 2)
+
+        self.assertEqual('# TYPE fusion_platform_requests_total counter\n'
+                         'fusion_platform_requests_total{template="/path/\\"{id}\\""} 1\n'
+                         '# TYPE fusion_platform_upload_duration_seconds histogram\n'
+                         'fusion_platform_upload_duration_seconds_bucket{le="1"} 0\n'
+                         'fusion_platform_upload_duration_seconds_bucket{le="+Inf"} 1\n'
+                         'fusion_platform_upload_duration_seconds_count 1\n'
+                         'fusion_platform_upload_duration_seconds_sum 2.0\n', registry.to_prometheus())
@@ -0,0 +1,79 @@
+#
+# Page sizer test file.
+#
+# @author Matthew Casey
+#
+# (c) Digital Content Analysis Technology Ltd 2022
+#
+
+from tests.custom_test_case import CustomTestCase
+
+from fusion_platform.common.page_sizer import PageSizer
+
+
+class TestPageSizer(CustomTestCase):
+    """
+    Page sizer tests.
+    """
+
+    def test_fixed(self):
+        """
+        Tests that the page size is fixed without a maximum.
+        """
+        sizer = PageSizer(24)
+        self.assertFalse(sizer.adaptive)
+
+        sizer.update(0.1, 24, 1000)
+        self.assertEqual(24, sizer.size)
+
+        sizer.update(100, 24, 1000000000)
+        self.assertEqual(24, sizer.size)
+
+        self.assertEqual(1, PageSizer(0).size)
+
+    def test_grow(self):
+        """
+        Tests that the page size grows geometrically while the pages are within the targets, up to the maximum.
+        """
+        sizer = PageSizer(24, maximum=200, time_target=1, bytes_target=1000000)
+        self.assertTrue(sizer.adaptive)
+        sizes = []
+
+        for _ in range(5):
+            sizes.append(sizer.size)
+            sizer.update(0.1, sizer.size, sizer.size * 100)
+
+        self.assertEqual([24, 48, 96, 192, 200], sizes)
+
+        # Empty pages do not change the page size.
+        sizer.update(10, 0, 0)
+        self.assertEqual(200, sizer.size)
+
+        # Growth is capped at the page size expected to reach the size target.
+        sizer = PageSizer(24, maximum=200, bytes_target=5000)
+        sizer.update(0.1, 24, 2400)
+        self.assertEqual(48, sizer.size)
+        sizer.update(0.1, 48, 4800)
+        self.assertEqual(50, sizer.size)
+
+        # The maximum is never less than the initial page size.
+        sizer = PageSizer(24, maximum=10)
+        sizer.update(0.1, 24, 2400)
+        self.assertEqual(24, sizer.size)
+
+    def test_shrink(self):
+        """
+        Tests that the page size shrinks when a page misses either target.
+        """
+        sizer = PageSizer(96, maximum=200, time_target=1, bytes_target=1000000)
+
+        sizer.update(2, 96, 9600)
+        self.assertEqual(48, sizer.size)
+
+        sizer.update(0.1, 48, 2000000)
+        self.assertEqual(24, sizer.size)
+
+        for _ in range(10):
+            sizer.update(2, sizer.size, 100)
+
+        self.assertEqual(1, sizer.size)
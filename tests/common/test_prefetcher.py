@@ -0,0 +1,141 @@
+#
+# Prefetcher test file.
+#
+# @author Matthew Casey
+#
+# (c) Digital Content Analysis Technology Ltd 2022
+#
+
+import contextvars
+import pytest
+from threading import Event, current_thread
+import time
+
+from tests.custom_test_case import CustomTestCase
+
+from fusion_platform.common.prefetcher import Prefetcher
+
+
+class TestPrefetcher(CustomTestCase):
+    """
+    Prefetcher tests.
+    """
+
+    def test_close(self):
+        """
+        Tests that closing the prefetcher stops the background thread and closes the iterator.
+        """
+        produced = []
+        closed = Event()
+
+        def generator():
+            try:
+                for i in range(100):
+                    produced.append(i)
+                    yield i
+            finally:
+                closed.set()
+
+        prefetcher = Prefetcher(generator(), 2)
+        self.assertEqual(0, next(prefetcher))
+        prefetcher.close()
+
+        self.assertTrue(closed.wait(5))
+        self.assertLessEqual(len(produced), 5)
+
+        with pytest.raises(StopIteration):
+            next(prefetcher)
+
+    def test_depth(self):
+        """
+        Tests that no more than the depth number of items are obtained ahead of those consumed.
+        """
+        produced = []
+
+        def generator():
+            for i in range(20):
+                produced.append(i)
+                yield i
+
+        prefetcher = Prefetcher(generator(), 3)
+
+        for i, item in enumerate(prefetcher):
+            self.assertEqual(i, item)
+            time.sleep(0.01)  # Give the background thread time to fill the queue.
+
+            # The consumed item, those waiting and the one being obtained.
+            self.assertLessEqual(len(produced), i + 1 + 3 + 1)
+
+        self.assertEqual(list(range(20)), produced)
+
+    def test_error(self):
+        """
+        Tests that an error raised by the iterator is raised after the preceding items have been consumed.
+        """
+
+        def generator():
+            yield 1
+            yield 2
+            raise ValueError('failed')
+
+        prefetcher = Prefetcher(generator(), 5)
+        self.assertEqual(1, next(prefetcher))
+        self.assertEqual(2, next(prefetcher))
+
+        with pytest.raises(ValueError):
+            next(prefetcher)
+
+        with pytest.raises(StopIteration):
+            next(prefetcher)
+
+    def test_interleave(self):
+        """
+        Tests that several iterators are obtained concurrently, each on its own background thread, with the items from each iterator remaining in order.
+        """
+        threads = {}
+
+        def generator(index, count):
+            for i in range(count):
+                threads.setdefault(index, set()).add(current_thread().name)
+                yield i
+
+        items = list(Prefetcher.interleave([generator(0, 10), generator(1, 0), generator(2, 5)], 2, thread_name_prefix='test_prefetcher'))
+
+        self.assertEqual(15, len(items))
+        self.assertEqual(list(range(10)), [item for index, item in items if index == 0])
+        self.assertEqual(list(range(5)), [item for index, item in items if index == 2])
+        self.assertEqual({0: {'test_prefetcher_1'}, 2: {'test_prefetcher_3'}}, threads)
+        self.assertEqual([], list(Prefetcher.interleave([], 2)))
+
+        def failing():
+            yield 1
+            raise ValueError('failed')
+
+        prefetcher = Prefetcher.interleave([generator(0, 100), failing()], 2)
+
+        with pytest.raises(ValueError):
+            for _ in prefetcher:
+                pass
+
+        with pytest.raises(StopIteration):
+            next(prefetcher)
+
+    def test_iterate(self):
+        """
+        Tests that all the items are obtained in order on a background thread within the context of the caller.
+        """
+        variable = contextvars.ContextVar('variable', default=None)
+        variable.set('value')
+        threads = []
+        values = []
+
+        def generator():
+            for i in range(10):
+                threads.append(current_thread().name)
+                values.append(variable.get())
+                yield i
+
+        self.assertEqual(list(range(10)), list(Prefetcher(generator(), 2, thread_name='test_prefetcher')))
+        self.assertEqual(['test_prefetcher'] * 10, threads)
+        self.assertEqual(['value'] * 10, values)
+        self.assertEqual([], list(Prefetcher(iter([]), 2)))
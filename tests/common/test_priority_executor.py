@@ -0,0 +1,113 @@
+#
+# Priority executor test file.
+#
+# @author Matthew Casey
+#
+# (c) Digital Content Analysis Technology Ltd 2022
+#
+
+from concurrent.futures import wait
+import pytest
+from threading import Event, Lock, Timer
+import time
+
+from tests.custom_test_case import CustomTestCase
+
+from fusion_platform.common.priority_executor import PriorityExecutor
+
+
+class TestPriorityExecutor(CustomTestCase):
+    def test_bounded(self):
+        """
+        Tests that no more than the maximum number of tasks run concurrently.
+        """
+        executor = PriorityExecutor(3)
+        self.assertEqual(3, executor.max_workers)
+        lock = Lock()
+        running = {'current': 0, 'maximum': 0}
+
+        def task():
+            with lock:
+                running['current'] += 1
+                running['maximum'] = max(running['maximum'], running['current'])
+
+            time.perf_counter()  # Yield a little.
+
+            with lock:
+                running['current'] -= 1
+
+        futures = [executor.submit(task) for _ in range(50)]
+        wait(futures)
+        self.assertTrue(all([future.done() for future in futures]))
+        self.assertLessEqual(running['maximum'], 3)
+
+    def test_error(self):
+        """
+        Tests that an error is raised from the future.
+        """
+        executor = PriorityExecutor(1)
+
+        def task():
+            raise ValueError
+
+        future = executor.submit(task)
+
+        with pytest.raises(ValueError):
+            future.result()
+
+    def test_priority(self):
+        """
+        Tests that queued tasks are run lowest priority value first, and in submission order for the same priority.
+        """
+        executor = PriorityExecutor(1)
+        started = Event()
+        release = Event()
+        order = []
+
+        def blocker():
+            started.set()
+            release.wait()
+
+        blocking = executor.submit(blocker)
+        started.wait()
+
+        futures = [executor.submit(order.append, name, priority=priority) for name, priority in [('c', 2), ('a1', 1), ('b', 1.5), ('a2', 1)]]
+        release.set()
+        wait([blocking] + futures)
+
+        self.assertEqual(['a1', 'a2', 'b', 'c'], order)
+
+    def test_shutdown(self):
+        """
+        Tests that queued tasks can be cancelled and that no tasks can be submitted after shutdown.
+        """
+        executor = PriorityExecutor(1)
+        started = Event()
+        release = Event()
+
+        def blocker():
+            started.set()
+            release.wait()
+
+        blocking = executor.submit(blocker)
+        started.wait()
+        queued = executor.submit(lambda: None)
+
+        executor.shutdown(cancel_futures=True)
+        release.set()
+        blocking.result()
+        self.assertTrue(queued.cancelled())
+
+        with pytest.raises(RuntimeError):
+            executor.submit(lambda: None)
+
+        # Shutting down can wait for the running tasks to finish.
+        executor = PriorityExecutor(1)
+        started.clear()
+        release.clear()
+        blocking = executor.submit(blocker)
+        started.wait()
+
+        Timer(0.1, release.set).start()
+        executor.shutdown(wait=True)
+        self.assertTrue(blocking.done())
@@ -0,0 +1,122 @@
+#
+# Profiler test file.
+#
+# @author Matthew Casey
+#
+# (c) Digital Content Analysis Technology Ltd 2022
+#
+
+import os
+import pstats
+import tempfile
+
+from tests.custom_test_case import CustomTestCase
+
+from fusion_platform.common.profiler import Profiler
+
+
+class Profiled:
+    """
+    Class used to test profiling.
+    """
+
+    def method(self, value):
+        return value
+
+    def generator(self, count):
+        for index in range(count):
+            yield index
+
+    def closing_generator(self, closed):
+        def generate():
+            try:
+                while True:
+                    yield 0
+            finally:
+                closed.append(True)
+
+        # Keep a reference to the generator, so that it is not closed when the wrapper is garbage collected.
+        self.generator_in_use = generate()
+        return self.generator_in_use
+
+    def first_and_generator(self, count):
+        return 0, self.generator(count)
+
+    @staticmethod
+    def static_method():
+        return True
+
+    def _protected(self):
+        return True
+
+    async def coroutine(self):
+        return True
+
+
+class TestProfiler(CustomTestCase):
+    def test_instrument(self):
+        """
+        Tests that public methods are instrumented and restored, together with any named methods.
+        """
+        method = Profiled.method
+        coroutine = Profiled.coroutine
+        profiler = Profiler()
+        profiler.instrument([Profiled], names=['_protected'])
+
+        self.assertIsNot(method, Profiled.method)
+        self.assertIs(coroutine, Profiled.coroutine)
+
+        profiled = Profiled()
+        self.assertEqual(1, profiled.method(1))
+        self.assertEqual(2, profiled.method(2))
+        self.assertEqual([0, 1, 2], list(profiled.generator(3)))
+        first, generator = profiled.first_and_generator(2)
+        self.assertEqual([0, 1], list(generator))
+        closed = []
+        generator = profiled.closing_generator(closed)
+        self.assertEqual(0, next(generator))
+        generator.close()
+        self.assertEqual([True], closed)  # Closing the wrapper closes the generator.
+        self.assertTrue(Profiled.static_method())
+        self.assertTrue(profiled._protected())
+
+        statistics = profiler.statistics()
+        self.assertEqual(2, statistics['Profiled.method'][Profiler.STATISTIC_CALLS])
+        self.assertEqual(2, statistics['Profiled.generator'][Profiler.STATISTIC_CALLS])  # Including the call from first_and_generator.
+        self.assertEqual(1, statistics['Profiled.first_and_generator'][Profiler.STATISTIC_CALLS])
+        self.assertEqual(1, statistics['Profiled.static_method'][Profiler.STATISTIC_CALLS])
+        self.assertEqual(1, statistics['Profiled._protected'][Profiler.STATISTIC_CALLS])
+        self.assertTrue(statistics['Profiled.method'][Profiler.STATISTIC_WALL_TIME] >= 0)
+
+        report = profiler.report()
+        self.assertTrue(report.startswith('method'))
+        self.assertIn('Profiled.method', report)
+
+        profiler.stop()
+        self.assertIs(method, Profiled.method)
+        profiled.method(3)
+        self.assertEqual(2, profiler.statistics()['Profiled.method'][Profiler.STATISTIC_CALLS])
+
+    def test_output(self):
+        """
+        Tests that the report or cProfile statistics are written on stopping.
+        """
+        with tempfile.TemporaryDirectory() as dir:
+            output = os.path.join(dir, 'profile.txt')
+            profiler = Profiler()
+            profiler.instrument([Profiled])
+            profiler.start()
+            Profiled().method(1)
+            profiler.stop(output)
+
+            with open(output, 'r') as file:
+                self.assertIn('Profiled.method', file.read())
+
+            output = os.path.join(dir, f"profile{Profiler.PSTATS_EXTENSION}")
+            profiler = Profiler()
+            profiler.instrument([Profiled])
+            profiler.start(output)
+            Profiled().method(1)
+            profiler.stop(output)
+
+            self.assertTrue(any(function == 'method' for _, _, function in pstats.Stats(output).stats.keys()))
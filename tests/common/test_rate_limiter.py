@@ -0,0 +1,86 @@
+#
+# Rate limiter test file.
+#
+# @author Matthew Casey
+#
+# (c) Digital Content Analysis Technology Ltd 2022
+#
+
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+import time
+
+from tests.custom_test_case import CustomTestCase
+
+from fusion_platform.common.rate_limiter import RateLimiter
+
+
+class TestRateLimiter(CustomTestCase):
+    def test_concurrency(self):
+        """
+        Tests that no more than the concurrency window of requests are in progress at once.
+        """
+        rate_limiter = RateLimiter(concurrency=3)
+        self.assertEqual(3, rate_limiter.window)
+        lock = Lock()
+        running = {'current': 0, 'maximum': 0}
+
+        def request(_):
+            rate_limiter.acquire()
+
+            with lock:
+                running['current'] += 1
+                running['maximum'] = max(running['maximum'], running['current'])
+
+            time.perf_counter()  # Yield a little.
+
+            with lock:
+                running['current'] -= 1
+
+            rate_limiter.release()
+
+        with ThreadPoolExecutor(max_workers=10) as executor:
+            list(executor.map(request, range(100)))
+
+        self.assertLessEqual(running['maximum'], 3)
+        self.assertEqual(3, rate_limiter.window)
+
+    def test_rate(self):
+        """
+        Tests that requests are limited to the rate after the initial burst.
+        """
+        rate_limiter = RateLimiter(rate=100, burst=1)
+        self.assertIsNone(rate_limiter.window)
+        start = time.monotonic()
+
+        for _ in range(11):
+            rate_limiter.acquire()
+            rate_limiter.release()
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.09)
+
+    def test_window(self):
+        """
+        Tests that the concurrency window decreases multiplicatively when throttled, and increases additively on success.
+        """
+        rate_limiter = RateLimiter(concurrency=8, concurrency_minimum=2)
+
+        rate_limiter.acquire()
+        rate_limiter.release(throttled=True)
+        self.assertEqual(4, rate_limiter.window)
+
+        for _ in range(3):
+            rate_limiter.acquire()
+            rate_limiter.release(throttled=True)
+
+        self.assertEqual(2, rate_limiter.window)
+
+        rate_limiter.acquire()
+        rate_limiter.release()
+        self.assertEqual(2.5, rate_limiter.window)
+
+        for _ in range(100):
+            rate_limiter.acquire()
+            rate_limiter.release()
+
+        self.assertEqual(8, rate_limiter.window)
@@ -0,0 +1,87 @@
+#
+# Tracing test file.
+#
+# @author Matthew Casey
+#
+# (c) Digital Content Analysis Technology Ltd 2022
+#
+
+import pytest
+
+from tests.custom_test_case import CustomTestCase
+
+from fusion_platform.common.priority_executor import PriorityExecutor
+from fusion_platform.common.raise_thread import RaiseThread
+from fusion_platform.common.tracing import InMemoryTracer, Span, Tracer
+
+
+class TestTracing(CustomTestCase):
+    def test_no_op(self):
+        """
+        Tests that the default tracer does nothing, and does not suppress exceptions.
+        """
+        tracer = Tracer()
+
+        with tracer.start_as_current_span('test', attributes={'key': 'value'}) as span:
+            self.assertIsInstance(span, Span)
+            span.set_attribute('key', 'value')
+            span.record_exception(ValueError())
+
+        with pytest.raises(ValueError):
+            with tracer.start_as_current_span('test'):
+                raise ValueError()
+
+    def test_in_memory(self):
+        """
+        Tests that the in-memory tracer records spans with their parents, attributes and exceptions.
+        """
+        tracer = InMemoryTracer()
+
+        with tracer.start_as_current_span('parent', attributes={'key': 'value'}) as parent:
+            with tracer.start_as_current_span('child') as child:
+                child.set_attribute('other', 1)
+
+        with pytest.raises(ValueError):
+            with tracer.start_as_current_span('failed'):
+                raise ValueError()
+
+        spans = tracer.spans
+        self.assertEqual(['child', 'parent', 'failed'], [span.name for span in spans])
+        self.assertIs(parent, child.parent)
+        self.assertIsNone(parent.parent)
+        self.assertIsNone(spans[2].parent)
+        self.assertEqual({'key': 'value'}, parent.attributes)
+        self.assertEqual({'other': 1}, child.attributes)
+        self.assertIsInstance(spans[2].exceptions[0], ValueError)
+        self.assertTrue(parent.duration >= child.duration >= 0)
+
+        tracer.clear()
+        self.assertEqual([], tracer.spans)
+
+    def test_threads(self):
+        """
+        Tests that spans started on worker threads are children of the span which was current when the work was submitted.
+        """
+        tracer = InMemoryTracer()
+
+        def work(name):
+            with tracer.start_as_current_span(name):
+                pass
+
+        executor = PriorityExecutor(2)
+
+        with tracer.start_as_current_span('parent') as parent:
+            thread = RaiseThread(target=work, args=('thread',))
+            thread.start()
+            thread.join()
+
+            futures = [executor.submit(work, f"task{index}") for index in range(4)]
+
+            for future in futures:
+                future.result()
+
+        children = [span for span in tracer.spans if span.name != 'parent']
+        self.assertEqual(5, len(children))
+
+        for span in children:
+            self.assertIs(parent, span.parent)
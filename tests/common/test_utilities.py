@@ -7,8 +7,12 @@
 #
 
 from collections import OrderedDict
+import copy
 from datetime import date, datetime, time, timezone
 from decimal import Decimal
+import json
+import os
+import timeit
 from types import MappingProxyType
 
 import pytest
@@ -16,8 +20,9 @@ import pytz
 
 from tests.custom_test_case import CustomTestCase
 
-from fusion_platform.common.utilities import datetime_parse, dict_nested_get, json_default, string_blank, string_camel_to_underscore, value_from_read_only, \
-    value_to_read_only, value_to_string
+from fusion_platform.common.utilities import datetime_parse, dict_nested_get, json_backend, json_backend_set, json_default, json_dumps, json_loads, \
+    JSON_BACKEND_ORJSON, JSON_BACKEND_STDLIB, ReadOnlyDict, ReadOnlyList, string_blank, string_camel_to_underscore, value_from_read_only, value_to_read_only, \
+    value_to_string
 
 
 class TestUtilities(CustomTestCase):
@@ -92,6 +97,142 @@ class TestUtilities(CustomTestCase):
         self.assertEqual(str(dictionary), json_default(dictionary))
         self.assertEqual(dictionary, json_default(MappingProxyType(dictionary)))
 
+    def test_json_backend(self):
+        """
+        Tests json_backend_set.
+        """
+        backend = json_backend()
+        self.assertIn(backend, [JSON_BACKEND_ORJSON, JSON_BACKEND_STDLIB])
+
+        with pytest.raises(ValueError):
+            json_backend_set('unknown')
+
+        json_backend_set(JSON_BACKEND_STDLIB)
+        self.assertEqual(JSON_BACKEND_STDLIB, json_backend())
+        json_backend_set(backend)
+
+    def test_json_dumps_loads(self):
+        """
+        Tests json_dumps and json_loads with each available backend, making sure that they produce the same values.
+        """
+        raw_datetime = datetime.now()
+        decimal_number = Decimal(str(1.23456))
+        value = {'datetime': raw_datetime, 'decimal': decimal_number, 'read_only': MappingProxyType({'list': (1, 2, 3)}), 'unicode': 'caf\u00e9', 'large': 2 ** 70}
+        expected = {'datetime': json_default(raw_datetime), 'decimal': float(decimal_number), 'read_only': {'list': [1, 2, 3]}, 'unicode': 'caf\u00e9',
+                    'large': 2 ** 70}
+
+        backend = json_backend()
+
+        try:
+            for available in [JSON_BACKEND_ORJSON, JSON_BACKEND_STDLIB]:
+                try:
+                    json_backend_set(available)
+                except ValueError:
+                    continue  # The backend is not installed.
+
+                self.assertEqual(expected, json.loads(json_dumps(value)))
+                self.assertEqual('{"a":[1,2],"b":"caf\u00e9"}', json_dumps({'a': [1, 2], 'b': 'caf\u00e9'}))
+                self.assertEqual(expected, json.loads(json_dumps(value, binary=True).decode('utf-8')))
+                self.assertEqual(expected, json_loads(json.dumps(expected)))
+                self.assertEqual(expected, json_loads(json.dumps(expected).encode('utf-8')))
+        finally:
+            json_backend_set(backend)
+
+    @pytest.mark.benchmark
+    def test_json_benchmark(self):
+        """
+        Benchmarks the encoding and decoding of the fixtures using each backend.
+        """
+        pytest.importorskip('orjson')
+
+        fixtures = []
+
+        for fixture in sorted(os.listdir(self.fixture_path(''))):
+            if fixture.endswith('.json'):
+                with open(self.fixture_path(fixture), 'r') as file:
+                    fixtures.append(json.load(file))
+
+        backend = json_backend()
+        timings = {}
+
+        try:
+            for available in [JSON_BACKEND_STDLIB, JSON_BACKEND_ORJSON]:
+                json_backend_set(available)
+                encoded = [json_dumps(fixture, binary=True) for fixture in fixtures]
+                self.assertEqual(fixtures, [json_loads(data) for data in encoded])
+
+                encode = min(timeit.repeat(lambda: [json_dumps(fixture, binary=True) for fixture in fixtures], number=100, repeat=3))
+                decode = min(timeit.repeat(lambda: [json_loads(data) for data in encoded], number=100, repeat=3))
+                timings[available] = (encode, decode)
+                self._logger.info('%s: encode %.4fs, decode %.4fs', available, encode, decode)
+        finally:
+            json_backend_set(backend)
+
+        self._logger.info('orjson speed up: encode %.1fx, decode %.1fx', timings[JSON_BACKEND_STDLIB][0] / timings[JSON_BACKEND_ORJSON][0],
+                          timings[JSON_BACKEND_STDLIB][1] / timings[JSON_BACKEND_ORJSON][1])
+
+    def test_read_only_views(self):
+        """
+        Tests that read-only views behave like the mapping proxies and tuples they replace, without copying the viewed dictionaries.
+        """
+        value = {'list': [1, {'nested': [2, 3]}], 'dict': {'key': 'value'}, 'number': 4}
+        read_only = value_to_read_only(value)
+
+        self.assertIsInstance(read_only, ReadOnlyDict)
+        self.assertIsInstance(read_only['list'], ReadOnlyList)
+        self.assertIsInstance(read_only['list'][1], ReadOnlyDict)
+        self.assertIsInstance(read_only['list'][1]['nested'], ReadOnlyList)
+        self.assertEqual(MappingProxyType({'list': (1, MappingProxyType({'nested': (2, 3)})), 'dict': MappingProxyType({'key': 'value'}), 'number': 4}),
+                         read_only)
+        self.assertEqual(value_to_read_only(copy.deepcopy(value)), read_only)
+        self.assertNotEqual(value, read_only)  # Dictionaries containing lists are not equal, just as for mapping proxies.
+        self.assertEqual((1, 2), value_to_read_only([1, 2]))
+        self.assertNotEqual([1, 2], value_to_read_only([1, 2]))
+        self.assertEqual((2,), read_only['list'][1]['nested'][:1])
+        self.assertEqual(hash((2, 3)), hash(read_only['list'][1]['nested']))
+        self.assertIsInstance(read_only['list'], tuple)
+        self.assertEqual((2, 3, 4), read_only['list'][1]['nested'] + (4,))
+        self.assertIsInstance((read_only['list'] + (5,))[1], ReadOnlyDict)
+
+        with pytest.raises(TypeError):
+            hash(read_only)
+
+        self.assertEqual("ReadOnlyDict({'key': 'value'})", repr(read_only['dict']))
+        self.assertNotIsInstance(read_only, MappingProxyType)
+        self.assertEqual(repr((2, 3)), repr(read_only['list'][1]['nested']))
+        self.assertEqual(json.loads(json.dumps(value)), json.loads(json_dumps(read_only)))
+        self.assertEqual(value, value_from_read_only(read_only))
+        self.assertEqual('[1, 2]', value_to_string(value_to_read_only([1, 2])))
+
+        with pytest.raises(TypeError):
+            read_only['list'][0] = 5
+
+        with pytest.raises(AttributeError):
+            read_only['list'].append(5)
+
+        value['number'] = 5  # The value is not copied.
+        self.assertEqual(5, read_only['number'])
+
+    @pytest.mark.benchmark
+    def test_read_only_views_benchmark(self):
+        """
+        Benchmarks making a process read-only using views, compared to copying it and converting every nested value up front.
+        """
+        with open(self.fixture_path('process.json'), 'r') as file:
+            content = json.load(file)
+
+        def convert(value):
+            if isinstance(value, dict):
+                return MappingProxyType({key: convert(inner) for key, inner in value.items()})
+            elif isinstance(value, list):
+                return tuple([convert(inner) for inner in value])
+            else:
+                return value
+
+        eager = min(timeit.repeat(lambda: {key: convert(value) for key, value in copy.deepcopy(content).items()}, number=100, repeat=3))
+        lazy = min(timeit.repeat(lambda: {key: value_to_read_only(value) for key, value in content.items()}, number=100, repeat=3))
+        self._logger.info('read-only process: eager %.4fs, lazy %.4fs', eager, lazy)
+
     def test_string_blank(self):
         """
         Tests string_blank.
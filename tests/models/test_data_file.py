@@ -55,7 +55,7 @@ class TestDataFile(CustomTestCase):
         file_id = data_file_content.get('file_id')
         path = DataFile._PATH_DOWNLOAD_FILE.format(organisation_id=organisation_id, data_id=data_id, file_id=file_id)
         url = 'https://download-file.com/test'
-        content = 'content'
+        content = 'c' * data_file_content.get('size')  # The download is verified against the file size.
 
         data_file = DataFile(session)
         self.assertIsNotNone(data_file)
@@ -123,7 +123,7 @@ class TestDataFile(CustomTestCase):
         data_id = data_file_content.get('data_id')
         file_id = data_file_content.get('file_id')
         path = DataFile._PATH_DOWNLOAD_FILE.format(organisation_id=organisation_id, data_id=data_id, file_id=file_id)
-        content = 'content'
+        content = 'c' * data_file_content.get('size')  # The download is verified against the file size.
 
         data_file = DataFile(session)
         self.assertIsNotNone(data_file)
@@ -178,7 +178,7 @@ class TestDataFile(CustomTestCase):
         data_id = data_file_content.get('data_id')
         file_id = data_file_content.get('file_id')
         path = DataFile._PATH_DOWNLOAD_FILE.format(organisation_id=organisation_id, data_id=data_id, file_id=file_id)
-        content = 'content'
+        content = 'c' * data_file_content.get('size')  # The download is verified against the file size.
 
         data_file = DataFile(session)
         self.assertIsNotNone(data_file)
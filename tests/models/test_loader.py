@@ -0,0 +1,210 @@
+#
+# Compiled loader test file.
+#
+# @author Matthew Casey
+#
+# (c) Digital Content Analysis Technology Ltd 2022
+#
+
+import copy
+import json
+from marshmallow import Schema, ValidationError
+from marshmallow.validate import OneOf
+from mock import patch
+import pytest
+import timeit
+
+from tests.custom_test_case import CustomTestCase
+
+from fusion_platform.models import fields
+from fusion_platform.models.credit import CreditSchema
+from fusion_platform.models.data import DataSchema
+from fusion_platform.models.data_file import DataFileSchema
+from fusion_platform.models.loader import CompiledLoader
+from fusion_platform.models.organisation import OrganisationSchema
+from fusion_platform.models.process import OptionDataTypeSchema, ProcessSchema
+from fusion_platform.models.process_execution import ProcessExecutionSchema
+from fusion_platform.models.process_service_execution import ProcessServiceExecutionSchema
+from fusion_platform.models.process_service_execution_log import ProcessServiceExecutionLogSchema
+from fusion_platform.models.service import ServiceSchema
+from fusion_platform.models.user import UserSchema
+
+
+class TestCompiledLoader(CustomTestCase):
+    """
+    Compiled loader tests.
+    """
+
+    # The schema used to load each fixture.
+    FIXTURE_SCHEMAS = {
+        'credit.json': CreditSchema,
+        'data.json': DataSchema,
+        'data_file.json': DataFileSchema,
+        'organisation1.json': OrganisationSchema,
+        'organisation2.json': OrganisationSchema,
+        'process.json': ProcessSchema,
+        'process_execution.json': ProcessExecutionSchema,
+        'process_service_execution.json': ProcessServiceExecutionSchema,
+        'process_service_execution_log.json': ProcessServiceExecutionLogSchema,
+        'process_with_group.json': ProcessSchema,
+        'service.json': ServiceSchema,
+        'user.json': UserSchema,
+    }
+
+    # The fixtures which are mutated to check parity, together with the optional keys to which each fixture is restricted before it is mutated. These cover each
+    # type of field, while keeping the number of mutations small.
+    MUTATED_FIXTURES = {
+        'credit.json': None,
+        'data_file.json': None,
+        'process.json': ['name', 'repeat_gap', 'repeat_offset'],
+        'process_execution.json': ['inputs', 'process_id'],
+        'service.json': None,
+        'user.json': None,
+    }
+
+    # Values used to replace each value in a fixture.
+    REPLACEMENTS = [None, '', 'invalid', 0, 1.5, True, [], {}, ['invalid'], {'invalid': 'invalid'}]
+
+    @staticmethod
+    def __outcome(load):
+        """
+        Loads the data, capturing either the result or the error.
+
+        Args:
+            load: The function which loads the data.
+
+        Returns:
+            A tuple of whether the load succeeded and either the result or the error messages and valid data.
+        """
+        try:
+            return True, load()
+        except ValidationError as e:
+            return False, (e.messages, e.valid_data)
+
+    def __mutations(self, value):
+        """
+        Generates mutations of a value, in which each nested value is in turn either removed or replaced. Only the first item of each list is mutated.
+
+        Args:
+            value: The value to mutate.
+
+        Returns:
+            A generator of the mutated values.
+        """
+        keys = list(value.keys()) if isinstance(value, dict) else list(range(min(1, len(value)))) if isinstance(value, list) else []
+
+        for key in keys:
+            if isinstance(value, dict):
+                mutated = copy.copy(value)
+                mutated.pop(key)
+                yield mutated
+
+            for replacement in TestCompiledLoader.REPLACEMENTS:
+                mutated = copy.copy(value)
+                mutated[key] = replacement
+                yield mutated
+
+            for nested in self.__mutations(value[key]):
+                mutated = copy.copy(value)
+                mutated[key] = nested
+                yield mutated
+
+    def __load_fixtures(self):
+        """
+        Returns:
+            A generator of the schema class and content of each fixture.
+        """
+        for fixture, schema_class in TestCompiledLoader.FIXTURE_SCHEMAS.items():
+            with open(self.fixture_path(fixture), 'r') as file:
+                yield schema_class, json.loads(file.read())
+
+    @pytest.mark.benchmark
+    def test_benchmark(self):
+        """
+        Benchmarks loading a large page of models using the schema and the compiled loader.
+        """
+        with open(self.fixture_path('process.json'), 'r') as file:
+            content = json.loads(file.read())
+
+        schema = ProcessSchema()
+        loader = CompiledLoader.for_schema(schema)
+        page = [content] * 1000
+
+        self.assertEqual([schema.load(item) for item in page], [loader.load(item) for item in page])
+
+        loaded = min(timeit.repeat(lambda: [schema.load(item) for item in page], number=1, repeat=3))
+        compiled = min(timeit.repeat(lambda: [loader.load(item) for item in page], number=1, repeat=3))
+        self._logger.info('page of %s: schema %.4fs, compiled %.4fs, speed up %.1fx', len(page), loaded, compiled, loaded / compiled)
+
+    def test_for_schema(self):
+        """
+        Tests that loaders are cached for each schema class, unless the schema has been customised.
+        """
+        loader = CompiledLoader.for_schema(UserSchema())
+        self.assertTrue(loader.compiled)
+        self.assertIs(loader, CompiledLoader.for_schema(UserSchema()))
+
+        loader = CompiledLoader.for_schema(UserSchema(only=['id']))
+        self.assertFalse(loader.compiled)
+        self.assertIsNot(loader, CompiledLoader.for_schema(UserSchema(only=['id'])))
+
+        class ValidatedSchema(Schema):
+            value = fields.String(required=True, validate=OneOf(['valid']))
+
+        loader = CompiledLoader.for_schema(ValidatedSchema())
+        self.assertTrue(loader.compiled)
+        self.assertEqual({'value': 'valid'}, loader.load({'value': 'valid'}))
+
+        with self.assertRaises(ValidationError):
+            loader.load({'value': 'invalid'})
+
+    def test_load_fast(self):
+        """
+        Tests that each fixture is loaded without using the schema.
+        """
+        for schema_class, content in self.__load_fixtures():
+            expected = schema_class().load(content)
+
+            with patch.object(Schema, 'load', side_effect=AssertionError):
+                self.assertEqual(expected, CompiledLoader.for_schema(schema_class()).load(content))
+
+    def test_load_parity(self):
+        """
+        Tests that the compiled loader gives identical results and errors to the schema for each fixture, together with mutations of a representative set of
+        fixtures.
+        """
+        for schema_class, content in self.__load_fixtures():
+            schema = schema_class()
+            loader = CompiledLoader.for_schema(schema)
+
+            for partial in [False, True]:
+                self.assertEqual(self.__outcome(lambda: schema.load(content, partial=partial)), self.__outcome(lambda: loader.load(content, partial=partial)))
+
+        for fixture, keys in TestCompiledLoader.MUTATED_FIXTURES.items():
+            with open(self.fixture_path(fixture), 'r') as file:
+                content = json.loads(file.read())
+
+            content = content if keys is None else {key: value for key, value in content.items() if key in keys}
+            schema = TestCompiledLoader.FIXTURE_SCHEMAS[fixture]()
+            loader = CompiledLoader.for_schema(schema)
+
+            for data in [content] + list(self.__mutations(content)):
+                for partial in [False, True]:
+                    self.assertEqual(self.__outcome(lambda: schema.load(data, partial=partial)), self.__outcome(lambda: loader.load(data, partial=partial)))
+
+    def test_load_unknown(self):
+        """
+        Tests that unknown fields are either excluded or raise an error, depending upon the schema.
+        """
+        loader = CompiledLoader.for_schema(UserSchema())
+
+        with open(self.fixture_path('user.json'), 'r') as file:
+            content = json.loads(file.read())
+
+        self.assertEqual(UserSchema().load(content), loader.load({**content, 'unknown': True}))
+
+        loader = CompiledLoader.for_schema(OptionDataTypeSchema())
+        self.assertEqual({'numeric': 1.5}, loader.load({'numeric': 1.5}))
+
+        with self.assertRaises(ValidationError):
+            loader.load({'unknown': 1.5})
@@ -8,17 +8,26 @@
 
 from datetime import datetime, timezone
 from functools import partial
+from itertools import islice
 import json
 from mock import patch
 import pytest
+import random
+import re
 import requests
 import requests_mock
+import threading
+import time
+import timeit
+from urllib.parse import parse_qs, urlparse
 import uuid
 
 from tests.custom_test_case import CustomTestCase
 
-from fusion_platform.common.utilities import json_default, value_to_read_only, value_to_string
-from fusion_platform.session import Session, RequestError
+from fusion_platform.base import Base
+from fusion_platform.common.prefetcher import Prefetcher
+from fusion_platform.common.utilities import json_default, json_dumps, value_to_read_only, value_to_string
+from fusion_platform.session import RetryPolicy, Session, RequestError
 from fusion_platform.models.process import ProcessSchema
 from fusion_platform.models.model import Model, ModelError
 from fusion_platform.models.user import User, UserSchema
@@ -94,6 +103,48 @@ class TestModel(CustomTestCase):
         self.assertEqual({'id__eq': id}, Model._build_filter([(Model._FIELD_ID, Model._FILTER_MODIFIER_EQ, id)]))
         self.assertEqual({}, Model._build_filter([(Model._FIELD_ID, Model._FILTER_MODIFIER_EQ, None)]))
 
+    def test_construction(self):
+        """
+        Test that building the models from a page of results only sets up the common elements once.
+        """
+        session = Session()
+
+        with open(self.fixture_path('user.json'), 'r') as file:
+            content = json.loads(file.read())
+
+        with patch.object(Base, '_Base__initialised', False), patch.object(Base, '_initialise', wraps=Base._initialise) as mock_initialise:
+            for item in [content] * 100:
+                model = User(session)
+                model._set_model_from_response(item)
+
+            mock_initialise.assert_called_once()
+
+    @pytest.mark.benchmark
+    def test_construction_benchmark(self):
+        """
+        Benchmarks building the models from a page of results, compared to setting up the common elements for each model.
+        """
+        session = Session()
+
+        with open(self.fixture_path('user.json'), 'r') as file:
+            content = json.loads(file.read())
+
+        page = [content] * 100
+
+        def build(initialise):
+            for item in page:
+                if initialise:
+                    Base._initialise()
+
+                model = User(session)
+                model._set_model_from_response(item)
+
+        build(False)  # Warm up.
+
+        initialised = min(timeit.repeat(lambda: build(True), number=10, repeat=3))
+        constructed = min(timeit.repeat(lambda: build(False), number=10, repeat=3))
+        self._logger.info('page of %s models: initialise each %.4fs, initialise once %.4fs', len(page), initialised, constructed)
+
     def test_create_abstract(self):
         """
         Tests the create method does not work with abstract path methods.
@@ -147,7 +198,7 @@ class TestModel(CustomTestCase):
                     adapter = mock.post(f"{Session.API_URL_DEFAULT}{path}", text=json.dumps({Model._RESPONSE_KEY_MODEL: content}))
                     model._create(given_name=given_name, last_request_at=datetime.now(timezone.utc))
 
-                    self.assertEqual(json.dumps(model._Model__build_body(given_name=given_name), default=json_default), adapter.last_request.text)
+                    self.assertEqual(json_dumps(model._Model__build_body(given_name=given_name)), adapter.last_request.text)
 
                     schema = UserSchema()
 
@@ -224,7 +275,10 @@ class TestModel(CustomTestCase):
         Tests the first and generator method.
         """
 
+        calls = []
+
         def dummy_generator(nothing=False, items_per_request=10):
+            calls.append(items_per_request)
             count = items_per_request if not nothing else 0
             i = 0
 
@@ -249,8 +303,16 @@ class TestModel(CustomTestCase):
 
         self.assertEqual(0, first)
 
-        for index, item in enumerate(generator):
-            self.assertEqual(index, item)
+        items = list(generator)
+        self.assertEqual(list(range(10)), items)
+
+        # The first model and the generator share a single query.
+        self.assertEqual([10, 10], calls)
+
+        first, generator = Model._first_and_generator(partial_generator)
+        self.assertEqual(0, first)
+        generator.close()
+        self.assertIsNone(next(generator, None))
 
     def test_get_id_name(self):
         """
@@ -323,6 +385,37 @@ class TestModel(CustomTestCase):
                         else:
                             self.assertFalse(hasattr(model, key))
 
+    def test_get_cached(self):
+        """
+        Tests that a model is not reloaded when a cached response has not been modified.
+        """
+        with open(self.fixture_path('user.json'), 'r') as file:
+            content = json.loads(file.read())
+
+        session = Session(options={Session.RESPONSE_CACHE_SIZE: 10})
+        path = '/path'
+
+        model = Model(session)
+
+        with requests_mock.Mocker() as mock:
+            with patch.object(Model, Model._get_path.__name__, return_value=path):
+                with patch.object(Model, '_Model__get_schema', return_value=UserSchema()):
+                    mock.get(f"{Session.API_URL_DEFAULT}{path}", text=json.dumps({Model._RESPONSE_KEY_MODEL: content}), headers={'ETag': '"1"'})
+                    model.get()
+
+                    mock.get(f"{Session.API_URL_DEFAULT}{path}", status_code=304)
+
+                    with patch.object(Model, Model._set_model_from_response.__name__) as set_model_from_response:
+                        model.get()
+                        set_model_from_response.assert_not_called()
+
+                    self.assertEqual(content.get('email'), model.email)
+
+                    # A different model must still be loaded from the cached response.
+                    other_model = Model(session)
+                    other_model.get()
+                    self.assertEqual(content.get('email'), other_model.email)
+
     def test_get_path(self):
         """
         Tests the get path method.
@@ -363,6 +456,105 @@ class TestModel(CustomTestCase):
             iterator = Model._models_from_api_ids(Session(), [{Model._FIELD_ID: uuid.uuid4()}])
             next(iterator)
 
+    def test_models_from_api_ids_concurrent(self):
+        """
+        Tests that models are obtained concurrently using their ids, either in order or as they are obtained, with any errors given for each id.
+        """
+        with open(self.fixture_path('user.json'), 'r') as file:
+            content = json.loads(file.read())
+
+        user_ids = [str(uuid.uuid4()) for _ in range(20)]
+        failed_id = user_ids[10]
+        lock = threading.Lock()
+        concurrency = {'current': 0, 'maximum': 0}
+
+        model_from_api_id = User._model_from_api_id
+
+        def fetch(session, **kwargs):
+            # The mocked requests are sent one at a time, and so the concurrency is measured around them.
+            with lock:
+                concurrency['current'] += 1
+                concurrency['maximum'] = max(concurrency['maximum'], concurrency['current'])
+
+            try:
+                time.sleep(random.uniform(0.001, 0.02))  # Complete the requests out of order.
+                return model_from_api_id(session, **kwargs)
+            finally:
+                with lock:
+                    concurrency['current'] -= 1
+
+        def get(request, context):
+            id = request.path.split('/')[-1]
+
+            if id == failed_id:
+                context.status_code = 400
+                return '{}'
+
+            return json.dumps({Model._RESPONSE_KEY_MODEL: {**content, 'id': id}})
+
+        with requests_mock.Mocker() as mock, patch.object(User, '_model_from_api_id', side_effect=fetch):
+            adapter = mock.get(re.compile(f"{Session.API_URL_DEFAULT}/users/.*"), text=get)
+
+            ids = [{Model._FIELD_ID: id} for id in user_ids]
+            session = Session(options={Session.FETCH_MAX_WORKERS: 4})
+            self.assertEqual(Session.FETCH_MAX_WORKERS_DEFAULT, Session().fetch_max_workers)
+
+            # The models before the failure are given in order before the error is raised.
+            users = []
+
+            with pytest.raises(RequestError):
+                for user in User._models_from_api_ids(session, ids):
+                    users.append(str(user.id))
+
+            self.assertEqual(user_ids[:10], users)
+            self.assertLessEqual(concurrency['maximum'], 4)
+            self.assertGreater(concurrency['maximum'], 1)
+
+            # The errors can be given for each id.
+            for ordered in [True, False]:
+                results = list(User._models_from_api_ids(session, ids, ordered=ordered, errors=True))
+                self.assertEqual(len(user_ids), len(results))
+
+                if ordered:
+                    self.assertEqual(ids, [id for id, _ in results])
+
+                self.assertEqual(sorted(user_ids), sorted([id[Model._FIELD_ID] for id, _ in results]))
+
+                for id, result in results:
+                    if id[Model._FIELD_ID] == failed_id:
+                        self.assertIsInstance(result, RequestError)
+                    else:
+                        self.assertEqual(id[Model._FIELD_ID], str(result.id))
+
+            # Only the first model is obtained before it is given, and closing the generator early stops the remaining models from being obtained.
+            call_count = adapter.call_count
+            users = User._models_from_api_ids(session, ids)
+            self.assertEqual(user_ids[0], str(next(users).id))
+            users.close()
+
+            self.assertEqual(1, adapter.call_count - call_count)
+            self.assertFalse(any(thread.name.startswith('fusion_platform_fetch') for thread in threading.enumerate()))
+
+            # Closing the generator also stops a model which is still being obtained from being retried.
+            retried_id = str(uuid.uuid4())
+            mock.get(f"{Session.API_URL_DEFAULT}/users/{retried_id}", exc=requests.exceptions.ConnectTimeout)
+            session = Session(options={Session.FETCH_MAX_WORKERS: 4, Session.RETRY_POLICY: RetryPolicy(attempts=100, wait_minimum=10, wait_maximum=10)})
+
+            users = User._models_from_api_ids(session, [ids[0], {Model._FIELD_ID: retried_id}, ids[1]], ordered=False)
+            self.assertEqual(user_ids[0], str(next(users).id))
+            self.assertEqual(user_ids[1], str(next(users).id))
+
+            started_at = time.monotonic()
+            users.close()
+
+            self.assertLess(time.monotonic() - started_at, 5)
+            self.assertFalse(any(thread.name.startswith('fusion_platform_fetch') for thread in threading.enumerate()))
+
+            # Models can also be obtained one at a time.
+            session = Session(options={Session.FETCH_MAX_WORKERS: 1})
+            self.assertEqual(user_ids[:10], [str(user.id) for user in islice(User._models_from_api_ids(session, ids), 10)])
+            self.assertEqual(failed_id, list(User._models_from_api_ids(session, ids, errors=True))[10][0][Model._FIELD_ID])
+
     def test_models_from_api_path(self):
         """
         Tests generating an iterator through models with a path from the API method does not work with abstract methods.
@@ -378,6 +570,177 @@ class TestModel(CustomTestCase):
                 iterator = Model._models_from_api_path(Session(), path, items_per_request=10, reverse=True, filter={'test_begins_with': 'Test'}, search='search')
                 next(iterator)
 
+    def test_models_from_api_path_adaptive(self):
+        """
+        Tests that the page size adapts to the pages obtained when the session has a maximum page size, unless the items per request are fixed.
+        """
+        with open(self.fixture_path('user.json'), 'r') as file:
+            content = json.loads(file.read())
+
+        path = '/path'
+        users = [{**content, 'id': str(uuid.uuid4())} for _ in range(1000)]
+        ids = [user['id'] for user in users]
+        limits = []
+
+        def page(request, context):
+            query = parse_qs(urlparse(request.url).query)
+            start = int(query['last[index]'][0]) if 'last[index]' in query else 0
+            limit = int(query['limit'][0])
+            limits.append(limit)
+            last = {'index': start + limit} if (start + limit) < len(users) else None
+            return json.dumps({Model._RESPONSE_KEY_LIST: users[start:start + limit], Model._RESPONSE_KEY_LAST: last})
+
+        with requests_mock.Mocker() as mock:
+            mock.get(f"{Session.API_URL_DEFAULT}{path}", text=page)
+
+            # By default, the page size is not adapted.
+            session = Session()
+            self.assertEqual(Session.LIST_PAGE_SIZE_DEFAULT, session.list_page_size)
+            self.assertIsNone(session.list_page_size_maximum)
+            self.assertEqual(ids, [str(user.id) for user in User._models_from_api_path(session, path)])
+            self.assertEqual([24] * 42, limits)
+
+            limits.clear()
+            session = Session(options={Session.LIST_PAGE_SIZE_MAXIMUM: 240})
+            self.assertEqual(ids, [str(user.id) for user in User._models_from_api_path(session, path)])
+            self.assertEqual([24, 48, 96, 192, 240, 240, 240], limits)
+
+            # The session options change the page sizes.
+            limits.clear()
+            session = Session(options={Session.LIST_PAGE_SIZE: 100, Session.LIST_PAGE_SIZE_MAXIMUM: None})
+            self.assertEqual(ids, [str(user.id) for user in User._models_from_api_path(session, path)])
+            self.assertEqual([100] * 10, limits)
+
+            limits.clear()
+            session = Session(options={Session.LIST_PAGE_SIZE: 400, Session.LIST_PAGE_SIZE_MAXIMUM: 1000, Session.LIST_PAGE_BYTES_TARGET: 100})
+            self.assertEqual(ids, [str(user.id) for user in User._models_from_api_path(session, path)])
+            self.assertEqual([400, 200, 100, 50, 25, 12, 6, 3, 1], limits[:9])
+
+            # Fixed items per request are not adapted.
+            limits.clear()
+            self.assertEqual(ids, [str(user.id) for user in User._models_from_api_path(Session(), path, items_per_request=250)])
+            self.assertEqual([250] * 4, limits)
+
+    def test_models_from_api_path_prefetched(self):
+        """
+        Tests that pages are prefetched in the background, giving the same models as when each page is fetched only when needed.
+        """
+        with open(self.fixture_path('user.json'), 'r') as file:
+            content = json.loads(file.read())
+
+        path = '/path'
+        pages = 5
+        ids = [str(uuid.uuid4()) for _ in range(pages * 2)]
+
+        def page(request, context):
+            index = int(request.qs['last[page]'][0]) if 'last[page]' in request.qs else 0
+            last = {'page': index + 1} if index < (pages - 1) else None
+            return json.dumps({Model._RESPONSE_KEY_LIST: [{**content, 'id': id} for id in ids[index * 2:(index + 1) * 2]], Model._RESPONSE_KEY_LAST: last})
+
+        self.assertEqual(Session.LIST_PREFETCH_DEFAULT, Session().list_prefetch)
+
+        for prefetch in [0, 1, 3]:
+            with requests_mock.Mocker() as mock:
+                adapter = mock.get(f"{Session.API_URL_DEFAULT}{path}", text=page)
+                session = Session(options={Session.LIST_PREFETCH: prefetch})
+                self.assertEqual(prefetch, session.list_prefetch)
+
+                users = list(User._models_from_api_path(session, path, items_per_request=2))
+                self.assertEqual(ids, [str(user.id) for user in users])
+                self.assertEqual(pages, adapter.call_count)
+
+                # Closing the generator early stops any further pages being fetched.
+                call_count = adapter.call_count
+                iterator = User._models_from_api_path(Session(), path, items_per_request=2, prefetch=prefetch)
+                self.assertEqual(ids[0], str(next(iterator).id))
+                iterator.close()
+
+                for thread in threading.enumerate():
+                    if thread.name == 'fusion_platform_prefetch':
+                        thread.join(5)
+                        self.assertFalse(thread.is_alive())
+
+                self.assertLessEqual(adapter.call_count - call_count, prefetch + 2)
+
+    def test_models_from_api_path_sharded(self):
+        """
+        Tests that sharded and walked listings give each model once, optionally in the same order as the normal listing.
+        """
+        with open(self.fixture_path('user.json'), 'r') as file:
+            content = json.loads(file.read())
+
+        path = '/path'
+        users = [{**content, 'id': str(uuid.uuid4()), 'created_at': f"2022-01-{day:02d}T00:00:00+00:00"} for day in range(1, 26)]
+        ids = [user['id'] for user in users]
+
+        def page(request, context):
+            # Simulates the API filters and cursor using the query parameters, preserving their case.
+            query = parse_qs(urlparse(request.url).query)
+            items = [user for user in users if ('filter[created_at__lt]' not in query) or (user['created_at'] < query['filter[created_at__lt]'][0])]
+            items = [user for user in items if ('filter[created_at__ge]' not in query) or (user['created_at'] >= query['filter[created_at__ge]'][0])]
+            between = query.get('filter[created_at__between]')
+            items = [user for user in items if (between is None) or (between[0] <= user['created_at'] <= between[1])]
+            items = items[::-1] if query['reverse'][0] == 'True' else items
+            start = int(query['last[index]'][0]) if 'last[index]' in query else 0
+            limit = int(query['limit'][0])
+            last = {'index': start + limit} if (start + limit) < len(items) else None
+            return json.dumps({Model._RESPONSE_KEY_LIST: items[start:start + limit], Model._RESPONSE_KEY_LAST: last})
+
+        boundaries = ['2022-01-05T00:00:00+00:00', '2022-01-12T00:00:00+00:00', '2022-01-20T00:00:00+00:00']
+
+        with requests_mock.Mocker() as mock:
+            adapter = mock.get(f"{Session.API_URL_DEFAULT}{path}", text=page)
+
+            self.assertEqual(ids, [str(user.id) for user in User._models_from_api_path(Session(), path, items_per_request=4)])
+
+            for reverse in [False, True]:
+                expected = ids[::-1] if reverse else ids
+
+                for shard_boundaries in [None, boundaries[:1], boundaries]:
+                    for ordered in [False, True]:
+                        for compact in [False, True]:
+                            models = list(User._models_from_api_path_sharded(Session(), path, field='created_at', boundaries=shard_boundaries, ordered=ordered,
+                                                                             items_per_request=4, reverse=reverse, compact=compact))
+                            found = [str(model.id) for model in models]
+
+                            self.assertEqual(sorted(expected), sorted(found))
+                            self.assertEqual(expected if ordered else found, found)
+
+            # The walks stop once they meet. The walks are taken in turn rather than concurrently, so that the pages requested are deterministic: four pages
+            # forwards and three in reverse, with the last forward page meeting the reverse walk.
+            def in_turn(iterators, depth, thread_name_prefix=None):
+                iterators = list(enumerate(iterators))
+
+                while len(iterators) > 0:
+                    for index, iterator in list(iterators):
+                        try:
+                            yield index, next(iterator)
+                        except StopIteration:
+                            iterators.remove((index, iterator))
+
+            call_count = adapter.call_count
+
+            with patch.object(Prefetcher, 'interleave', side_effect=in_turn):
+                self.assertEqual(len(ids), len(list(User._models_from_api_path_sharded(Session(), path, items_per_request=4))))
+
+            self.assertEqual(7, adapter.call_count - call_count)
+
+            # Closing the generator early stops all the shards.
+            iterator = User._models_from_api_path_sharded(Session(), path, field='created_at', boundaries=boundaries, items_per_request=2)
+            next(iterator)
+            iterator.close()
+
+            for thread in threading.enumerate():
+                if thread.name.startswith('fusion_platform_shard'):
+                    thread.join(5)
+                    self.assertFalse(thread.is_alive())
+
+            # Errors from any shard are raised.
+            mock.get(f"{Session.API_URL_DEFAULT}{path}", status_code=400)
+
+            with pytest.raises(RequestError):
+                list(User._models_from_api_path_sharded(Session(), path, field='created_at', boundaries=boundaries))
+
     def test_new_abstract(self):
         """
         Tests the new method does not work with abstract path methods.
@@ -479,8 +842,10 @@ class TestModel(CustomTestCase):
         model._set_field(['email'], new_email)
         self.assertEqual(new_email, model.email)
 
+        notification_contact = model.notification_contact
         model._set_field(['notification_contact', 0], 'text')
         self.assertEqual(('text',), model.notification_contact)
+        self.assertEqual(tuple(content['notification_contact']), notification_contact)  # Views already provided are unchanged.
 
     def test_set_model(self):
         """
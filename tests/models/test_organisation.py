@@ -410,13 +410,15 @@ class TestOrganisation(CustomTestCase):
                 self.assertIsNone(first)
                 next(generator)
 
-            mock.get(f"{Session.API_URL_DEFAULT}{path}", text=json.dumps({Model._RESPONSE_KEY_LIST: [data_content]}))
+            adapter = mock.get(f"{Session.API_URL_DEFAULT}{path}", text=json.dumps({Model._RESPONSE_KEY_LIST: [data_content]}))
             first, generator = organisation.find_data(id=data_id, name=name, search=search)
             self.assertIsNotNone(first)
 
             for data in generator:
                 self.assertEqual(first.attributes, data.attributes)
 
+            self.assertEqual(1, adapter.call_count)  # The first page is only requested once.
+
     def test_find_dispatchers(self):
         """
         Tests the finding of dispatcher services.
@@ -609,6 +611,47 @@ class TestOrganisation(CustomTestCase):
             self.assertIsNotNone(organisation)
             self.assertEqual(str(organisation_id), str(organisation.id))
 
+    def test_list_data(self):
+        """
+        Tests listing data items with concurrent requests.
+        """
+        with open(self.fixture_path('organisation1.json'), 'r') as file:
+            organisation_content = json.loads(file.read())
+
+        with open(self.fixture_path('data.json'), 'r') as file:
+            data_content = json.loads(file.read())
+
+        session = Session()
+        organisation_id = organisation_content.get(Model._FIELD_ID)
+        path = Organisation._PATH_DATA.format(organisation_id=organisation_id)
+
+        organisation = Organisation(session)
+        self.assertIsNotNone(organisation)
+
+        with requests_mock.Mocker() as mock:
+            mock.get(f"{Session.API_URL_DEFAULT}{Organisation._PATH_GET.format(organisation_id=organisation_id)}",
+                     text=json.dumps({Model._RESPONSE_KEY_MODEL: organisation_content}))
+            organisation.get(id=organisation_id)
+            self.assertIsNotNone(organisation)
+            self.assertEqual(str(organisation_id), str(organisation.id))
+
+            with pytest.raises(RequestError):
+                mock.get(f"{Session.API_URL_DEFAULT}{path}", status_code=400)
+                next(organisation.list_data())
+
+            with pytest.raises(StopIteration):
+                mock.get(f"{Session.API_URL_DEFAULT}{path}", text='{}')
+                next(organisation.list_data())
+
+            mock.get(f"{Session.API_URL_DEFAULT}{path}", text=json.dumps({Model._RESPONSE_KEY_LIST: [data_content]}))
+
+            for boundaries in [None, [data_content.get('created_at')]]:
+                items = list(organisation.list_data(boundaries=boundaries, ordered=True))
+                self.assertEqual(1, len(items))  # Each shard gives the same item, which is only given once.
+
+                for data in items:
+                    self.assertEqual(str(organisation_id), str(data.organisation_id))
+
     def test_model_from_api_id(self):
         """
         Tests that an object can be created from an API endpoint.
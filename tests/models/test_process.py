@@ -10,6 +10,7 @@ import json
 import pytest
 import requests
 import requests_mock
+import threading
 import uuid
 
 import fusion_platform
@@ -679,6 +680,56 @@ class TestProcess(CustomTestCase):
                 self.assertIsNotNone(input.ssd_id)
                 self._logger.info(input)
 
+    def test_list_executions(self):
+        """
+        Tests listing process execution items with concurrent requests.
+        """
+        with open(self.fixture_path('process.json'), 'r') as file:
+            process_content = json.loads(file.read())
+
+        with open(self.fixture_path('process_execution.json'), 'r') as file:
+            execution_content = json.loads(file.read())
+
+        with open(self.fixture_path('extras.json'), 'r') as file:
+            extras = json.loads(file.read())
+
+        session = Session()
+        organisation_id = process_content.get('organisation_id')
+        process_id = process_content.get(Model._FIELD_ID)
+        path = Process._PATH_EXECUTIONS.format(organisation_id=organisation_id, process_id=process_id)
+
+        process = Process(session)
+        self.assertIsNotNone(process)
+
+        with requests_mock.Mocker() as mock:
+            mock.get(f"{Session.API_URL_DEFAULT}{Process._PATH_GET.format(organisation_id=organisation_id, process_id=process_id)}",
+                     text=json.dumps({Model._RESPONSE_KEY_MODEL: process_content, Model._RESPONSE_KEY_EXTRAS: {Model._FIELD_DISPATCHERS: extras}}))
+            process.get(organisation_id=organisation_id, process_id=process_id)
+            self.assertIsNotNone(process)
+            self.assertEqual(str(process_id), str(process.id))
+
+            with pytest.raises(RequestError):
+                mock.get(f"{Session.API_URL_DEFAULT}{path}", status_code=400)
+                next(process.list_executions())
+
+            # Let the other shards finish their requests, so that they are not shared with the following requests.
+            for thread in threading.enumerate():
+                if thread.name.startswith('fusion_platform_shard'):
+                    thread.join(5)
+
+            with pytest.raises(StopIteration):
+                mock.get(f"{Session.API_URL_DEFAULT}{path}", text='{}')
+                next(process.list_executions())
+
+            mock.get(f"{Session.API_URL_DEFAULT}{path}", text=json.dumps({Model._RESPONSE_KEY_LIST: [execution_content]}))
+
+            for boundaries in [None, [execution_content.get('created_at')]]:
+                items = list(process.list_executions(boundaries=boundaries, ordered=True))
+                self.assertEqual(1, len(items))  # Each shard gives the same item, which is only given once.
+
+                for execution in items:
+                    self.assertEqual(str(process_id), str(execution.process_id))
+
     def test_model_from_api_id(self):
         """
         Tests that an object can be created from an API endpoint.
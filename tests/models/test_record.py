@@ -0,0 +1,194 @@
+#
+# Record test file.
+#
+# @author Matthew Casey
+#
+# (c) Digital Content Analysis Technology Ltd 2022
+#
+
+from functools import partial
+import json
+import pytest
+import requests_mock
+import tracemalloc
+
+from tests.custom_test_case import CustomTestCase
+
+from fusion_platform.models.data_file import DataFile
+from fusion_platform.models.loader import CompiledLoader
+from fusion_platform.models.model import Model, ModelError
+from fusion_platform.models.process import Process
+from fusion_platform.models.process_execution import ProcessExecution, ProcessExecutionSchema
+from fusion_platform.models.process_service_execution import ProcessServiceExecution
+from fusion_platform.models.process_service_execution_log import ProcessServiceExecutionLog
+from fusion_platform.models.record import Record
+from fusion_platform.models.user import User
+from fusion_platform.session import Session
+
+
+class TestRecord(CustomTestCase):
+    """
+    Record tests.
+    """
+
+    # The model class for each fixture.
+    FIXTURE_MODELS = {
+        'data_file.json': DataFile,
+        'process.json': Process,
+        'process_execution.json': ProcessExecution,
+        'process_service_execution.json': ProcessServiceExecution,
+        'process_service_execution_log.json': ProcessServiceExecutionLog,
+        'user.json': User,
+    }
+
+    def __list(self, model_class, fixture, count=1, compact=False):
+        """
+        Lists the models from a mocked path which returns the fixture the given number of times.
+
+        Args:
+            model_class: The model class.
+            fixture: The fixture file name.
+            count: The optional number of items in the list. Default 1.
+            compact: Return records? Default False.
+
+        Returns:
+            The list of models or records.
+        """
+        with open(self.fixture_path(fixture), 'r') as file:
+            content = json.loads(file.read())
+
+        path = '/path'
+
+        with requests_mock.Mocker() as mock:
+            mock.get(f"{Session.API_URL_DEFAULT}{path}", text=json.dumps({Model._RESPONSE_KEY_LIST: [content] * count}))
+            return list(model_class._models_from_api_path(Session(), path, compact=compact))
+
+    def test_attributes(self):
+        """
+        Tests that records have the same attributes as the models they represent.
+        """
+        for fixture, model_class in TestRecord.FIXTURE_MODELS.items():
+            model = self.__list(model_class, fixture)[0]
+            record = self.__list(model_class, fixture, compact=True)[0]
+
+            self.assertIsInstance(record, Record)
+            self.assertEqual(model.attributes, record.attributes)
+            self.assertEqual(list(model.attributes.keys()), list(record.attributes.keys()))
+            self.assertEqual(str(model), str(record))
+            self.assertEqual(model.to_csv(exclude=['id']), record.to_csv(exclude=['id']))
+            self.assertEqual(model, record)
+            self.assertEqual(record, model)
+
+            for key, value in model.attributes.items():
+                self.assertEqual(value, getattr(record, key))
+                self.assertEqual(type(value), type(getattr(record, key)))
+
+            # Hidden fields are not available, and values cannot be changed.
+            for key in model_class._SCHEMA.fields:
+                if key not in model.attributes:
+                    self.assertFalse(hasattr(record, key))
+
+            with pytest.raises(AttributeError):
+                record.id = None
+
+            with pytest.raises(AttributeError):
+                record.other = None
+
+    def test_for_model(self):
+        """
+        Tests that a record class is built once for each model class.
+        """
+        record_class = Record.for_model(User)
+        self.assertIs(record_class, Record.for_model(User))
+        self.assertIsNot(record_class, Record.for_model(Process))
+        self.assertEqual('UserRecord', record_class.__name__)
+        self.assertEqual(list(User._SCHEMA.fields), list(record_class._FIELDS))
+
+        record = self.__list(User, 'user.json', compact=True)[0]
+        self.assertIs(record_class, type(record))
+        self.assertFalse(hasattr(record, '__dict__'))
+
+        with pytest.raises(NotImplementedError):
+            Record.for_model(Model)
+
+    @pytest.mark.benchmark
+    def test_memory_benchmark(self):
+        """
+        Benchmarks the memory used to hold a large listing of models and records, both in total and for the representation of the same loaded values.
+        """
+        count = 2000
+        listing = {}
+        representation = {}
+
+        for compact in [False, True]:
+            tracemalloc.start()
+            items = self.__list(ProcessExecution, 'process_execution.json', count=count, compact=compact)
+            listing[compact], _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            self.assertEqual(count, len(items))
+            del items
+
+        with open(self.fixture_path('process_execution.json'), 'r') as file:
+            content = json.loads(file.read())
+
+        loader = CompiledLoader.for_schema(ProcessExecutionSchema())
+        models = [loader.load(content) for _ in range(count)]
+        session = Session()
+
+        for compact, build in [(False, partial(ProcessExecution._from_record, session)), (True, partial(Record.for_model(ProcessExecution).from_model, session))]:
+            tracemalloc.start()
+            items = [build(model) for model in models]
+            representation[compact], _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            self.assertEqual(count, len(items))
+            del items
+
+        self._logger.info('%s executions: listing models %d bytes, records %d bytes; representation models %d bytes, records %d bytes, saving %.1fx', count,
+                          listing[False], listing[True], representation[False], representation[True], representation[False] / representation[True])
+        self.assertLess(listing[True], listing[False])
+        self.assertLess(representation[True], representation[False])
+
+    def test_models_from_api_path(self):
+        """
+        Tests that records are loaded and validated in the same way as models.
+        """
+        with open(self.fixture_path('user.json'), 'r') as file:
+            content = json.loads(file.read())
+
+        path = '/path'
+
+        with requests_mock.Mocker() as mock:
+            mock.get(f"{Session.API_URL_DEFAULT}{path}", text=json.dumps({Model._RESPONSE_KEY_LIST: [content]}))
+
+            record = next(User._models_from_api_path(Session(), path, compact=True, given_name='Other'))
+            self.assertEqual('Other', record.given_name)
+
+            with pytest.raises(ModelError):
+                next(User._models_from_api_path(Session(), path, compact=True, unknown=True))
+
+            mock.get(f"{Session.API_URL_DEFAULT}{path}", text=json.dumps({Model._RESPONSE_KEY_LIST: [{**content, 'id': 'invalid'}]}))
+
+            with pytest.raises(ModelError):
+                next(User._models_from_api_path(Session(), path, compact=True))
+
+    def test_to_model(self):
+        """
+        Tests that records are converted to and from models.
+        """
+        for fixture, model_class in TestRecord.FIXTURE_MODELS.items():
+            model = self.__list(model_class, fixture)[0]
+            record = model.to_record()
+
+            self.assertIsInstance(record, Record.for_model(model_class))
+            self.assertEqual(model, record)
+
+            converted = record.to_model()
+            self.assertIsInstance(converted, model_class)
+            self.assertTrue(converted._persisted)
+            self.assertEqual(model, converted)
+            self.assertEqual(model._model, converted._model)
+
+        with pytest.raises(ModelError):
+            User(Session()).to_record()
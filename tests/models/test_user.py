@@ -160,6 +160,14 @@ class TestUser(CustomTestCase):
                 self.assertEqual(organisation_names[index], organisation.name)
                 self.assertIsNotNone(organisations)
 
+            # The iterator reuses the organisations obtained by the search, so that each organisation is only obtained once.
+            call_count = mock.call_count
+            organisation, organisations = user.find_organisations(id=organisation_ids[0])
+            self.assertEqual(str(organisation_ids[0]), str(organisation.id))
+            self.assertEqual(1, mock.call_count - call_count)
+            self.assertEqual([str(id) for id in organisation_ids], [str(organisation.id) for organisation in organisations])
+            self.assertEqual(len(organisation_ids), mock.call_count - call_count)
+
     def test_get(self):
         """
         Tests that an object can be retrieved from the API.
@@ -6,6 +6,8 @@
 # (c) Digital Content Analysis Technology Ltd 2022
 #
 
+from mock import patch
+
 from tests.custom_test_case import CustomTestCase
 
 from fusion_platform.base import Base
@@ -22,6 +24,17 @@ class TestBase(CustomTestCase):
         """
         Base()
 
+    def test_init_once(self):
+        """
+        Test that the common elements are only set up when the first object is created.
+        """
+        with patch.object(Base, '_Base__initialised', False), patch('logging.basicConfig') as mock_basic_config:
+            Base()
+            Base()
+            Base()
+
+            mock_basic_config.assert_called_once()
+
     def test_main(self):
         """
         Test main entry point to ensure no exceptions are raised.
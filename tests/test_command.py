@@ -6,13 +6,14 @@
 # (c) Digital Content Analysis Technology Ltd 2022
 #
 
-from mock import patch
+from concurrent.futures import Future
+from mock import MagicMock, patch
 import pytest
 import sys
 
 from tests.custom_test_case import CustomTestCase
 
-from fusion_platform.command import main
+from fusion_platform.command import Command, main
 
 
 class TestCommand(CustomTestCase):
@@ -36,6 +37,29 @@ class TestCommand(CustomTestCase):
             with pytest.raises(SystemExit):
                 main()
 
+    def test_download_files(self):
+        """
+        Test that the download progress counts the bytes downloaded for each file through its own callback.
+        """
+        sizes = {'a': 60, 'b': 50}
+
+        def submit(file, path, callback=None):
+            # Each download reports some progress, and is then complete.
+            callback('url', path, sizes[path])
+            future = Future()
+            future.set_result(path)
+            return future
+
+        session = MagicMock()
+        session.download_manager.submit.side_effect = submit
+
+        with patch('fusion_platform.command.tqdm') as tqdm:
+            Command()._Command__download_files(session, [('file_a', 'a', 100), ('file_b', 'b', None)])
+
+        # A download with a known size is counted in full once complete, whereas one with an unknown size is counted from its progress.
+        self.assertEqual(150, sum([call.args[0] for call in tqdm.return_value.update.call_args_list]))
+        tqdm.return_value.close.assert_called_once()
+
     def test_define_help(self):
         """
         Test define help.
@@ -0,0 +1,247 @@
+#
+# Download manager class test file.
+#
+# @author Matthew Casey
+#
+# (c) Digital Content Analysis Technology Ltd 2022
+#
+
+from concurrent.futures import wait
+import json
+import os
+import pytest
+import requests
+import requests_mock
+import tempfile
+from threading import Event
+import uuid
+
+from tests.custom_test_case import CustomTestCase
+
+from fusion_platform.download_manager import DownloadManager
+from fusion_platform.models.data_file import DataFile, DataFileSchema
+from fusion_platform.models.model import Model
+from fusion_platform.session import RequestError, Session
+
+
+class TestDownloadManager(CustomTestCase):
+    """
+    Download manager tests.
+    """
+
+    def __data_file(self, session, organisation_id, file_id=None):
+        """
+        Creates a data file model from the fixture.
+
+        Args:
+            session: The session.
+            organisation_id: The organisation id.
+            file_id: The optional file id to use instead of the fixture's file id.
+
+        Returns:
+            The data file model and its download URL path.
+        """
+        with open(self.fixture_path('data_file.json'), 'r') as file:
+            data_file_content = json.loads(file.read())
+
+        if file_id is not None:
+            data_file_content['file_id'] = file_id
+
+        data_file = DataFile(session)
+        data_file._set_model_from_response(data_file_content, DataFileSchema(), organisation_id=organisation_id)
+        path = DataFile._PATH_DOWNLOAD_FILE.format(organisation_id=organisation_id, data_id=data_file.data_id, file_id=data_file.file_id)
+
+        return data_file, path
+
+    def test_init(self):
+        """
+        Test initialisation of the class to ensure no exceptions are raised.
+        """
+        session = Session()
+        self.assertEqual(Session.DOWNLOAD_MAX_WORKERS_DEFAULT, session.download_max_workers)
+        self.assertIsNotNone(session.download_manager)
+
+        download_manager = DownloadManager(session, 2)
+        statistics = download_manager.statistics()
+        self.assertEqual(0, statistics[DownloadManager.STATISTIC_FILES_QUEUED])
+        self.assertEqual(0, statistics[DownloadManager.STATISTIC_BYTES])
+        self.assertEqual(0, statistics[DownloadManager.STATISTIC_THROUGHPUT])
+
+    def test_submit(self):
+        """
+        Test that many files can be downloaded with bounded concurrency and aggregate statistics.
+        """
+        with open(self.fixture_path('download_file.json'), 'r') as file:
+            download_file_content = json.loads(file.read())
+
+        session = Session(options={Session.DOWNLOAD_MAX_WORKERS: 2})
+        organisation_id = uuid.uuid4()
+        url = download_file_content.get(Model._RESPONSE_KEY_URL)
+        data_files = [self.__data_file(session, organisation_id, file_id=str(uuid.uuid4())) for _ in range(5)]
+        size = data_files[0][0].size
+
+        with requests_mock.Mocker() as mock:
+            for _, path in data_files:
+                mock.get(f"{Session.API_URL_DEFAULT}{path}", text=json.dumps({Model._RESPONSE_KEY_EXTRAS: download_file_content}))
+
+            mock.get(url, content=b'c' * size)
+
+            with tempfile.TemporaryDirectory() as dir:
+                progress = {}
+                futures = [session.download_manager.submit(data_file, os.path.join(dir, f"{i}.bin"), priority=i,
+                                                           callback=lambda url, destination, size: progress.update({destination: size})) for
+                           i, (data_file, _) in enumerate(data_files)]
+                wait(futures)
+
+                for i, future in enumerate(futures):
+                    self.assertEqual(os.path.join(dir, f"{i}.bin"), future.result())
+                    self.assertEqual(size, os.path.getsize(future.result()))
+                    self.assertEqual(size, progress[future.result()])
+
+        statistics = session.download_manager.statistics()
+        self.assertEqual(0, statistics[DownloadManager.STATISTIC_FILES_QUEUED])
+        self.assertEqual(0, statistics[DownloadManager.STATISTIC_FILES_ACTIVE])
+        self.assertEqual(5, statistics[DownloadManager.STATISTIC_FILES_COMPLETED])
+        self.assertEqual(0, statistics[DownloadManager.STATISTIC_FILES_FAILED])
+        self.assertEqual(5 * size, statistics[DownloadManager.STATISTIC_BYTES])
+        self.assertGreater(statistics[DownloadManager.STATISTIC_ELAPSED], 0)
+        self.assertGreater(statistics[DownloadManager.STATISTIC_THROUGHPUT], 0)
+
+    def test_submit_cancel(self):
+        """
+        Test that cancelling queued downloads cancels each request's future.
+        """
+        with open(self.fixture_path('download_file.json'), 'r') as file:
+            download_file_content = json.loads(file.read())
+
+        session = Session()
+        download_manager = DownloadManager(session, 1)
+        organisation_id = uuid.uuid4()
+        data_file, path = self.__data_file(session, organisation_id)
+        blocker, blocker_path = self.__data_file(session, organisation_id, file_id=str(uuid.uuid4()))
+        started = Event()
+        release = Event()
+
+        def blocked(request, context):
+            started.set()
+            release.wait()
+            return json.dumps({Model._RESPONSE_KEY_EXTRAS: download_file_content})
+
+        with requests_mock.Mocker() as mock:
+            mock.get(f"{Session.API_URL_DEFAULT}{blocker_path}", text=blocked)
+            mock.get(download_file_content.get(Model._RESPONSE_KEY_URL), content=b'c' * data_file.size)
+
+            with tempfile.TemporaryDirectory() as dir:
+                blocker_future = download_manager.submit(blocker, os.path.join(dir, 'blocker.bin'))
+                started.wait()
+                first = download_manager.submit(data_file, os.path.join(dir, 'first.bin'), priority=1)
+                second = download_manager.submit(data_file, os.path.join(dir, 'second.bin'), priority=0)
+                download_manager.shutdown(cancel_futures=True)
+                release.set()
+
+                wait([blocker_future, first, second])
+                self.assertTrue(first.cancelled())
+                self.assertTrue(second.cancelled())
+                self.assertEqual(os.path.join(dir, 'blocker.bin'), blocker_future.result())
+
+        self.assertEqual(0, download_manager.statistics()[DownloadManager.STATISTIC_FILES_QUEUED])
+
+    def test_submit_deduplicate(self):
+        """
+        Test that the same file submitted while it is downloading is only downloaded once and copied to each path.
+        """
+        with open(self.fixture_path('download_file.json'), 'r') as file:
+            download_file_content = json.loads(file.read())
+
+        session = Session()
+        download_manager = DownloadManager(session, 1)
+        organisation_id = uuid.uuid4()
+        url = download_file_content.get(Model._RESPONSE_KEY_URL)
+        data_file, path = self.__data_file(session, organisation_id)
+        blocker, blocker_path = self.__data_file(session, organisation_id, file_id=str(uuid.uuid4()))
+        release = Event()
+
+        def blocked(request, context):
+            release.wait()
+            return json.dumps({Model._RESPONSE_KEY_EXTRAS: download_file_content})
+
+        with requests_mock.Mocker() as mock:
+            # The single worker is held by the blocking download so that the same file can be submitted more than once while it is queued.
+            mock.get(f"{Session.API_URL_DEFAULT}{blocker_path}", text=blocked)
+            mock.get(f"{Session.API_URL_DEFAULT}{path}", text=json.dumps({Model._RESPONSE_KEY_EXTRAS: download_file_content}))
+            adapter = mock.get(url, content=b'c' * data_file.size)
+
+            with tempfile.TemporaryDirectory() as dir:
+                blocker_future = download_manager.submit(blocker, os.path.join(dir, 'blocker.bin'))
+                first = download_manager.submit(data_file, os.path.join(dir, 'first.bin'))
+                second = download_manager.submit(data_file, os.path.join(dir, 'other', 'second.bin'))
+                self.assertIsNot(first, second)
+                release.set()
+
+                # Each request resolves to its own path, with any missing directories created for the copy.
+                wait([blocker_future, first, second])
+                self.assertEqual(os.path.join(dir, 'first.bin'), first.result())
+                self.assertEqual(os.path.join(dir, 'other', 'second.bin'), second.result())
+                self.assertEqual(data_file.size, os.path.getsize(second.result()))
+                self.assertEqual(2, adapter.call_count)
+
+        with requests_mock.Mocker() as mock:
+            mock.get(f"{Session.API_URL_DEFAULT}{path}", exc=requests.exceptions.ConnectTimeout)
+
+            with tempfile.TemporaryDirectory() as dir:
+                future = download_manager.submit(data_file, os.path.join(dir, 'file.bin'))
+
+                with pytest.raises(RequestError):
+                    future.result()
+
+        self.assertEqual(1, download_manager.statistics()[DownloadManager.STATISTIC_FILES_FAILED])
+
+    def test_submit_reprioritise(self):
+        """
+        Test that a queued download is moved forward when the same file is submitted again with a lower priority value.
+        """
+        with open(self.fixture_path('download_file.json'), 'r') as file:
+            download_file_content = json.loads(file.read())
+
+        session = Session()
+        download_manager = DownloadManager(session, 1)
+        organisation_id = uuid.uuid4()
+        url = download_file_content.get(Model._RESPONSE_KEY_URL)
+        blocker, blocker_path = self.__data_file(session, organisation_id, file_id=str(uuid.uuid4()))
+        early, early_path = self.__data_file(session, organisation_id, file_id=str(uuid.uuid4()))
+        late, late_path = self.__data_file(session, organisation_id, file_id=str(uuid.uuid4()))
+        started = Event()
+        release = Event()
+
+        def blocked(request, context):
+            started.set()
+            release.wait()
+            return json.dumps({Model._RESPONSE_KEY_EXTRAS: download_file_content})
+
+        with requests_mock.Mocker() as mock:
+            mock.get(f"{Session.API_URL_DEFAULT}{blocker_path}", text=blocked)
+            mock.get(f"{Session.API_URL_DEFAULT}{early_path}", text=json.dumps({Model._RESPONSE_KEY_EXTRAS: download_file_content}))
+            mock.get(f"{Session.API_URL_DEFAULT}{late_path}", text=json.dumps({Model._RESPONSE_KEY_EXTRAS: download_file_content}))
+            mock.get(url, content=b'c' * blocker.size)
+
+            with tempfile.TemporaryDirectory() as dir:
+                # The single worker is held by the blocking download while the other downloads are queued.
+                blocker_future = download_manager.submit(blocker, os.path.join(dir, 'blocker.bin'))
+                started.wait()
+                late_future = download_manager.submit(late, os.path.join(dir, 'late.bin'), priority=5)
+                early_future = download_manager.submit(early, os.path.join(dir, 'early.bin'), priority=3)
+                moved_future = download_manager.submit(late, os.path.join(dir, 'moved.bin'), priority=1)
+                release.set()
+
+                wait([blocker_future, late_future, early_future, moved_future])
+                self.assertEqual(os.path.join(dir, 'late.bin'), late_future.result())
+                self.assertEqual(os.path.join(dir, 'early.bin'), early_future.result())
+                self.assertEqual(os.path.join(dir, 'moved.bin'), moved_future.result())
+
+                # The re-prioritised download is run first and only once.
+                paths = [request.path for request in mock.request_history if request.path in [late_path.lower(), early_path.lower()]]
+                self.assertEqual([late_path.lower(), early_path.lower()], paths)
+
+        statistics = download_manager.statistics()
+        self.assertEqual(3, statistics[DownloadManager.STATISTIC_FILES_COMPLETED])
+        self.assertEqual(0, statistics[DownloadManager.STATISTIC_FILES_QUEUED])
@@ -80,6 +80,22 @@ class TestInit(CustomTestCase):
             user = fusion_platform.login(user_id=str(uuid.uuid4()), password='password')
             self.assertIsNotNone(user)
 
+    def test_profile(self):
+        """
+        Tests that profiling records the SDK calls until it is stopped.
+        """
+        request = Session.request
+        profiler = fusion_platform.profile()
+        self.assertIsNot(request, Session.request)
+
+        with requests_mock.Mocker() as mock:
+            mock.get(f"{Session.API_URL_DEFAULT}/path", text=json.dumps({}))
+            Session().request(path='/path')
+
+        profiler.stop()
+        self.assertIs(request, Session.request)
+        self.assertEqual(1, profiler.statistics()['Session.request'][profiler.STATISTIC_CALLS])
+
     def test_version(self):
         """
         Test getting the version.
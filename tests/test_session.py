@@ -6,18 +6,25 @@
 # (c) Digital Content Analysis Technology Ltd 2022
 #
 
+from concurrent.futures import ThreadPoolExecutor
 import json
 import jwt
+from mock import patch
 import os
 import pytest
+import re
 import requests
 import requests_mock
 import tempfile
+from threading import Event
 import uuid
 
 from tests.custom_test_case import CustomTestCase
 
-from fusion_platform.session import RequestError, Session, ValueError
+from fusion_platform.common.metrics import MetricsRegistry, TemplatedPath
+from fusion_platform.common.rate_limiter import RateLimiter
+from fusion_platform.common.tracing import InMemoryTracer, Tracer
+from fusion_platform.session import LoggedPayload, RequestError, RetryPolicy, Session, ValueError
 
 
 class TestSession(CustomTestCase):
@@ -60,6 +67,42 @@ class TestSession(CustomTestCase):
         session = Session(options={Session.API_UPDATE_WAIT_PERIOD: api_update_wait_period_default})
         self.assertEqual(api_update_wait_period_default, session.api_update_wait_period)
 
+        self.assertEqual(Session.UPLOAD_MAX_WORKERS_DEFAULT, session.upload_max_workers)
+        self.assertEqual(Session.UPLOAD_MAX_WORKERS_DEFAULT, session.upload_executor.max_workers)
+
+        session = Session(options={Session.UPLOAD_MAX_WORKERS: 2})
+        self.assertEqual(2, session.upload_executor.max_workers)
+
+    def test_init_transport(self):
+        """
+        Test that the pooled transport is configured from the session options.
+        """
+        session = Session()
+        self.assertEqual(Session.CONNECTION_POOL_SIZE_DEFAULT, session.connection_pool_size)
+        self.assertTrue(session.keep_alive)
+
+        adapter = session._Session__http.get_adapter(Session.API_URL_DEFAULT)
+        self.assertEqual(Session.CONNECTION_POOL_SIZE_DEFAULT, adapter._pool_maxsize)
+        self.assertEqual('keep-alive', session._Session__http.headers.get('Connection'))
+
+        session = Session(options={Session.CONNECTION_POOL_SIZE: 4, Session.KEEP_ALIVE: False})
+        self.assertEqual(4, session.connection_pool_size)
+        self.assertFalse(session.keep_alive)
+
+        adapter = session._Session__http.get_adapter(Session.API_URL_DEFAULT)
+        self.assertEqual(4, adapter._pool_maxsize)
+        self.assertEqual('close', session._Session__http.headers.get('Connection'))
+
+        path = '/path'
+        body = {'test': True}
+
+        with requests_mock.Mocker() as mock:
+            mock.get(f"{Session.API_URL_DEFAULT}{path}", text=json.dumps(body))
+            self.assertEqual(body, session.request(path=path))
+            self.assertEqual('close', mock.last_request.headers.get('Connection'))
+
+        session.close()
+
     def test_download_file(self):
         """
         Test that a file can be downloaded, checking that missing endpoints are handled correctly.
@@ -78,6 +121,296 @@ class TestSession(CustomTestCase):
             self.assertTrue(os.path.exists(destination))
             self.assertIsNotNone(self._download_size)
 
+    def test_download_file_segmented(self):
+        """
+        Test that a file can be downloaded in concurrent segments, falling back to a single stream when ranges are not supported.
+        """
+        url = 'https://download.com/test'
+        content = os.urandom(1000)
+
+        def range_callback(request, context):
+            match = re.match(r'bytes=(\d+)-(\d+)', request.headers.get('Range', ''))
+
+            if match is None:
+                return content
+
+            start, end = int(match.group(1)), int(match.group(2))
+            context.status_code = 206
+            context.headers['Content-Range'] = f"bytes {start}-{end}/{len(content)}"
+
+            return content[start:end + 1]
+
+        session = Session(options={Session.DOWNLOAD_SEGMENTS: 4, Session.DOWNLOAD_SEGMENT_SIZE_MINIMUM: 100})
+        self.assertEqual(4, session.download_segments)
+        self.assertEqual(100, session.download_segment_size_minimum)
+
+        with tempfile.TemporaryDirectory() as dir:
+            destination = os.path.join(dir, 'file.bin')
+            progress = []
+
+            with requests_mock.Mocker() as mock:
+                adapter = mock.get(url, content=range_callback)
+                session.download_file(url, destination, lambda url, destination, size: progress.append(size))
+                self.assertEqual(5, adapter.call_count)  # Probe plus four segments.
+
+                with open(destination, 'rb') as file:
+                    self.assertEqual(content, file.read())
+
+                self.assertFalse(os.path.exists(f"{destination}{Session.DOWNLOAD_EXTENSION}"))
+                self.assertEqual(len(content), max(progress))
+
+                # Files which are too small are downloaded as a single stream.
+                os.remove(destination)
+                session = Session(options={Session.DOWNLOAD_SEGMENTS: 4, Session.DOWNLOAD_SEGMENT_SIZE_MINIMUM: 10000})
+                session.download_file(url, destination)
+                self.assertEqual(7, adapter.call_count)  # Probe plus single stream.
+                self.assertIsNone(adapter.last_request.headers.get('Range'))
+
+                with open(destination, 'rb') as file:
+                    self.assertEqual(content, file.read())
+
+                # Servers which do not support ranges are downloaded as a single stream.
+                os.remove(destination)
+                mock.get(url, content=content)
+                session = Session(options={Session.DOWNLOAD_SEGMENTS: 4, Session.DOWNLOAD_SEGMENT_SIZE_MINIMUM: 100})
+                session.download_file(url, destination)
+
+                with open(destination, 'rb') as file:
+                    self.assertEqual(content, file.read())
+
+                # Segments which do not return the requested range fail, without leaving a partial file which could be resumed.
+                mock.get(url, [{'content': range_callback}, {'content': content}])
+
+                with pytest.raises(RequestError):
+                    session.download_file(url, destination)
+
+                self.assertFalse(os.path.exists(f"{destination}{Session.DOWNLOAD_EXTENSION}"))
+                self.assertFalse(os.path.exists(f"{destination}{Session.DOWNLOAD_EXTENSION}{Session._DOWNLOAD_SEGMENTED_EXTENSION}"))
+
+                # A segmented file left behind by a process which died is never resumed, and is instead downloaded again.
+                os.remove(destination)
+
+                with open(f"{destination}{Session.DOWNLOAD_EXTENSION}{Session._DOWNLOAD_SEGMENTED_EXTENSION}", 'wb') as file:
+                    file.truncate(len(content))
+
+                adapter = mock.get(url, content=range_callback)
+                session.download_file(url, destination, size=len(content))
+                self.assertEqual(5, adapter.call_count)
+
+                with open(destination, 'rb') as file:
+                    self.assertEqual(content, file.read())
+
+                self.assertFalse(os.path.exists(f"{destination}{Session.DOWNLOAD_EXTENSION}{Session._DOWNLOAD_SEGMENTED_EXTENSION}"))
+
+                # Failed segments are retried on their own using the retry policy.
+                failures = []
+
+                def failing_range_callback(request, context):
+                    if (len(failures) < 1) and request.headers.get('Range', '').startswith('bytes=500-'):
+                        failures.append(request.headers.get('Range'))
+                        context.status_code = 503
+                        return b''
+
+                    return range_callback(request, context)
+
+                session = Session(options={Session.DOWNLOAD_SEGMENTS: 4, Session.DOWNLOAD_SEGMENT_SIZE_MINIMUM: 100,
+                                           Session.RETRY_POLICY: RetryPolicy(attempts=2, wait_minimum=0, wait_maximum=0)})
+                adapter = mock.get(url, content=failing_range_callback)
+                session.download_file(url, destination, size=len(content))
+                self.assertEqual(['bytes=500-749'], failures)
+                self.assertEqual(6, adapter.call_count)  # Probe, four segments and one retried segment.
+
+                with open(destination, 'rb') as file:
+                    self.assertEqual(content, file.read())
+
+                # Segments which fail repeatedly fail the download without retrying it as a whole.
+                adapter = mock.get(url, [{'content': range_callback}] + [{'status_code': 503}] * 8)
+
+                with pytest.raises(RequestError):
+                    session.download_file(url, destination)
+
+                self.assertEqual(9, adapter.call_count)  # Probe, then two attempts for each of the four segments.
+
+    def test_download_file_resume(self):
+        """
+        Test that a partial download is resumed only if it has not changed, that expired URLs are refreshed and that the downloaded size is verified.
+        """
+        url = 'https://download.com/test'
+        refreshed_url = 'https://download.com/refreshed'
+        content = os.urandom(1000)
+        partial_size = 400
+        etag = '"1234"'
+
+        def range_callback(request, context):
+            context.headers['ETag'] = etag
+            match = re.match(r'bytes=(\d+)-(\d*)', request.headers.get('Range', ''))
+
+            if (match is None) or (request.headers.get('If-Range') != etag):
+                return content
+
+            start = int(match.group(1))
+
+            if start >= len(content):
+                context.status_code = 416
+                context.headers['Content-Range'] = f"bytes */{len(content)}"
+                return b''
+
+            context.status_code = 206
+            context.headers['Content-Range'] = f"bytes {start}-{len(content) - 1}/{len(content)}"
+
+            return content[start:]
+
+        session = Session()
+        self.assertTrue(session.download_resume)
+        self.assertEqual(Session.DOWNLOAD_URL_REFRESHES_DEFAULT, session.download_url_refreshes)
+
+        with tempfile.TemporaryDirectory() as dir:
+            destination = os.path.join(dir, 'file.bin')
+            temporary_destination = f"{destination}{Session.DOWNLOAD_EXTENSION}"
+            validator_destination = f"{temporary_destination}{Session._DOWNLOAD_VALIDATOR_EXTENSION}"
+            progress = []
+
+            def write_partial(partial, validator):
+                with open(temporary_destination, 'wb') as file:
+                    file.write(partial)
+
+                if validator is not None:
+                    with open(validator_destination, 'w') as file:
+                        file.write(validator)
+
+            with requests_mock.Mocker() as mock:
+                # Resume from a partial download.
+                adapter = mock.get(url, content=range_callback)
+                write_partial(content[:partial_size], etag)
+
+                session.download_file(url, destination, lambda url, destination, size: progress.append(size), size=len(content))
+                self.assertEqual(f"bytes={partial_size}-", adapter.last_request.headers.get('Range'))
+                self.assertEqual(etag, adapter.last_request.headers.get('If-Range'))
+                self.assertEqual(len(content), progress[-1])
+                self.assertFalse(os.path.exists(temporary_destination))
+                self.assertFalse(os.path.exists(validator_destination))
+
+                with open(destination, 'rb') as file:
+                    self.assertEqual(content, file.read())
+
+                # A partial download without a validator is not resumed.
+                write_partial(b'x' * partial_size, None)
+                session.download_file(url, destination, size=len(content))
+                self.assertIsNone(adapter.last_request.headers.get('Range'))
+
+                with open(destination, 'rb') as file:
+                    self.assertEqual(content, file.read())
+
+                # A partial download of a file which has since changed is restarted.
+                write_partial(b'x' * partial_size, '"5678"')
+                session.download_file(url, destination, size=len(content))
+                self.assertEqual('"5678"', adapter.last_request.headers.get('If-Range'))
+
+                with open(destination, 'rb') as file:
+                    self.assertEqual(content, file.read())
+
+                # A partial download which is already complete.
+                write_partial(content, etag)
+                session.download_file(url, destination, size=len(content))
+
+                with open(destination, 'rb') as file:
+                    self.assertEqual(content, file.read())
+
+                # A server which ignores the range restarts the download.
+                mock.get(url, content=content)
+                write_partial(b'x' * partial_size, etag)
+                session.download_file(url, destination, size=len(content))
+
+                with open(destination, 'rb') as file:
+                    self.assertEqual(content, file.read())
+
+                # Transient errors are retried, continuing from whatever has been downloaded so far.
+                adapter = mock.get(url, [{'status_code': 503}, {'content': range_callback}])
+                session.download_file(url, destination, size=len(content))
+                self.assertEqual(2, adapter.call_count)
+
+                with open(destination, 'rb') as file:
+                    self.assertEqual(content, file.read())
+
+                # Resuming can be disabled.
+                with open(temporary_destination, 'wb') as file:
+                    file.write(content[:partial_size])
+
+                Session(options={Session.DOWNLOAD_RESUME: False}).download_file(url, destination)
+                self.assertIsNone(mock.last_request.headers.get('Range'))
+
+                # An expired URL is refreshed and the download continues.
+                mock.get(url, status_code=403)
+                refresh_adapter = mock.get(refreshed_url, content=range_callback)
+
+                with pytest.raises(RequestError):
+                    session.download_file(url, destination)
+
+                session.download_file(url, destination, size=len(content), refresh_url=lambda: refreshed_url)
+                self.assertEqual(1, refresh_adapter.call_count)
+
+                with open(destination, 'rb') as file:
+                    self.assertEqual(content, file.read())
+
+                refreshes = []
+
+                with pytest.raises(RequestError):
+                    session.download_file(url, destination, refresh_url=lambda: refreshes.append(url) or url)
+
+                self.assertEqual(Session.DOWNLOAD_URL_REFRESHES_DEFAULT, len(refreshes))
+
+                # The downloaded size is verified. Too small is kept for resuming together with its validator, while too large is removed.
+                mock.get(url, content=content[:partial_size], headers={'ETag': etag})
+
+                with pytest.raises(RequestError):
+                    session.download_file(url, destination, size=len(content))
+
+                self.assertTrue(os.path.exists(temporary_destination))
+
+                with open(validator_destination, 'r') as file:
+                    self.assertEqual(etag, file.read())
+
+                os.remove(temporary_destination)
+
+                mock.get(url, content=content)
+
+                with pytest.raises(RequestError):
+                    session.download_file(url, destination, size=partial_size)
+
+                self.assertFalse(os.path.exists(temporary_destination))
+                self.assertFalse(os.path.exists(validator_destination))
+
+    def test_logged_payload(self):
+        """
+        Test that payloads are masked, truncated and summarised for logging, and that the session options select how they are logged.
+        """
+        payload = {'User': {'email': 'test@test.com', 'password': 'password'}, 'items': [1, 2, 3]}
+
+        self.assertEqual(str({'User': {'email': 'test@test.com', 'password': '*****'}, 'items': [1, 2, 3]}), str(LoggedPayload(payload)))
+        self.assertEqual('None', str(LoggedPayload(None)))
+
+        logged = str(LoggedPayload(payload, maximum_length=10))
+        self.assertTrue(logged.startswith(str(LoggedPayload(payload))[:10]))
+        self.assertTrue(logged.endswith(f"... ({len(str(LoggedPayload(payload)))} characters)"))
+
+        self.assertEqual('<dict: 2 keys, items: 3 items, 100 bytes>', str(LoggedPayload(payload, size=100, summarise=True)))
+        self.assertEqual('<list: 3 items>', str(LoggedPayload([1, 2, 3], summarise=True)))
+        self.assertEqual('<NoneType>', str(LoggedPayload(None, summarise=True)))
+
+        session = Session()
+        self.assertEqual(Session.LOG_PAYLOADS_FULL, session.log_payloads)
+        self.assertIsNone(session.log_payload_length)
+
+        session = Session(options={Session.LOG_PAYLOADS: Session.LOG_PAYLOADS_SUMMARY, Session.LOG_PAYLOAD_LENGTH: 10})
+        self.assertEqual(Session.LOG_PAYLOADS_SUMMARY, session.log_payloads)
+        self.assertEqual(10, session.log_payload_length)
+
+        path = '/path'
+
+        with requests_mock.Mocker() as mock:
+            mock.post(f"{Session.API_URL_DEFAULT}{path}", text=json.dumps(payload))
+            self.assertEqual(payload, session.request(path=path, method=Session.METHOD_POST, body=payload))
+
     def test_login(self):
         """
         Test login using various parameters.
@@ -189,6 +522,343 @@ class TestSession(CustomTestCase):
             self.assertIsNotNone(response)
             self.assertEqual(body, response)
 
+            # The length of the response body can also be returned.
+            self.assertEqual((body, len(json.dumps(body))), session.request(path=path, query_parameters=query_parameters, include_length=True))
+
+            session = Session(options={Session.COALESCE_REQUESTS: False})
+            self.assertEqual((body, len(json.dumps(body))), session.request(path=path, query_parameters=query_parameters, include_length=True))
+
+    def test_request_get_cached(self):
+        """
+        Test that get requests are made conditional on cached responses.
+        """
+        path = '/path'
+        query_parameters = {'name': 'Joe', 'value': 1}
+        body = {'test': True}
+        last_modified = 'Wed, 21 Oct 2015 07:28:00 GMT'
+
+        session = Session()
+        self.assertEqual(Session.RESPONSE_CACHE_SIZE_DEFAULT, session.response_cache_size)
+
+        with requests_mock.Mocker() as mock:
+            # Without a cache, no conditional headers are sent.
+            adapter = mock.get(f"{Session.API_URL_DEFAULT}{path}", text=json.dumps(body), headers={'ETag': '"1"'})
+            session.request(path=path, query_parameters=query_parameters)
+            session.request(path=path, query_parameters=query_parameters)
+            self.assertNotIn('If-None-Match', adapter.last_request.headers)
+
+            session = Session(options={Session.RESPONSE_CACHE_SIZE: 1})
+            first = session.request(path=path, query_parameters=query_parameters)
+            self.assertNotIn('If-None-Match', adapter.last_request.headers)
+
+            adapter = mock.get(f"{Session.API_URL_DEFAULT}{path}", status_code=304)
+            second = session.request(path=path, query_parameters=query_parameters)
+            self.assertEqual('"1"', adapter.last_request.headers.get('If-None-Match'))
+            self.assertIs(first, second)
+
+            # The length of a response which has not been modified is that of the cached response.
+            self.assertEqual((first, len(json.dumps(body))), session.request(path=path, query_parameters=query_parameters, include_length=True))
+
+            # A modified response replaces the cached response.
+            adapter = mock.get(f"{Session.API_URL_DEFAULT}{path}", text=json.dumps({'test': False}), headers={'Last-Modified': last_modified})
+            self.assertEqual({'test': False}, session.request(path=path, query_parameters=query_parameters))
+            self.assertEqual('"1"', adapter.last_request.headers.get('If-None-Match'))
+
+            adapter = mock.get(f"{Session.API_URL_DEFAULT}{path}", status_code=304)
+            self.assertEqual({'test': False}, session.request(path=path, query_parameters=query_parameters))
+            self.assertEqual(last_modified, adapter.last_request.headers.get('If-Modified-Since'))
+            self.assertNotIn('If-None-Match', adapter.last_request.headers)
+
+            # The least recently used response is removed when the cache is full.
+            adapter = mock.get(f"{Session.API_URL_DEFAULT}{path}", text=json.dumps(body), headers={'ETag': '"2"'})
+            session.request(path=path, query_parameters={'name': 'Jane'})
+            session.request(path=path, query_parameters=query_parameters)
+            self.assertNotIn('If-Modified-Since', adapter.last_request.headers)
+            self.assertNotIn('If-None-Match', adapter.last_request.headers)
+
+    def test_request_get_coalesced(self):
+        """
+        Test that identical concurrent get requests are coalesced into a single request.
+        """
+        path = '/path'
+        body = {'test': [1, 2, 3]}
+        count = 5
+        release = Event()
+        self.addCleanup(release.set)  # Make sure the blocked request is always released.
+
+        def blocked(request, context):
+            release.wait()
+            return json.dumps(body)
+
+        session = Session()
+        self.assertEqual(Session.COALESCE_REQUESTS_DEFAULT, session.coalesce_requests)
+
+        with requests_mock.Mocker() as mock:
+            adapter = mock.get(f"{Session.API_URL_DEFAULT}{path}", text=blocked)
+
+            with ThreadPoolExecutor(max_workers=count) as executor:
+                futures = [executor.submit(session.request, path=path) for _ in range(count)]
+
+                # Wait for all the followers to join the leader before releasing the response.
+                for _ in range(100):
+                    in_flight = list(session._Session__in_flight.values())
+
+                    if (len(in_flight) > 0) and (in_flight[0][1] >= count - 1):
+                        break
+
+                    Event().wait(0.05)
+
+                release.set()
+                responses = [future.result() for future in futures]
+
+            self.assertEqual(1, adapter.call_count)
+            self.assertEqual([body] * count, responses)
+            self.assertEqual(count, len(set(id(response) for response in responses)))  # Each caller has its own copy.
+
+            # Errors are given to every caller, and requests are not coalesced once they have completed.
+            mock.get(f"{Session.API_URL_DEFAULT}{path}", status_code=400)
+
+            with pytest.raises(RequestError):
+                session.request(path=path)
+
+            self.assertEqual(0, len(session._Session__in_flight))
+
+            # Requests are not coalesced when disabled.
+            adapter = mock.get(f"{Session.API_URL_DEFAULT}{path}", text=json.dumps(body))
+            session = Session(options={Session.COALESCE_REQUESTS: False})
+
+            with ThreadPoolExecutor(max_workers=count) as executor:
+                list(executor.map(lambda _: session.request(path=path), range(count)))
+
+            self.assertEqual(count, adapter.call_count)
+
+    def test_request_get_coalesced_cancelled(self):
+        """
+        Test that a cancellable get request does not fail an identical concurrent request which has not been cancelled.
+        """
+        path = '/path'
+        body = {'test': True}
+        failed = Event()
+        calls = []
+
+        def respond(request, context):
+            calls.append(request)
+
+            # The first request fails, and so waits before it is retried, while any other request succeeds.
+            if len(calls) == 1:
+                failed.set()
+                raise requests.exceptions.ConnectTimeout
+
+            return json.dumps(body)
+
+        session = Session(options={Session.RETRY_POLICY: RetryPolicy(attempts=10, wait_minimum=10, wait_maximum=10)})
+        cancelled = Event()
+        self.addCleanup(cancelled.set)  # Make sure the waiting request is always stopped.
+
+        def cancellable_request():
+            with session.cancellable(cancelled):
+                return session.request(path=path)
+
+        with requests_mock.Mocker() as mock:
+            adapter = mock.get(f"{Session.API_URL_DEFAULT}{path}", text=respond)
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                cancellable = executor.submit(cancellable_request)
+                self.assertTrue(failed.wait(5))
+
+                # The request which has not been cancelled is sent separately, rather than waiting for the request which will be cancelled.
+                other = executor.submit(session.request, path=path)
+                self.assertEqual(body, other.result(5))
+
+                cancelled.set()
+
+                with pytest.raises(RequestError):
+                    cancellable.result(5)
+
+            self.assertEqual(2, adapter.call_count)
+            self.assertEqual(0, len(session._Session__in_flight))
+
+    def test_request_rate_limited(self):
+        """
+        Test that requests use the rate limiter and that throttled requests are retried.
+        """
+        path = '/path'
+        body = {'test': True}
+
+        session = Session()
+        self.assertIsNone(session.rate_limiter)
+
+        session = Session(options={Session.RATE_LIMIT: 1000, Session.CONCURRENCY_LIMIT: 4})
+        self.assertIsInstance(session.rate_limiter, RateLimiter)
+        self.assertEqual(4, session.rate_limiter.window)
+
+        with requests_mock.Mocker() as mock:
+            adapter = mock.get(f"{Session.API_URL_DEFAULT}{path}", [{'status_code': 429}, {'status_code': 503}, {'text': json.dumps(body)}])
+            self.assertEqual(body, session.request(path=path))
+            self.assertEqual(3, adapter.call_count)
+            self.assertEqual(2, session.rate_limiter.window)  # Halved twice, then increased.
+
+            with pytest.raises(RequestError):
+                mock.get(f"{Session.API_URL_DEFAULT}{path}", status_code=400)
+                session.request(path=path)
+
+        rate_limiter = RateLimiter()
+        session = Session(options={Session.RATE_LIMIT: 1000, Session.RATE_LIMITER: rate_limiter})
+        self.assertIs(rate_limiter, session.rate_limiter)
+
+    def test_request_retried(self):
+        """
+        Test that transient errors are retried according to the retry policy, honouring any Retry-After header.
+        """
+        path = '/path'
+        body = {'test': True}
+
+        session = Session()
+        self.assertIsInstance(session.retry_policy, RetryPolicy)
+
+        with requests_mock.Mocker() as mock:
+            adapter = mock.get(f"{Session.API_URL_DEFAULT}{path}", [{'status_code': 502}, {'status_code': 504}, {'text': json.dumps(body)}])
+            self.assertEqual(body, session.request(path=path))
+            self.assertEqual(3, adapter.call_count)
+
+            with patch('time.sleep') as sleep:
+                adapter = mock.get(f"{Session.API_URL_DEFAULT}{path}", [{'status_code': 503, 'headers': {'Retry-After': '7'}}, {'text': json.dumps(body)}])
+                self.assertEqual(body, session.request(path=path))
+                self.assertEqual(2, adapter.call_count)
+                sleep.assert_called_once_with(7.0)
+
+            # Non-idempotent methods are only retried if they were refused.
+            adapter = mock.post(f"{Session.API_URL_DEFAULT}{path}", status_code=503)
+
+            with pytest.raises(RequestError):
+                session.request(path=path, method=Session.METHOD_POST)
+
+            self.assertEqual(1, adapter.call_count)
+
+            adapter = mock.post(f"{Session.API_URL_DEFAULT}{path}", [{'status_code': 429}, {'text': json.dumps(body)}])
+            self.assertEqual(body, session.request(path=path, method=Session.METHOD_POST))
+            self.assertEqual(2, adapter.call_count)
+
+            # The number of attempts is configurable.
+            session = Session(options={Session.RETRY_POLICY: RetryPolicy(attempts=2)})
+            adapter = mock.get(f"{Session.API_URL_DEFAULT}{path}", status_code=500)
+
+            with pytest.raises(RequestError):
+                session.request(path=path)
+
+            self.assertEqual(2, adapter.call_count)
+
+    def test_retry_policy(self):
+        """
+        Test the classification of retryable requests and the parsing of Retry-After headers.
+        """
+        policy = RetryPolicy()
+
+        self.assertTrue(policy.is_retryable(Session.METHOD_GET, status_code=503))
+        self.assertFalse(policy.is_retryable(Session.METHOD_GET, status_code=400))
+        self.assertFalse(policy.is_retryable(Session.METHOD_POST, status_code=503))
+        self.assertTrue(policy.is_retryable(Session.METHOD_POST, status_code=429))
+        self.assertTrue(policy.is_retryable(Session.METHOD_POST, exception=requests.exceptions.ConnectTimeout()))
+        self.assertFalse(policy.is_retryable(Session.METHOD_POST, exception=requests.exceptions.ReadTimeout()))
+        self.assertTrue(policy.is_retryable(Session.METHOD_PUT, exception=requests.exceptions.ReadTimeout()))
+        self.assertFalse(policy.is_retryable(Session.METHOD_GET, exception=ValueError()))
+
+        policy = RetryPolicy(status_codes=[500], methods=[Session.METHOD_POST])
+        self.assertTrue(policy.is_retryable(Session.METHOD_POST, status_code=500))
+        self.assertFalse(policy.is_retryable(Session.METHOD_GET, status_code=500))
+        self.assertFalse(policy.is_retryable(Session.METHOD_POST, status_code=429))
+
+        response = requests.Response()
+        self.assertIsNone(RetryPolicy.retry_after(response))
+
+        response.headers['Retry-After'] = '12'
+        self.assertEqual(12.0, RetryPolicy.retry_after(response))
+
+        response.headers['Retry-After'] = 'Wed, 21 Oct 2015 07:28:00 GMT'
+        self.assertEqual(0.0, RetryPolicy.retry_after(response))  # In the past.
+
+        response.headers['Retry-After'] = 'invalid'
+        self.assertIsNone(RetryPolicy.retry_after(response))
+
+    def test_request_metrics(self):
+        """
+        Test that request, upload and download metrics are recorded against the path template.
+        """
+        template = '/organisations/{organisation_id}'
+        path = TemplatedPath(template.format(organisation_id=str(uuid.uuid4())), template)
+        body = {'test': True}
+
+        self.assertIsNone(Session(options={Session.METRICS: False}).metrics)
+
+        registry = MetricsRegistry()
+        session = Session(options={Session.METRICS_REGISTRY: registry})
+        self.assertIs(registry, session.metrics)
+
+        session = Session()
+        self.assertIsInstance(session.metrics, MetricsRegistry)
+        labels = (('method', Session.METHOD_GET), ('template', template))
+
+        with requests_mock.Mocker() as mock:
+            mock.get(f"{Session.API_URL_DEFAULT}{path}", [{'status_code': 503}, {'text': json.dumps(body)}])
+            self.assertEqual(body, session.request(path=path))
+
+            with tempfile.TemporaryDirectory() as dir:
+                source = self.fixture_path('user.json')
+                mock.put('https://upload.com/test', status_code=200)
+                session.upload_file('https://upload.com/test', source)
+
+                mock.get('https://download.com/test', content=b'content')
+                session.download_file('https://download.com/test', os.path.join(dir, 'file.bin'))
+
+        snapshot = session.metrics.snapshot()
+        counters = snapshot['counters']
+        self.assertEqual(1, counters['requests_total'][tuple(sorted(dict(labels, status='503').items()))])
+        self.assertEqual(1, counters['requests_total'][tuple(sorted(dict(labels, status='200').items()))])
+        self.assertEqual(1, counters['request_retries_total'][labels])
+        self.assertEqual(len(json.dumps(body)), counters['request_received_bytes_total'][labels])
+        self.assertEqual(2, snapshot['histograms']['request_duration_seconds'][labels]['count'])
+        self.assertEqual(2, snapshot['histograms']['request_time_to_first_byte_seconds'][labels]['count'])
+
+        self.assertEqual(1, counters['uploads_total'][(('status', 'success'),)])
+        self.assertEqual(os.path.getsize(self.fixture_path('user.json')), counters['upload_bytes_total'][()])
+        self.assertEqual(1, counters['downloads_total'][(('status', 'success'),)])
+        self.assertEqual(len(b'content'), counters['download_bytes_total'][()])
+
+        self.assertIn(f'fusion_platform_requests_total{{method="GET",status="200",template="{template}"}} 1', session.metrics.to_prometheus())
+
+    def test_request_traced(self):
+        """
+        Test that requests, uploads and downloads are traced, including on the session's worker threads.
+        """
+        path = '/path'
+        body = {'test': True}
+
+        self.assertIsInstance(Session().tracer, Tracer)
+
+        tracer = InMemoryTracer()
+        session = Session(options={Session.TRACER: tracer})
+        self.assertIs(tracer, session.tracer)
+
+        with requests_mock.Mocker() as mock:
+            mock.get(f"{Session.API_URL_DEFAULT}{path}", [{'status_code': 503}, {'text': json.dumps(body)}])
+            mock.put('https://upload.com/test', status_code=200)
+            mock.get('https://download.com/test', content=b'content')
+
+            with tempfile.TemporaryDirectory() as dir:
+                with tracer.start_as_current_span('parent') as parent:
+                    self.assertEqual(body, session.request(path=path))
+                    session.upload_executor.submit(session.upload_file, 'https://upload.com/test', self.fixture_path('user.json')).result()
+                    session.download_file('https://download.com/test', os.path.join(dir, 'file.bin'))
+
+        spans = {span.name: span for span in tracer.spans}
+        self.assertEqual(Session.METHOD_GET, spans['Session.request'].attributes['http.method'])
+        self.assertEqual(2, spans['Session.request'].attributes['fusion_platform.attempts'])
+        self.assertEqual(os.path.getsize(self.fixture_path('user.json')), spans['Session.upload_file'].attributes['fusion_platform.bytes'])
+        self.assertEqual(len(b'content'), spans['Session.download_file'].attributes['fusion_platform.bytes'])
+
+        for name in ['Session.request', 'Session.upload_file', 'Session.download_file']:
+            self.assertIs(parent, spans[name].parent)
+
     def test_request_patch(self):
         """
         Test a patch request and error handling.
@@ -308,6 +978,11 @@ class TestSession(CustomTestCase):
             session.upload_file(url, source)
             self.assertIsNotNone(adapter.last_request.text)
 
+            # Transient errors are retried.
+            adapter = mock.put(url, [{'status_code': 503}, {'status_code': 200}])
+            session.upload_file(url, source)
+            self.assertEqual(2, adapter.call_count)
+
             def callback(url, source, upload_size):
                 pass
 